@@ -1,7 +1,38 @@
 from nearai.agents.environment import Environment
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
+from array import array
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+import asyncio
+import bisect
+import csv
+import difflib
+import hashlib
+import heapq
+import io
+import json
+import math
+import mmap
+import multiprocessing
+import os
+import queue
 import re
+import sqlite3
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy-backed features (semantic cache, cohort analytics) are disabled without it
+    np = None
 
 STUDENT_ACTIVITY_TYPES = [
     "hackathon",
@@ -169,6 +200,16 @@ What would you like to post about? Here are some popular options:
 5. 🏆 Competition results
 
 Choose a topic, and I'll guide you through crafting a compelling post!"""
+    },
+    "network_start": {
+        "message": """Great! Let's grow your technical network strategically, one step at a time.
+
+To suggest the right people and communities, tell me:
+1. Your technical focus (e.g., Backend, ML/AI, Frontend)
+2. The languages and frameworks you work with most
+3. Your goal right now (e.g., internship search, mentorship, learning a new stack)
+
+Once I know your focus, I'll suggest who to connect with first and help you write the message!"""
     },
     "section_transitions": {
         "headline_to_about": """Great! Your headline looks professional. Now, let's work on your 'About' section.
@@ -226,6 +267,12 @@ NETWORK_TARGETS = {
     }
 }
 
+CONNECTION_MESSAGE_TEMPLATES = {
+    "recruiter": "Hi {name}, I'm a CS student focusing on {specialization}. I'm interested in {company}'s opportunities and would love to connect.",
+    "senior": "Hi {name}, I'm a CS student building projects with {technology}. Your work at {company} is inspiring, and I'd appreciate connecting to learn from your journey.",
+    "peer": "Hi {name}, I'm a CS student interested in {interest}. I noticed you work with similar technologies at {company}. Would love to connect and learn from your experience!"
+}
+
 TECHNICAL_CONTEXT = {
     "project_types": {
         "optimization": {
@@ -325,8 +372,332 @@ SKILL_PROGRESSION = {
     }
 }
 
+SYSTEM_PROMPT_MODULES = {
+    "core": """You are a LinkedIn profile strategist who specializes in helping computer science students transition into software engineering roles. You understand both the technical and career aspects of software development, and know how to present technical achievements to catch recruiters' attention.""",
+    "networking": """KEY OBJECTIVES:
+- Guide natural networking progression for CS students
+- Focus on individual's technical strengths and interests
+- Build meaningful professional relationships in their chosen domain
+- Maintain relevance to their specific tech stack and goals
+
+NETWORKING GUIDANCE:
+Guide users through networking phases naturally, focusing on one clear action at a time:
+
+Phase 1 - Foundation
+- Understand student's specific technical focus (languages, frameworks, domains)
+- Use NETWORK_TARGETS to suggest relevant communities based on their interests
+- Craft personalized connections using generate_connection_message() with their tech context
+- Build on their unique technical experience and projects
+
+Phase 2 - Engagement
+- Use suggest_engagement_plan() for focused growth in their domain
+- Keep technical context specific to their stack (e.g., backend scaling, ML models, frontend frameworks)
+- Build on their demonstrated interests and strengths
+- Guide meaningful interactions in their chosen field
+
+Phase 3 - Growth
+- Focus on value-add opportunities in their technical domain
+- Guide collaborative engagement based on their expertise
+- Expand network naturally through shared technical interests
+- Maintain relevance to their career goals""",
+    "profile": """PROFILE GUIDANCE:
+Build the profile one section at a time using PROFILE_SECTIONS:
+- Headline: role, specialization and key technology in one line
+- About: technical journey, key skills, current work and career goals
+- Experience: role, company, duration, responsibilities, tech stack and measurable impact
+- Education: institution, degree, field and graduation date
+- Ask only for the essential fields that are still missing before drafting a section""",
+    "post": """POST GUIDANCE:
+Help the student write one LinkedIn post about a specific activity:
+- Identify the activity (hackathon, project, internship, conference, workshop, course, competition)
+- Ask for the essential details first: project name, tech stack, problem solved and results
+- Match the requested tone from TONE_STYLES
+- Open with a hook, highlight technical details and learnings, then links and at most 5 hashtags""",
+    "principles": """RESPONSE PRINCIPLES:
+1. Focus
+- ONE clear next step based on their technical context
+- Build on their specific experiences and interests
+- Keep aligned with their tech stack
+- Show natural progression in their domain
+
+2. Value
+- Technical relevance to their chosen field
+- Clear benefits for their career path
+- Immediate actionability in their context
+- Professional growth in their area
+
+3. Guidance
+- Natural conversation about their interests
+- Specific suggestions for their domain
+- Clear direction based on their goals
+- Simple choices aligned with their path""",
+    "networking_data": """4. Data Usage
+- Use NETWORK_TARGETS for suggestions matching their interests
+- Generate personalized messages referencing their specific tech experience
+- Create structured plans relevant to their domain
+- Keep technical focus aligned with their goals""",
+    "domains": """TECHNICAL DOMAINS:
+Consider various paths including:
+- Backend Development (distributed systems, APIs, databases)
+- Frontend Development (web frameworks, UX, performance)
+- Full Stack Development
+- Machine Learning/AI
+- Mobile Development
+- DevOps/Infrastructure
+- Security Engineering
+- Game Development
+- Embedded Systems""",
+    "avoid": """AVOID:
+- Multiple actions at once
+- Generic networking advice
+- Losing sight of their specific technical context
+- Overwhelming options
+- Assuming one technology stack fits all""",
+    "networking_closing": """Remember: Guide each student through natural networking progression while maintaining focus on their specific technical interests and career goals. Use data structures to provide relevant suggestions while keeping conversation natural and focused on their chosen path."""
+}
+
+# Which prompt modules and catalogs are assembled for each conversation intent. The modules keep the
+# original prompt's wording, and listing them in table order reproduces it (plus the profile and post guidance).
+INTENT_PROMPT_MODULES = {
+    "profile_start": {
+        "modules": ["core", "profile", "principles", "domains", "avoid"],
+        "catalogs": ["PROFILE_SECTIONS"]
+    },
+    "post_start": {
+        "modules": ["core", "post", "principles", "avoid"],
+        "catalogs": ["TONE_STYLES"]
+    },
+    "network_start": {
+        "modules": ["core", "networking", "principles", "networking_data", "domains", "avoid", "networking_closing"],
+        "catalogs": ["NETWORK_TARGETS"]
+    },
+    None: {
+        "modules": list(SYSTEM_PROMPT_MODULES),
+        "catalogs": ["NETWORK_TARGETS", "PROFILE_SECTIONS", "TONE_STYLES"]
+    }
+}
+
+# Compact on-disk skill taxonomy (see SkillTaxonomy.build for the layout)
+TAXONOMY_MAGIC = b"LBTAX\0\0\0"
+TAXONOMY_VERSION = 1
+_TAXONOMY_HEADER = struct.Struct("<8sIIIII4x")   # magic, version, skills, categories, aliases, max words
+_TAXONOMY_ALIAS = struct.Struct("<II")           # alias string offset, skill id
+_TAXONOMY_SKILL = struct.Struct("<II")           # name string offset, category id
+_SKILL_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#]*(?:[./-][A-Za-z0-9+#]+)*")
+_TAXONOMY_MAX_WORDS = 4
+
+def _taxonomy_key(text: str) -> str:
+    """Normalize a skill or alias the same way text is tokenized for matching"""
+    return " ".join(_SKILL_TOKEN_PATTERN.findall(text.lower()))
+
+def _taxonomy_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+
+def iter_taxonomy_entries(path: str) -> Iterator[Tuple[str, List[str], str]]:
+    """Stream (skill, aliases, category) rows from a CSV or JSONL taxonomy file"""
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    aliases = row.get("aliases") or []
+                    if isinstance(aliases, str):
+                        aliases = re.split(r"[|;]", aliases)
+                    yield row["skill"], aliases, row.get("category") or "other"
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                aliases = re.split(r"[|;]", row.get("aliases") or "")
+                yield row["skill"], aliases, row.get("category") or "other"
+
+class SkillTaxonomy:
+    """Memory-mapped skill taxonomy with alias lookup and multi-word matching
+    
+    File layout: header, alias hashes (sorted uint64 column), alias records,
+    skill records, category name offsets, then a blob of length-prefixed strings.
+    Mapping the file read-only lets worker processes share its pages.
+    """
+    
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, skills, categories, aliases, max_words = _TAXONOMY_HEADER.unpack_from(self._mmap, 0)
+        if magic != TAXONOMY_MAGIC or version != TAXONOMY_VERSION:
+            raise ValueError(f"{path} is not a version {TAXONOMY_VERSION} skill taxonomy index")
+        self.path = path
+        self.skill_count = skills
+        self.max_words = max_words
+        view = memoryview(self._mmap)
+        offset = _TAXONOMY_HEADER.size
+        self._hashes = view[offset:offset + 8 * aliases].cast("Q")
+        offset += 8 * aliases
+        self._alias_offset = offset
+        offset += _TAXONOMY_ALIAS.size * aliases
+        self._skill_offset = offset
+        offset += _TAXONOMY_SKILL.size * skills
+        self._category_offsets = view[offset:offset + 4 * categories].cast("I")
+        self._strings_offset = offset + 4 * categories
+    
+    @classmethod
+    def build(cls, source_path: str, index_path: str) -> "SkillTaxonomy":
+        """Convert a CSV/JSONL taxonomy into the binary index and open it"""
+        strings = bytearray()
+        string_offsets = {}
+        
+        def intern(text: str) -> int:
+            if text not in string_offsets:
+                encoded = text.encode()
+                string_offsets[text] = len(strings)
+                strings.extend(struct.pack("<H", len(encoded)) + encoded)
+            return string_offsets[text]
+        
+        skills, category_ids, alias_records = [], {}, {}
+        max_words = 1
+        for skill, aliases, category in iter_taxonomy_entries(source_path):
+            skill = skill.strip()
+            if not skill:
+                continue
+            category_id = category_ids.setdefault(category.strip(), len(category_ids))
+            skill_id = len(skills)
+            skills.append((intern(skill), category_id))
+            for alias in [skill] + list(aliases):
+                key = _taxonomy_key(alias)
+                words = key.count(" ") + 1
+                if key and words <= _TAXONOMY_MAX_WORDS and _taxonomy_hash(key) not in alias_records:
+                    alias_records[_taxonomy_hash(key)] = (intern(key), skill_id)
+                    max_words = max(max_words, words)
+        
+        hashes = sorted(alias_records)
+        # A private temp file per build, so workers building the same index at once never share one
+        directory = os.path.dirname(os.path.abspath(index_path))
+        f = tempfile.NamedTemporaryFile("wb", dir=directory, prefix=os.path.basename(index_path) + ".",
+                                        suffix=".tmp", delete=False)
+        try:
+            with f:
+                f.write(_TAXONOMY_HEADER.pack(TAXONOMY_MAGIC, TAXONOMY_VERSION, len(skills),
+                                              len(category_ids), len(hashes), max_words))
+                f.write(array("Q", hashes).tobytes())
+                for alias_hash in hashes:
+                    f.write(_TAXONOMY_ALIAS.pack(*alias_records[alias_hash]))
+                for name_offset, category_id in skills:
+                    f.write(_TAXONOMY_SKILL.pack(name_offset, category_id))
+                f.write(array("I", [intern(name) for name in category_ids]).tobytes())
+                f.write(strings)
+            os.replace(f.name, index_path)
+        finally:
+            # Gone after a successful replace; anything left is a failed write
+            if os.path.exists(f.name):
+                os.unlink(f.name)
+        return cls(index_path)
+    
+    def __len__(self) -> int:
+        return self.skill_count
+    
+    def _string(self, offset: int) -> str:
+        start = self._strings_offset + offset
+        (length,) = struct.unpack_from("<H", self._mmap, start)
+        return self._mmap[start + 2:start + 2 + length].decode()
+    
+    def _skill(self, skill_id: int) -> Tuple[str, str]:
+        name_offset, category_id = _TAXONOMY_SKILL.unpack_from(self._mmap, self._skill_offset + 8 * skill_id)
+        return self._string(name_offset), self._string(self._category_offsets[category_id])
+    
+    def _lookup_key(self, key: str) -> Optional[int]:
+        alias_hash = _taxonomy_hash(key)
+        position = bisect.bisect_left(self._hashes, alias_hash)
+        if position == len(self._hashes) or self._hashes[position] != alias_hash:
+            return None
+        alias_offset, skill_id = _TAXONOMY_ALIAS.unpack_from(self._mmap, self._alias_offset + 8 * position)
+        return skill_id if self._string(alias_offset) == key else None
+    
+    def lookup(self, term: str) -> Optional[Tuple[str, str]]:
+        """Return (canonical skill, category) for a skill name or alias"""
+        skill_id = self._lookup_key(_taxonomy_key(term))
+        return None if skill_id is None else self._skill(skill_id)
+    
+    def match_spans(self, text: str) -> List[Tuple[str, str, int, int]]:
+        """(skill, category, start, end) for every skill mention, preferring the longest alias at each position"""
+        tokens = list(_SKILL_TOKEN_PATTERN.finditer(text.lower()))
+        found = []
+        i = 0
+        while i < len(tokens):
+            for words in range(min(self.max_words, len(tokens) - i), 0, -1):
+                skill_id = self._lookup_key(" ".join(token.group() for token in tokens[i:i + words]))
+                if skill_id is not None:
+                    found.append(self._skill(skill_id) + (tokens[i].start(), tokens[i + words - 1].end()))
+                    i += words
+                    break
+            else:
+                i += 1
+        return found
+    
+    def match(self, text: str) -> List[Tuple[str, str]]:
+        """Find skills in text, preferring the longest alias at each position"""
+        return list(dict.fromkeys((skill, category) for skill, category, _, _ in self.match_spans(text)))
+
+def load_skill_taxonomy(path: str) -> SkillTaxonomy:
+    """Open a taxonomy index, building it from a CSV/JSONL source once if needed"""
+    if path.endswith((".csv", ".jsonl")):
+        index_path = path + ".lbtx"
+        if not os.path.exists(index_path) or os.path.getmtime(index_path) < os.path.getmtime(path):
+            return SkillTaxonomy.build(path, index_path)
+        path = index_path
+    return SkillTaxonomy(path)
+
+@lru_cache(maxsize=None)
+def get_skill_taxonomy() -> Optional[SkillTaxonomy]:
+    """Return the taxonomy configured by LINKEDINBUILDR_TAXONOMY, or None when only TECH_KEYWORDS is used"""
+    path = os.environ.get("LINKEDINBUILDR_TAXONOMY")
+    if not path or not os.path.exists(path):
+        return None
+    return load_skill_taxonomy(path)
+
+def term_matcher_source(terms: Iterable[str]) -> Tuple[str, Dict[str, str]]:
+    """Regex source for a whole-term matcher and its lowercase-to-canonical map"""
+    canonical = {}
+    for term in terms:
+        canonical.setdefault(term.lower(), term)
+    # Longest first so "Machine Learning" wins over shorter overlapping terms
+    alternation = "|".join(re.escape(term) for term in sorted(canonical, key=len, reverse=True))
+    return rf"(?<![\w+#])(?:{alternation})(?![\w+#])", canonical
+
+def compile_term_matcher(terms: Iterable[str]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """Compile a case-insensitive whole-term matcher and its lowercase-to-canonical map"""
+    source, canonical = term_matcher_source(terms)
+    return re.compile(source, re.IGNORECASE), canonical
+
+_TECH_MATCHER = None  # (pattern, canonical map) over TECH_KEYWORDS, set by install_derived_indexes
+# Built-in technology -> its first TECH_KEYWORDS category
+_TECH_CATEGORIES = {term: category for category, terms in reversed(list(TECH_KEYWORDS.items())) for term in terms}
+
+def technology_spans(text: str) -> List[Tuple[str, str, int, int]]:
+    """(skill, category, start, end) for every technology mention, in text order: the configured
+    taxonomy's matches plus the built-in TECH_KEYWORDS it does not already cover"""
+    pattern, canonical = _TECH_MATCHER
+    builtin = [(canonical[match.group().lower()], match.start(), match.end()) for match in pattern.finditer(text)]
+    taxonomy = get_skill_taxonomy()
+    if taxonomy is None:
+        return [(skill, _TECH_CATEGORIES[skill], start, end) for skill, start, end in builtin]
+    found = taxonomy.match_spans(text)
+    known = {skill.lower() for skill, _, _, _ in found}
+    # Built-ins the taxonomy knows under any alias were already matched (or deliberately not) by it
+    found += [(skill, _TECH_CATEGORIES[skill], start, end) for skill, start, end in builtin
+              if skill.lower() not in known and taxonomy.lookup(skill) is None]
+    return sorted(found, key=lambda span: span[2])
+
+def match_skills(text: str) -> List[Tuple[str, str]]:
+    """(skill, category) for each technology in text, in order of first appearance"""
+    return list(dict.fromkeys((skill, category) for skill, category, _, _ in technology_spans(text)))
+
+def find_technologies(text: str) -> List[str]:
+    """Find whole-word technology mentions in order of first appearance"""
+    return [skill for skill, _ in match_skills(text)]
+
 def extract_technologies(text: str) -> List[str]:
     """Extract mentioned technologies from text"""
+    if get_skill_taxonomy() is not None:
+        return find_technologies(text)
+    
     found_tech = set()
     text_lower = text.lower()
     
@@ -337,6 +708,19 @@ def extract_technologies(text: str) -> List[str]:
     
     return list(found_tech)
 
+def count_technical_terms(description: str) -> int:
+    """Count the technologies named in a lowercased description"""
+    if get_skill_taxonomy() is not None:
+        return len(match_skills(description))
+    return sum(1 for tech in TECH_KEYWORDS["languages"] + TECH_KEYWORDS["frameworks"]
+               if tech.lower() in description)
+
+def mentions_technology(content: str) -> bool:
+    """Check whether profile content names a language or framework"""
+    if get_skill_taxonomy() is not None:
+        return bool(match_skills(content))
+    return any(tech in content for tech in TECH_KEYWORDS["languages"] + TECH_KEYWORDS["frameworks"])
+
 def generate_smart_hashtags(text: str, activity_type: str) -> List[str]:
     """Generate relevant hashtags based on content and activity type"""
     hashtags = set()
@@ -388,8 +772,8 @@ def detect_activity_type(text: str) -> str:
     
     return "personal_project"  # default if no clear match
 
-def create_activity_template(activity_type: str) -> Dict[str, any]:
-    """Create template based on activity type"""
+def _build_activity_templates() -> Dict[str, Dict[str, any]]:
+    """Build the base template (under None) and every activity-specific template from scratch"""
     base_template = {
         "title": "",
         "date_or_duration": "",
@@ -455,10 +839,78 @@ def create_activity_template(activity_type: str) -> Dict[str, any]:
         }
     }
     
-    return specific_templates.get(activity_type, base_template)
+    return {None: base_template, **specific_templates}
+
+class ActivityTemplate(dict):
+    """post_data dict that shares its prototype's empty tuples until a list field is written
+    
+    Unwritten list fields hold the prototype's tuple; every read ([], get(), items(), values(),
+    dict(), **) presents it as a fresh list without storing one. Assigning a field stores a private
+    value, so list fields must be assigned rather than mutated in place.
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        return list(value) if type(value) is tuple else value
+    
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, list(value) if type(value) is tuple else value)
+    
+    def __iter__(self):
+        # Overriding iteration makes dict(view) and **view go through keys() and __getitem__
+        return dict.__iter__(self)
+    
+    def __eq__(self, other):
+        return dict(self.items()) == other
+    
+    def __ne__(self, other):
+        return not self == other
+    
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def items(self):
+        return [(key, self[key]) for key in dict.keys(self)]
+    
+    def values(self):
+        return [self[key] for key in dict.keys(self)]
+    
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+    
+    def update(self, other=(), **fields):
+        for key, value in dict(other, **fields).items():
+            self[key] = value
+    
+    def copy(self) -> "ActivityTemplate":
+        return ActivityTemplate(dict.items(self))
+
+def _build_activity_prototypes() -> Dict[str, Dict[str, any]]:
+    """Templates with list defaults turned into tuples, so prototypes can be shared safely across threads"""
+    return {
+        activity_type: {field: tuple(value) if isinstance(value, list) else value for field, value in template.items()}
+        for activity_type, template in _build_activity_templates().items()
+    }
+
+# Set by install_derived_indexes; ACTIVITY_TEMPLATE_PROTOTYPES is a read-only view of the same prototypes
+_ACTIVITY_PROTOTYPES = {}
+ACTIVITY_TEMPLATE_PROTOTYPES = MappingProxyType({})
+
+def create_activity_template(activity_type: str) -> Dict[str, any]:
+    """Create template based on activity type"""
+    return ActivityTemplate(_ACTIVITY_PROTOTYPES.get(activity_type) or _ACTIVITY_PROTOTYPES[None])
 
 def check_missing_info(activity_type: str, post_data: Dict[str, any]) -> Dict[str, List[str]]:
     """Check what essential and optional information is missing"""
+    if isinstance(post_data, PostRecord):
+        return check_missing_post_record(activity_type, post_data)
     if activity_type not in REQUIRED_INFO:
         return {"essential": [], "optional": []}
         
@@ -586,31 +1038,181 @@ def format_post(post_data: Dict[str, any], activity_type: str, tone_style: str =
     
     return "\n\n".join([s for s in formatted_sections if s])
 
+# Plain-language replacements for less_technical edits; keys are matched case-insensitively as whole terms
+JARGON_REPLACEMENTS = {
+    "API": "interface",
+    "APIs": "interfaces",
+    "REST API": "web interface",
+    "REST APIs": "web interfaces",
+    "GraphQL": "flexible data querying",
+    "microservices": "small independent services",
+    "microservice": "small independent service",
+    "backend": "server side",
+    "frontend": "user interface",
+    "full stack": "end-to-end",
+    "CI/CD": "automated testing and releases",
+    "CI/CD pipeline": "automated release process",
+    "Kubernetes": "large-scale app hosting",
+    "Docker": "packaged app containers",
+    "containerized": "packaged",
+    "serverless": "cloud-hosted",
+    "deployed": "launched",
+    "deployment": "launch",
+    "refactored": "reorganized",
+    "refactoring": "reorganizing",
+    "optimized": "improved",
+    "scalable": "able to grow",
+    "scalability": "ability to grow",
+    "throughput": "amount of work handled",
+    "database": "data store",
+    "schema": "data layout",
+    "endpoint": "web address",
+    "endpoints": "web addresses",
+    "ML": "machine learning",
+    "NLP": "language processing",
+    "LLM": "AI language model",
+    "LLMs": "AI language models",
+    "fine-tuned": "customized",
+    "end-to-end encryption": "private, encrypted messaging",
+    "vulnerabilities": "security weaknesses",
+    "vulnerability": "security weakness",
+    "SLA": "service promise",
+    "uptime": "time online",
+    "concurrent requests": "requests at the same time",
+    "data daily": "data every day",
+    "memory usage": "memory use",
+    "CPU load": "processing load"
+}
+
+# TECHNICAL_CONTEXT metric names in everyday words; other metrics just lose their underscores
+_PLAIN_METRIC_NAMES = {
+    "latency": "response time",
+    "cpu_usage": "processing load",
+    "requests_per_second": "requests handled each second",
+    "concurrent_users": "users at the same time",
+    "data_volume": "amount of data",
+    "load_time": "loading time",
+    "interaction_time": "time to complete a task",
+    "error_rate": "share of failed requests",
+    "vulnerability_count": "number of security weaknesses",
+    "coverage": "share checked"
+}
+
+def _jargon_table() -> Dict[str, str]:
+    """JARGON_REPLACEMENTS plus every TECHNICAL_CONTEXT metric, keyed by lowercase term"""
+    table = {term.lower(): plain for term, plain in JARGON_REPLACEMENTS.items()}
+    for details in TECHNICAL_CONTEXT["project_types"].values():
+        for metric in details["key_metrics"]:
+            plain = _PLAIN_METRIC_NAMES.get(metric, metric.replace("_", " "))
+            if plain != metric.replace("_", " "):
+                table.setdefault(metric, plain)
+                table.setdefault(metric.replace("_", " "), plain)
+    return table
+
+def _jargon_pattern_source(table: Dict[str, str]) -> str:
+    # URLs and hashtags come first in the alternation so they are copied through untouched;
+    # a preceding "a"/"an" is matched with the term so it can be made to agree with the replacement
+    return r"(https?://\S+|#\w+)|(?:\b(an?)\s+)?(" + term_matcher_source(table)[0] + ")"
+
+_JARGON_TABLE = {}      # set by install_derived_indexes
+_JARGON_PATTERN = None
+
+def _indefinite_article(word: str, capitalized: bool) -> str:
+    # Enough for the plain replacements above: "an interface", "a user interface"
+    article = "an" if word[:1].lower() in "aeio" else "a"
+    return article.capitalize() if capitalized else article
+
+def simplify_technical_text(text: str) -> str:
+    """Simplify technical language in the text"""
+    def replace(match: re.Match) -> str:
+        if match.group(1):
+            return match.group(1)
+        article, term = match.group(2), match.group(3)
+        plain = _JARGON_TABLE[term.lower()]
+        if article:
+            return f"{_indefinite_article(plain, article[0].isupper())} {plain}"
+        before = text[max(0, match.start() - 4):match.start()].rstrip(" \t-•*")
+        opens_sentence = match.start() == 0 or (not before and match.start() <= 4) or before.endswith(("\n", ".", "!", "?", ":"))
+        return plain[0].upper() + plain[1:] if opens_sentence else plain
+    return _JARGON_PATTERN.sub(replace, text)
+
+_BULLET_PATTERN = re.compile(r"^\s*(?:[-•*]|\d+[.)])\s+")
+_SENTENCE_PATTERN = re.compile(r"[^.!?]+(?:[.!?]+|$)")
+
+POST_CLOSING_QUESTIONS = {
+    "hackathon": "Have you been to a hackathon recently? I'd love to hear what you built.",
+    "personal_project": "I'd love feedback from anyone who has built something similar. What would you add next?",
+    "internship": "If you're considering a similar internship, feel free to reach out with questions.",
+    "conference": "Were you there too? I'd love to compare notes on the sessions.",
+    "workshop": "What's the best workshop you've attended this year?",
+    "course_completion": "What should I learn next? Recommendations welcome.",
+    "competition": "Anyone else taking part in coding competitions? Let's connect."
+}
+
+def _post_sections(post: str) -> List[str]:
+    """Split a post at blank lines, keeping a list header and its bullets together as one section"""
+    sections, open_list = [], False
+    for paragraph in re.split(r"\n\s*\n", post):
+        paragraph = paragraph.strip("\n")
+        if not paragraph.strip():
+            continue
+        is_list = all(_BULLET_PATTERN.match(line) for line in paragraph.split("\n"))
+        if is_list and open_list:
+            sections[-1].append(paragraph)
+        else:
+            sections.append([paragraph])
+        open_list = is_list or paragraph.endswith(":")
+    return ["\n".join(section) for section in sections]
+
+def _is_trailer(section: str) -> bool:
+    """Links and hashtag blocks that every edit keeps as they are"""
+    first = section.lstrip()
+    return first.startswith(("#", "Links:", "🔗")) or bool(re.search(r"https?://", section))
+
+def _first_sentences(text: str, count: int) -> str:
+    sentences = _SENTENCE_PATTERN.findall(text)
+    return "".join(sentences[:count]).strip() if len(sentences) > count else text
+
+def shorten_post(post: str) -> str:
+    """Keep the opening, the first two points of each list, one sentence of other prose, links and hashtags"""
+    sections = _post_sections(post)
+    kept = []
+    for index, section in enumerate(sections):
+        if _is_trailer(section):
+            kept.append(section)
+            continue
+        lines = section.split("\n")
+        bullets = [line for line in lines if _BULLET_PATTERN.match(line)]
+        if bullets:
+            kept.append("\n".join([line for line in lines if not _BULLET_PATTERN.match(line)] + bullets[:2]))
+        else:
+            kept.append(_first_sentences(section, 2 if index == 0 else 1))
+    return "\n\n".join(kept)
+
+def lengthen_post(post: str) -> str:
+    """Add a tech stack line and a closing question drawn from the post itself"""
+    sections = _post_sections(post)
+    if not sections:
+        return post
+    body = [section for section in sections if not _is_trailer(section)]
+    trailer = [section for section in sections if _is_trailer(section)]
+    if not body:
+        return post
+    stack, closing = [], []
+    technologies = find_technologies("\n".join(body))
+    if technologies and not re.search(r"\b(?:tech stack|built with)\b", post, re.IGNORECASE):
+        stack.append("Built with: " + ", ".join(technologies[:6]))
+    if "?" not in body[-1]:
+        closing.append(POST_CLOSING_QUESTIONS[detect_activity_type(post)])
+    return "\n\n".join(body[:1] + stack + body[1:] + closing + trailer)
+
 def apply_quick_edit(post: str, edit_type: str) -> str:
     """Apply quick edits to the post"""
     if edit_type == "shorter":
-        # Remove some detail sections while keeping core message
-        lines = post.split("\n")
-        if len(lines) > 10:
-            # Keep first 2 paragraphs, achievements if any, and links/hashtags
-            important_parts = []
-            in_achievements = False
-            for line in lines:
-                if line.startswith("🔗") or line.startswith("#"):
-                    important_parts.append(line)
-                elif "Achievement" in line:
-                    in_achievements = True
-                    important_parts.append(line)
-                elif in_achievements and line.startswith("•"):
-                    important_parts.append(line)
-                elif len(important_parts) < 5:
-                    important_parts.append(line)
-            return "\n".join(important_parts)
+        return shorten_post(post)
     
     elif edit_type == "longer":
-        # Add more context and detail markers
-        if "Key Takeaways:" not in post:
-            post += "\n\nKey Takeaways:\n• [Add your key learning point]\n• [Add another learning point]"
+        return lengthen_post(post)
     
     elif edit_type == "more_technical":
         # Add technical detail markers
@@ -620,15 +1222,45 @@ def apply_quick_edit(post: str, edit_type: str) -> str:
     
     elif edit_type == "less_technical":
         # Simplify technical language
-        post = post.replace("Technical Implementation:", "Key Highlights:")
-        post = re.sub(r'(?<=•)[^•]+?(?=(\n|$))', lambda m: simplify_technical_text(m.group()), post)
+        post = post.replace("Technical Implementation:", "Key Highlights:").replace("Key Technical Highlights:", "Key Highlights:")
+        post = simplify_technical_text(post)
     
     return post
 
-def simplify_technical_text(text: str) -> str:
-    """Simplify technical language in the text"""
-    # Add logic to simplify technical terms
-    return text
+# Edit requests answered locally; more_technical needs real detail, so it stays with the model
+_QUICK_EDIT_PATTERNS = [
+    ("less_technical", re.compile(r"\b(?:less technical|too technical|non-?technical|simpler|simplify|plain(?:er)? (?:english|language))\b", re.IGNORECASE)),
+    ("shorter", re.compile(r"\b(?:shorter|shorten|more concise|too long|trim it|cut it down)\b", re.IGNORECASE)),
+    ("longer", re.compile(r"\b(?:longer|lengthen|expand it|too short)\b", re.IGNORECASE))
+]
+QUICK_EDIT_MAX_REQUEST_LENGTH = 200  # longer messages usually carry new content for the model
+QUICK_EDIT_STATS = Counter()
+
+def detect_quick_edit(text: str) -> Optional[str]:
+    """Return the apply_quick_edit mode a short edit request asks for, if any"""
+    if len(text) > QUICK_EDIT_MAX_REQUEST_LENGTH:
+        return None
+    for edit_type, pattern in _QUICK_EDIT_PATTERNS:
+        if pattern.search(text):
+            return edit_type
+    return None
+
+def quick_edit_previous_post(messages: List[Dict]) -> str:
+    """Apply a requested quick edit to the last post the assistant wrote, or return "" """
+    if len(messages) < 3 or messages[-1].get("role", "user") != "user":
+        return ""
+    edit_type = detect_quick_edit(messages[-1].get("content", ""))
+    if not edit_type:
+        return ""
+    previous = next((m.get("content", "") for m in reversed(messages[:-1]) if m.get("role") == "assistant"), "")
+    if not re.search(r"(?m)^#\w|^Links:", previous):
+        return ""
+    edited = apply_quick_edit(previous, edit_type)
+    if edited == previous:
+        return ""
+    QUICK_EDIT_STATS[edit_type] += 1
+    return edited
+
 
 def generate_headline(profile_data: Dict[str, any]) -> str:
     """Generate a compelling LinkedIn headline"""
@@ -648,6 +1280,129 @@ def generate_headline(profile_data: Dict[str, any]) -> str:
         achievement=profile_data.get("achievement", "")
     )
 
+# Precompiled headline formatters with the fields each template needs
+_HEADLINE_FORMATTERS = [(template.format, frozenset(re.findall(r"{(\w+)}", template))) for template in HEADLINE_TEMPLATES]
+HEADLINE_MAX_LENGTH = 220  # LinkedIn's headline limit
+HEADLINE_SPECIALIZATIONS = [
+    "Full-Stack", "Frontend", "Backend", "ML/AI", "Machine Learning", "AI", "Cloud", "DevOps",
+    "Mobile", "Security", "Data Science", "Distributed Systems", "Game Development", "Embedded Systems"
+]
+_HEADLINE_ROLE_PATTERN = re.compile(
+    r"\b(?:CS|Computer Science|Software Engineering|Software|Data Science|ML|Frontend|Backend|Full[- ]Stack)"
+    r" (?:Student|Intern|Engineer|Developer|Graduate)\b",
+    re.IGNORECASE
+)
+# Only explicit asks for other headlines; "make my headline more technical" is an edit for the model
+_HEADLINE_ALTERNATIVES_PATTERN = re.compile(
+    r"\b(?:(?:alternative|other|different)\s+headlines?|(?:more|new|some|few|several|\d+)\s+headlines"
+    r"|another\s+headline|headline\s+(?:alternatives|options|ideas|variations|suggestions)"
+    r"|alternatives?\s+(?:to|for)\s+(?:my\s+)?headline)\b",
+    re.IGNORECASE
+)
+_SPECIALIZATION_MATCHER = None  # (pattern, canonical map) over HEADLINE_SPECIALIZATIONS, set by install_derived_indexes
+
+def score_headline(headline: str, specialization: str = "") -> Tuple[float, List[str]]:
+    """Score a headline with the improvement-suggestion rules (length, tech presence, specificity)"""
+    issues = []
+    score = 1.0
+    if len(headline) > HEADLINE_MAX_LENGTH:
+        return 0.0, ["too_long"]
+    if len(headline) < 50:
+        issues.append("too_short")
+        score -= 0.3
+    tech_count = len(find_technologies(headline))
+    if not tech_count:
+        issues.append("no_tech")
+        score -= 0.3
+    if specialization and specialization.lower() not in headline.lower():
+        issues.append("too_generic")
+        score -= 0.2
+    # Specificity: reward a second named technology, penalize dangling separators and repetition
+    score += 0.1 * min(tech_count, 2)
+    if headline.rstrip().endswith("|"):
+        score -= 0.5
+    words = [word for word in re.findall(r"\w+", headline.lower()) if len(word) > 3]
+    if len(words) != len(set(words)):
+        issues.append("repetitive")
+        score -= 0.2
+    return round(score, 3), issues
+
+def generate_headline_candidates(profile_data: Dict[str, any], top_n: int = 5) -> List[Dict[str, any]]:
+    """Render every headline template with the user's fields and technology combinations, best first"""
+    if not all(profile_data.get(field) for field in PROFILE_SECTIONS["headline"]["essential"]):
+        return []
+    
+    key_technology = profile_data["key_technology"]
+    technologies = [tech for tech in profile_data.get("technologies", []) if tech.lower() != key_technology.lower()][:3]
+    tech_variants = [key_technology]
+    tech_variants += [f"{key_technology} & {tech}" for tech in technologies]
+    tech_variants += [f"{key_technology}, {first} & {second}"
+                      for i, first in enumerate(technologies) for second in technologies[i + 1:]]
+    
+    fields = {
+        "role": profile_data["role"],
+        "specialization": profile_data["specialization"],
+        "industry": profile_data.get("industry") or "Technology",
+        "achievement": profile_data.get("achievement", "")
+    }
+    candidates, template_of = {}, {}
+    for template_index, (formatter, needed) in enumerate(_HEADLINE_FORMATTERS):
+        if "achievement" in needed and not fields["achievement"]:
+            continue
+        for variant in (tech_variants if "key_technology" in needed else [key_technology]):
+            headline = formatter(key_technology=variant, **fields)
+            if headline not in candidates:
+                candidates[headline] = score_headline(headline, fields["specialization"])
+                template_of[headline] = template_index
+    
+    # Keep the best rendering of each template, then fill with the next best overall
+    ranked = sorted(candidates.items(), key=lambda item: (-item[1][0], len(item[0])))
+    selected, templates_seen = [], set()
+    for headline, result in ranked:
+        if template_of[headline] not in templates_seen:
+            templates_seen.add(template_of[headline])
+            selected.append((headline, result))
+    selected += [item for item in ranked if item not in selected][:max(top_n - len(selected), 0)]
+    selected = sorted(selected, key=lambda item: (-item[1][0], len(item[0])))[:top_n]
+    return [{"headline": headline, "score": score, "issues": issues} for headline, (score, issues) in selected]
+
+def extract_headline_fields(text: str) -> Dict[str, any]:
+    """Pull role, specialization and technologies for a headline out of free text"""
+    fields = {}
+    role = _HEADLINE_ROLE_PATTERN.search(text)
+    if role:
+        fields["role"] = " ".join(word.upper() if word.lower() in ("cs", "ml") else word.capitalize()
+                                  for word in role.group().split())
+    pattern, canonical = _SPECIALIZATION_MATCHER
+    specialization = pattern.search(text)
+    if specialization:
+        fields["specialization"] = canonical[specialization.group().lower()]
+    technologies = find_technologies(text)
+    if technologies:
+        fields["key_technology"] = technologies[0]
+        fields["technologies"] = technologies[1:]
+    return fields
+
+def suggest_headline_alternatives(messages: List[Dict]) -> str:
+    """Answer a request for headline alternatives locally when the conversation has the needed fields"""
+    user_messages = [m.get("content", "") for m in messages if m.get("role", "user") == "user"]
+    if not user_messages:
+        return ""
+    request = user_messages[-1]
+    if not _HEADLINE_ALTERNATIVES_PATTERN.search(request):
+        return ""
+    candidates = generate_headline_candidates(extract_headline_fields("\n".join(user_messages)))
+    if not candidates:
+        return ""
+    
+    lines = ["Here are some headline options, strongest first:", ""]
+    lines += [f"{i}. {candidate['headline']}" for i, candidate in enumerate(candidates, 1)]
+    tips = generate_improvement_suggestions("headline", candidates[0]["headline"])
+    if tips:
+        lines += ["", "Tip: " + tips[0]]
+    lines += ["", "Pick one, or tell me what to emphasize and I'll adjust it."]
+    return "\n".join(lines)
+
 def format_about_section(profile_data: Dict[str, any]) -> str:
     """Format the about section of the profile"""
     about_structure = ABOUT_SECTION_STRUCTURE
@@ -752,6 +1507,8 @@ def organize_skills(skills: Dict[str, List[str]]) -> str:
 
 def validate_profile_data(profile_data: Dict[str, any]) -> Dict[str, List[str]]:
     """Validate profile data and return missing required fields"""
+    if isinstance(profile_data, ProfileRecord):
+        return validate_profile_record(profile_data)
     missing = {}
     
     for section, requirements in PROFILE_SECTIONS.items():
@@ -766,6 +1523,211 @@ def validate_profile_data(profile_data: Dict[str, any]) -> Dict[str, List[str]]:
     
     return {k: v for k, v in missing.items() if v}
 
+# Compact records: profile_data and post_data as slotted objects that keep one bit per filled field
+_UNSET = object()
+
+class Record:
+    """Slotted, read-only mapping stand-in for a profile_data or post_data dict
+    
+    Bit i of mask is set when FIELDS[i] is filled, so a required-field check is one mask
+    comparison. "Filled" follows the dict check a record type replaces: key presence where
+    PRESENCE is set (validate_profile_data), a non-empty value otherwise (check_missing_info).
+    Lists are stored as tuples, NESTED fields as records and NESTED_LISTS fields as tuples of
+    records; keys outside FIELDS go to extra.
+    """
+    __slots__ = ("mask", "extra")
+    FIELDS: Tuple[str, ...] = ()
+    BITS: Dict[str, int] = {}
+    NESTED: Dict[str, type] = {}
+    NESTED_LISTS: Dict[str, type] = {}
+    PRESENCE = False
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = tuple(cls.__slots__)
+        cls.BITS = {name: 1 << index for index, name in enumerate(cls.FIELDS)}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> "Record":
+        """Convert a dict, raising TypeError for a nested field that is not an object or list of objects"""
+        record = cls.__new__(cls)
+        mask, extra, bits, presence = 0, None, cls.BITS, cls.PRESENCE
+        nested, nested_lists = cls.NESTED, cls.NESTED_LISTS
+        for name, value in data.items():
+            bit = bits.get(name)
+            if bit is None:
+                if extra is None:
+                    extra = {}
+                extra[name] = value
+                continue
+            if name in nested:
+                if type(value) is not dict:
+                    raise TypeError(f"{cls.__name__}.{name} must be an object, not {type(value).__name__}")
+                value = nested[name].from_dict(value)
+            elif name in nested_lists:
+                if type(value) is not list or any(type(item) is not dict for item in value):
+                    raise TypeError(f"{cls.__name__}.{name} must be a list of objects")
+                value = tuple(map(nested_lists[name].from_dict, value))
+            elif type(value) is list:
+                value = tuple(value)
+            setattr(record, name, value)
+            if presence or value:
+                mask |= bit
+        record.mask = mask
+        record.extra = extra
+        return record
+    
+    def to_dict(self) -> Dict[str, any]:
+        data = {}
+        for name in self.FIELDS:
+            value = getattr(self, name, _UNSET)
+            if value is _UNSET:
+                continue
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, tuple):
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            data[name] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+    
+    # Read-only mapping protocol, so code that reads a dict accepts its record; values keep their
+    # record form (tuples for lists, records for nested objects)
+    def __getitem__(self, name: str):
+        if name in self.BITS:
+            value = getattr(self, name, _UNSET)
+            if value is not _UNSET:
+                return value
+        elif self.extra and name in self.extra:
+            return self.extra[name]
+        raise KeyError(name)
+    
+    def __contains__(self, name) -> bool:
+        if name in self.BITS:
+            return hasattr(self, name)
+        return bool(self.extra) and name in self.extra
+    
+    def __iter__(self) -> Iterator[str]:
+        for name in self.FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self.extra:
+            yield from self.extra
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def keys(self) -> List[str]:
+        return list(self)
+    
+    def items(self) -> List[Tuple[str, any]]:
+        return [(name, self[name]) for name in self]
+    
+    def values(self) -> List[any]:
+        return [self[name] for name in self]
+    
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+    
+    def missing(self, required: "RequiredFields") -> List[str]:
+        """Required fields this record has not filled, in requirement order"""
+        if required.mask & ~self.mask == 0:
+            return []
+        return [name for name, bit in required.fields if not self.mask & bit]
+
+Mapping.register(Record)
+
+class RequiredFields:
+    """A precomputed required-field mask plus (name, bit) pairs to list gaps in catalog order"""
+    
+    __slots__ = ("mask", "fields")
+    
+    def __init__(self, record_type: type, names: Iterable[str]):
+        self.fields = tuple((name, record_type.BITS[name]) for name in names)
+        self.mask = 0
+        for _, bit in self.fields:
+            self.mask |= bit
+
+def _record_fields(*groups: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(name for group in groups for name in group))
+
+def _section_fields(section: str, *extra: str) -> Tuple[str, ...]:
+    return _record_fields(PROFILE_SECTIONS[section]["essential"], PROFILE_SECTIONS[section]["optional"], extra)
+
+# validate_profile_data checks section fields with `in`, so their bits mean the key is present
+class HeadlineRecord(Record):
+    __slots__ = _section_fields("headline")
+    PRESENCE = True
+
+class AboutRecord(Record):
+    __slots__ = _section_fields("about")
+    PRESENCE = True
+
+class ExperienceRecord(Record):
+    __slots__ = _section_fields("experience", "description", "started")
+    PRESENCE = True
+
+class EducationRecord(Record):
+    __slots__ = _section_fields("education", "started", "activities")
+    PRESENCE = True
+
+class PostRecord(Record):
+    __slots__ = _record_fields(
+        *(template.keys() for template in _build_activity_templates().values()),
+        *(requirements["essential"] + requirements["optional"] for requirements in REQUIRED_INFO.values()),
+        ("achievement", "links")
+    )
+
+PROFILE_SECTION_RECORDS = {
+    "headline": HeadlineRecord,
+    "about": AboutRecord,
+    "experience": ExperienceRecord,
+    "education": EducationRecord
+}
+
+class ProfileRecord(Record):
+    # Section dicts as validate_profile_data reads them, plus the flat fields imports and prompts use
+    __slots__ = _record_fields(
+        PROFILE_SECTION_RECORDS, ("experiences", "projects", "skills"),
+        PROFILE_SECTIONS["headline"]["essential"], PROFILE_SECTIONS["headline"]["optional"],
+        ("name", "headline_text", "institution", "status", "technical_focus", "technologies", "achievements",
+         "current_projects", "learning_goals", "seeking_opportunities")
+    )
+    NESTED = PROFILE_SECTION_RECORDS
+    NESTED_LISTS = {"experiences": ExperienceRecord}
+
+SECTION_REQUIRED_FIELDS = {
+    section: RequiredFields(record_type, PROFILE_SECTIONS[section]["essential"])
+    for section, record_type in PROFILE_SECTION_RECORDS.items()
+}
+
+ACTIVITY_REQUIRED_FIELDS = {
+    activity_type: {level: RequiredFields(PostRecord, requirements[level]) for level in ("essential", "optional")}
+    for activity_type, requirements in REQUIRED_INFO.items()
+}
+
+def validate_profile_record(profile: ProfileRecord) -> Dict[str, List[str]]:
+    """validate_profile_data for a ProfileRecord: one mask comparison per section"""
+    missing = {}
+    for section, required in SECTION_REQUIRED_FIELDS.items():
+        record = getattr(profile, section, None)
+        if record is None:
+            missing[section] = [name for name, _ in required.fields]
+        elif required.mask & ~record.mask:
+            missing[section] = record.missing(required)
+    return missing
+
+def check_missing_post_record(activity_type: str, post: PostRecord) -> Dict[str, List[str]]:
+    """check_missing_info for a PostRecord: one mask comparison per requirement level"""
+    required = ACTIVITY_REQUIRED_FIELDS.get(activity_type)
+    if required is None:
+        return {"essential": [], "optional": []}
+    return {"essential": post.missing(required["essential"]), "optional": post.missing(required["optional"])}
+
 def generate_profile_sections(profile_data: Dict[str, any]) -> Dict[str, str]:
     """Generate all sections of the LinkedIn profile"""
     profile = {}
@@ -790,35 +1752,250 @@ def generate_profile_sections(profile_data: Dict[str, any]) -> Dict[str, str]:
     
     return profile
 
+# Profile-wide wording of the rules suggest_profile_improvements has always reported
+_PROFILE_IMPROVEMENT_MESSAGES = {
+    "headline.too_short": "Consider adding more detail to your headline to improve visibility",
+    "about.too_short": "Your about section could benefit from more content - aim for 200-2000 characters",
+    "about.no_achievements": "Consider adding specific achievements to your about section",
+    "experience.no_metrics": "Add quantifiable achievements to your experience entries",
+    "experience.no_tech_stack": "Include technical stack details in your experience descriptions",
+    "skills.too_few": "Add more relevant skills to increase profile visibility"
+}
+
 def suggest_profile_improvements(profile: Dict[str, str]) -> List[str]:
-    """Suggest improvements for the profile"""
-    suggestions = []
+    """Suggest improvements for the profile, one per ProfileLinter rule that fires"""
+    return lint_messages(get_profile_linter().lint(profile), _PROFILE_IMPROVEMENT_MESSAGES)
+
+# Rule registry for ProfileLinter: rule id -> (sections it applies to, check function)
+PROFILE_LINT_RULES = {}
+_LINT_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#%]*(?:[./-][A-Za-z0-9+#%]+)*")
+METRIC_WORDS = frozenset(["increased", "improved", "reduced", "decreased", "cut", "scaled", "grew", "saved"])
+GOAL_WORDS = frozenset(["goal", "goals", "seeking", "looking", "aspire", "aim", "hope", "pursue"])
+VAGUE_PHRASES = ("worked on", "helped with", "responsible for", "involved in", "assisted with")
+PROBLEM_WORDS = frozenset(["solved", "fixed", "improved", "optimized"])
+SOLUTION_WORDS = frozenset(["using", "implemented", "developed", "designed"])
+
+def profile_lint_rule(rule_id: str, *sections: str):
+    """Register a ProfileLinter rule for the given profile sections"""
+    def register(check):
+        PROFILE_LINT_RULES[rule_id] = (sections, check)
+        return check
+    return register
+
+class SectionTokens:
+    """One profile section tokenized once and shared by every lint rule"""
     
-    # Headline suggestions
-    if len(profile.get("headline", "")) < 50:
-        suggestions.append("Consider adding more detail to your headline to improve visibility")
-    
-    # About section suggestions
-    about = profile.get("about", "")
-    if len(about) < 200:
-        suggestions.append("Your about section could benefit from more content - aim for 200-2000 characters")
-    if "achievements" not in about.lower():
-        suggestions.append("Consider adding specific achievements to your about section")
-    
-    # Experience suggestions
-    experiences = profile.get("experience", [])
-    if experiences:
-        if not any("achievement" in exp.lower() for exp in experiences):
-            suggestions.append("Add quantifiable achievements to your experience entries")
-        if not any("tech stack" in exp.lower() for exp in experiences):
-            suggestions.append("Include technical stack details in your experience descriptions")
-    
-    # Skills suggestions
-    skills = profile.get("skills", "")
-    if len(skills.split("\n")) < 10:
-        suggestions.append("Add more relevant skills to increase profile visibility")
+    __slots__ = ("section", "text", "lines", "tokens", "token_starts", "words", "technologies", "technology_starts",
+                 "_metric_mentions", "_value_starts")
     
-    return suggestions
+    def __init__(self, section: str, text: str):
+        self.section = section
+        self.text = text
+        self.tokens = [(match.group().lower(), match.start(), match.end()) for match in _LINT_TOKEN_PATTERN.finditer(text)]
+        self.token_starts = [start for _, start, _ in self.tokens]
+        self.words = {token for token, _, _ in self.tokens}
+        # (start, end, text) for every line, so rules can report positions
+        self.lines, start = [], 0
+        for line in text.split("\n"):
+            self.lines.append((start, start + len(line), line))
+            start += len(line) + 1
+        self.technologies = [(skill, start, end) for skill, _, start, end in technology_spans(text)]
+        self.technology_starts = [start for _, start, _ in self.technologies]
+        self._metric_mentions = None
+        self._value_starts = None
+    
+    def tokens_between(self, start: int, end: int) -> List[str]:
+        first = bisect.bisect_left(self.token_starts, start)
+        last = bisect.bisect_left(self.token_starts, end)
+        return [token for token, _, _ in self.tokens[first:last]]
+    
+    def technologies_between(self, start: int, end: int) -> int:
+        return bisect.bisect_left(self.technology_starts, end) - bisect.bisect_left(self.technology_starts, start)
+    
+    def metrics_between(self, start: int, end: int) -> int:
+        """Metrics that extract_metrics would find in text[start:end], from one scan of the section"""
+        if self._metric_mentions is None:
+            self._metric_mentions = sorted((match.start(), match.end(), metric)
+                                           for metric, pattern in _METRIC_NAME_PATTERNS.items()
+                                           for match in pattern.finditer(self.text))
+            self._value_starts = [match.start() for match in _METRIC_VALUE_PATTERN.finditer(self.text)]
+        found = set()
+        first = bisect.bisect_left(self._metric_mentions, (start,))
+        for mention_start, mention_end, metric in self._metric_mentions[first:]:
+            if mention_start >= end:
+                break
+            value = bisect.bisect_left(self._value_starts, mention_end)
+            if value < len(self._value_starts) and self._value_starts[value] < end:
+                found.add(metric)
+        return len(found)
+    
+    def bullets(self) -> Iterator[Tuple[int, int, str]]:
+        """(start, end, text after the marker) for each "•", "-", "*" or numbered list line"""
+        for start, end, line in self.lines:
+            marker = _BULLET_PATTERN.match(line)
+            if marker:
+                yield start, end, line[marker.end():]
+
+def _finding(rule: str, tokens: SectionTokens, message: str, start: int = 0, end: Optional[int] = None,
+             severity: str = "suggestion") -> Dict[str, any]:
+    return {"rule": rule, "section": tokens.section, "severity": severity, "message": message,
+            "start": start, "end": len(tokens.text) if end is None else end}
+
+_IMPROVEMENT_MESSAGES = CONVERSATION_TEMPLATES["improvement_suggestions"]
+
+@profile_lint_rule("headline.too_short", "headline")
+def _lint_headline_too_short(tokens: SectionTokens) -> List[Dict]:
+    if len(tokens.text) < 50:
+        return [_finding("headline.too_short", tokens, _IMPROVEMENT_MESSAGES["headline"]["too_short"])]
+    return []
+
+@profile_lint_rule("headline.too_long", "headline")
+def _lint_headline_too_long(tokens: SectionTokens) -> List[Dict]:
+    if len(tokens.text) > HEADLINE_MAX_LENGTH:
+        return [_finding("headline.too_long", tokens, f"LinkedIn cuts headlines at {HEADLINE_MAX_LENGTH} characters.",
+                         HEADLINE_MAX_LENGTH, severity="error")]
+    return []
+
+@profile_lint_rule("headline.no_tech", "headline")
+def _lint_headline_no_tech(tokens: SectionTokens) -> List[Dict]:
+    if tokens.technologies:
+        return []
+    return [_finding("headline.no_tech", tokens, _IMPROVEMENT_MESSAGES["headline"]["no_tech"])]
+
+@profile_lint_rule("about.too_short", "about")
+def _lint_about_too_short(tokens: SectionTokens) -> List[Dict]:
+    if len(tokens.text) < 200:
+        return [_finding("about.too_short", tokens, _IMPROVEMENT_MESSAGES["about"]["too_short"])]
+    return []
+
+@profile_lint_rule("about.no_achievements", "about")
+def _lint_about_no_achievements(tokens: SectionTokens) -> List[Dict]:
+    if not any(word.startswith("achieve") for word in tokens.words):
+        return [_finding("about.no_achievements", tokens, _IMPROVEMENT_MESSAGES["about"]["no_achievements"])]
+    return []
+
+@profile_lint_rule("about.no_goals", "about")
+def _lint_about_no_goals(tokens: SectionTokens) -> List[Dict]:
+    if not tokens.words & GOAL_WORDS:
+        return [_finding("about.no_goals", tokens, _IMPROVEMENT_MESSAGES["about"]["no_goals"])]
+    return []
+
+@profile_lint_rule("experience.no_metrics", "experience")
+def _lint_experience_no_metrics(tokens: SectionTokens) -> List[Dict]:
+    if tokens.words & METRIC_WORDS or any("%" in word for word in tokens.words):
+        return []
+    return [_finding("experience.no_metrics", tokens, _IMPROVEMENT_MESSAGES["experience"]["no_metrics"])]
+
+@profile_lint_rule("experience.no_tech_stack", "experience")
+def _lint_experience_no_tech_stack(tokens: SectionTokens) -> List[Dict]:
+    if tokens.technologies:
+        return []
+    return [_finding("experience.no_tech_stack", tokens, _IMPROVEMENT_MESSAGES["experience"]["no_tech_stack"])]
+
+@profile_lint_rule("experience.vague_responsibilities", "experience")
+def _lint_vague_responsibilities(tokens: SectionTokens) -> List[Dict]:
+    findings = []
+    for start, end, bullet in tokens.bullets():
+        bullet = bullet.lower()
+        if bullet.startswith(VAGUE_PHRASES) or len(bullet.split()) < 4:
+            findings.append(_finding("experience.vague_responsibilities", tokens,
+                                     _IMPROVEMENT_MESSAGES["experience"]["vague_responsibilities"], start, end))
+    return findings
+
+@profile_lint_rule("experience.low_technical_depth", "experience")
+def _lint_low_technical_depth(tokens: SectionTokens) -> List[Dict]:
+    """Score each bullet like calculate_technical_depth, from the shared token stream"""
+    findings = []
+    for start, end, _ in tokens.bullets():
+        words = set(tokens.tokens_between(start, end))
+        tech_terms = tokens.technologies_between(start, end)
+        score = min(tech_terms * 0.2, 0.4) + min(tokens.metrics_between(start, end) * 0.2, 0.3)
+        score += 0.15 if words & PROBLEM_WORDS else 0
+        score += 0.15 if words & SOLUTION_WORDS else 0
+        if score < 0.7:
+            findings.append(_finding("experience.low_technical_depth", tokens,
+                                     f"Add technical detail or a metric (depth {min(score, 1.0):.2f} of 0.70).", start, end))
+    return findings
+
+@profile_lint_rule("skills.too_few", "skills")
+def _lint_skills_too_few(tokens: SectionTokens) -> List[Dict]:
+    if len(tokens.lines) < 10:
+        return [_finding("skills.too_few", tokens, "Add more relevant skills to increase profile visibility")]
+    return []
+
+# Sections every profile is linted for. A missing one is linted as empty, so its rules report it;
+# a missing entry section (a list) just has no entries.
+PROFILE_LINT_SECTIONS = {"headline": "", "about": "", "experience": [], "skills": ""}
+
+class ProfileLinter:
+    """Run every registered rule over each profile section, tokenizing each section once"""
+    
+    def __init__(self, rules: Optional[Iterable[str]] = None):
+        selected = PROFILE_LINT_RULES if rules is None else {rule: PROFILE_LINT_RULES[rule] for rule in rules}
+        self._rules_by_section = {}
+        for rule_id, (sections, check) in selected.items():
+            for section in sections:
+                self._rules_by_section.setdefault(section, []).append((rule_id, check))
+        self.rule_seconds = Counter()
+        self.rule_calls = Counter()
+    
+    def _lint_section(self, section: str, text: str, entry: Optional[int] = None) -> List[Dict]:
+        rules = self._rules_by_section.get(section)
+        if not rules:
+            return []
+        tokens = SectionTokens(section, text)
+        findings = []
+        for rule_id, check in rules:
+            start = time.perf_counter()
+            found = check(tokens)
+            self.rule_seconds[rule_id] += time.perf_counter() - start
+            self.rule_calls[rule_id] += 1
+            if entry is not None:
+                for finding in found:
+                    finding["entry"] = entry
+            findings.extend(found)
+        return findings
+    
+    def lint_section(self, section: str, content) -> List[Dict]:
+        """Lint one section's text, or each entry of an entry section"""
+        if isinstance(content, list):
+            return [finding for entry, text in enumerate(content) for finding in self._lint_section(section, text, entry)]
+        return self._lint_section(section, content or "")
+    
+    def lint(self, profile: Dict[str, any]) -> List[Dict]:
+        """Lint a profile as produced by generate_profile_sections, including its missing sections"""
+        findings = []
+        for section, content in {**PROFILE_LINT_SECTIONS, **profile}.items():
+            findings.extend(self.lint_section(section, content))
+        return findings
+    
+    def lint_batch(self, profiles: Iterable[Dict[str, any]]) -> Iterator[List[Dict]]:
+        """Lint a cohort of profiles, yielding findings per profile"""
+        for profile in profiles:
+            yield self.lint(profile)
+    
+    def rule_costs(self) -> Dict[str, Dict[str, float]]:
+        """Total and per-call evaluation time for each rule, most expensive first"""
+        return {
+            rule_id: {
+                "calls": self.rule_calls[rule_id],
+                "total_ms": round(seconds * 1000, 3),
+                "per_call_us": round(seconds * 1e6 / self.rule_calls[rule_id], 2)
+            }
+            for rule_id, seconds in self.rule_seconds.most_common()
+        }
+
+@lru_cache(maxsize=None)
+def get_profile_linter() -> ProfileLinter:
+    """The process-wide linter behind the profile suggestion helpers, so rule costs accumulate in one place"""
+    return ProfileLinter()
+
+def lint_messages(findings: List[Dict], wording: Optional[Dict[str, str]] = None) -> List[str]:
+    """One message per rule, from the rule's first finding or the rule's entry in wording"""
+    messages = {}
+    for finding in findings:
+        messages.setdefault(finding["rule"], (wording or {}).get(finding["rule"], finding["message"]))
+    return list(messages.values())
 
 def get_next_prompt(current_state: str, user_input: str = None) -> str:
     """Get the next conversation prompt based on current state and user input"""
@@ -835,40 +2012,514 @@ def get_next_prompt(current_state: str, user_input: str = None) -> str:
 
 def generate_improvement_suggestions(section: str, content: str) -> List[str]:
     """Generate specific improvement suggestions for profile sections"""
-    suggestions = []
-    templates = CONVERSATION_TEMPLATES["improvement_suggestions"]
-    
-    if section in templates:
-        section_templates = templates[section]
-        
-        if section == "headline":
-            if len(content) < 50:
-                suggestions.append(section_templates["too_short"])
-            if not any(tech in content for tech in TECH_KEYWORDS["languages"] + TECH_KEYWORDS["frameworks"]):
-                suggestions.append(section_templates["no_tech"])
-                
-        elif section == "about":
-            if len(content) < 200:
-                suggestions.append(section_templates["too_short"])
-            if "achieve" not in content.lower():
-                suggestions.append(section_templates["no_achievements"])
-                
-        elif section == "experience":
-            if not any(metric in content.lower() for metric in ["%", "increased", "improved", "reduced"]):
-                suggestions.append(section_templates["no_metrics"])
-            if not any(tech in content for tech in TECH_KEYWORDS["languages"] + TECH_KEYWORDS["frameworks"]):
-                suggestions.append(section_templates["no_tech_stack"])
-    
-    return suggestions
+    return lint_messages(get_profile_linter().lint_section(section, content))
+
+# Precompiled role matchers and message formatters shared by single and bulk outreach
+_RECRUITER_ROLE_PATTERN = re.compile(r"\b(?:recruit\w*|talent)\b", re.IGNORECASE)
+_SENIOR_ROLE_PATTERN = re.compile(r"\b(?:senior|lead|principal|staff)\b", re.IGNORECASE)
+_EARLY_CAREER_ROLE_PATTERN = re.compile(r"\b(?:intern|internship|student|junior|trainee|apprentice)\b", re.IGNORECASE)
+_CONNECTION_FORMATTERS = {category: template.format for category, template in CONNECTION_MESSAGE_TEMPLATES.items()}
+
+def classify_contact_role(role: str) -> str:
+    """Classify a contact's role as recruiter, senior or peer
+    
+    Seniority words only count as whole words, and never for interns, students or
+    juniors ("Team Lead Intern" is a peer).
+    """
+    if _RECRUITER_ROLE_PATTERN.search(role):
+        return "recruiter"
+    if _SENIOR_ROLE_PATTERN.search(role) and not _EARLY_CAREER_ROLE_PATTERN.search(role):
+        return "senior"
+    return "peer"
+
+def _sender_fields(user_context: Dict[str, str]) -> Dict[str, str]:
+    """Resolve the sender fields used by the connection message templates once"""
+    tech_stack = user_context.get("tech_stack") or ["Python", "JavaScript"]
+    interests = user_context.get("interests") or ["software development"]
+    return {
+        "specialization": user_context.get("specialization") or "software development",
+        "technology": tech_stack[0],
+        "interest": interests[0]
+    }
 
 def generate_connection_message(target_info: Dict[str, str], user_context: Dict[str, str]) -> str:
     """Create personalized connection request messages"""
-    if target_info.get("role", "").lower() in ["recruiter", "talent"]:
-        return f"Hi {target_info.get('name', '')}, I'm a CS student focusing on {user_context.get('specialization', 'software development')}. I'm interested in {target_info.get('company', 'your company')}'s opportunities and would love to connect."
-    elif any(level in target_info.get("role", "").lower() for level in ["senior", "lead", "principal"]):
-        return f"Hi {target_info.get('name', '')}, I'm a CS student building projects with {user_context.get('tech_stack', ['Python', 'JavaScript'])[0]}. Your work at {target_info.get('company', 'your company')} is inspiring, and I'd appreciate connecting to learn from your journey."
+    category = classify_contact_role(target_info.get("role", ""))
+    return _CONNECTION_FORMATTERS[category](
+        name=target_info.get("name", ""),
+        company=target_info.get("company") or "your company",
+        **_sender_fields(user_context)
+    )
+
+def normalize_contact(row: Dict[str, any]) -> Dict[str, str]:
+    """Map a contact export row (CSV or JSON) onto name, role, company and skills"""
+    fields = {}
+    for key, value in row.items():
+        if not key or value is None:
+            continue
+        if isinstance(value, list):
+            value = ", ".join(str(item) for item in value)
+        fields[key.strip().lower().replace(" ", "_")] = str(value).strip()
+    
+    name = fields.get("name") or fields.get("full_name") or " ".join(
+        part for part in (fields.get("first_name"), fields.get("last_name")) if part
+    )
+    contact = {
+        "name": name,
+        "role": fields.get("role") or fields.get("title") or fields.get("position", ""),
+        "company": fields.get("company") or fields.get("organization", ""),
+        "skills": fields.get("skills", "")
+    }
+    return {key: value for key, value in contact.items() if value}
+
+def _skip_export_notes(lines: Iterable[str]) -> Iterator[str]:
+    """Skip the "Notes:" preamble LinkedIn puts above the header of some exports"""
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        return
+    if first.startswith("Notes:"):
+        for line in lines:
+            if not line.strip():
+                break
+    else:
+        yield first
+    yield from lines
+
+def iter_contact_rows(path: str) -> Iterator[Dict[str, str]]:
+    """Stream normalized contacts from a CSV or JSONL export"""
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield normalize_contact(json.loads(line))
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(_skip_export_notes(f)):
+                yield normalize_contact(row)
+
+BULK_DEDUP_CAPACITY = 1_000_000   # contacts the dedup filter is sized for
+BULK_DEDUP_ERROR_RATE = 1e-4      # chance a new contact is mistaken for a duplicate, up to capacity
+
+class SeenFilter:
+    """Fixed-size Bloom filter for deduplicating streams too large for an exact set
+    
+    Memory is set by capacity and error rate (about 2.4 MB for the bulk defaults).
+    Past capacity the false positive rate climbs; a false positive is counted as a
+    duplicate and skipped.
+    """
+    
+    def __init__(self, capacity: int = BULK_DEDUP_CAPACITY, error_rate: float = BULK_DEDUP_ERROR_RATE):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    @staticmethod
+    def _probe(key: bytes) -> Tuple[int, int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+    
+    def __contains__(self, key: bytes) -> bool:
+        """Whether key was (probably) added, without adding it"""
+        first, step = self._probe(key)
+        for i in range(self.hashes):
+            bit = (first + i * step) % self.size
+            if not self._bits[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+    
+    def add(self, key: bytes) -> bool:
+        """Add key and return whether it was (probably) seen before"""
+        first, step = self._probe(key)
+        bits, seen = self._bits, True
+        for i in range(self.hashes):
+            bit = (first + i * step) % self.size
+            mask = 1 << (bit & 7)
+            if not bits[bit >> 3] & mask:
+                bits[bit >> 3] |= mask
+                seen = False
+        return seen
+
+def generate_bulk_connection_messages(targets: Iterable[Dict[str, str]], user_context: Dict[str, str],
+                                      stats: Optional[Dict[str, int]] = None,
+                                      dedup_capacity: int = BULK_DEDUP_CAPACITY) -> Iterator[Dict[str, str]]:
+    """Draft connection messages for a stream of targets, skipping duplicate people
+    
+    Duplicates are tracked in a SeenFilter sized for dedup_capacity contacts, so memory
+    stays fixed however long the stream is.
+    """
+    if stats is None:
+        stats = {}
+    for key in ("read", "written", "duplicates", "skipped"):
+        stats.setdefault(key, 0)
+    
+    sender = _sender_fields(user_context)
+    seen = SeenFilter(dedup_capacity)
+    for target in targets:
+        stats["read"] += 1
+        name = target.get("name", "")
+        if not name:
+            stats["skipped"] += 1
+            continue
+        company = target.get("company", "")
+        if seen.add(f"{name.lower()}|{company.lower()}".encode()):
+            stats["duplicates"] += 1
+            continue
+        
+        category = classify_contact_role(target.get("role", ""))
+        stats["written"] += 1
+        yield {
+            "name": name,
+            "company": company,
+            "role": target.get("role", ""),
+            "category": category,
+            "message": _CONNECTION_FORMATTERS[category](name=name, company=company or "your company", **sender)
+        }
+
+def write_bulk_connection_messages(input_path: str, output_path: str, user_context: Dict[str, str]) -> Dict[str, int]:
+    """Stream targets from a CSV/JSONL export and write drafted messages incrementally"""
+    stats = {}
+    records = generate_bulk_connection_messages(iter_contact_rows(input_path), user_context, stats)
+    with open(output_path, "w", newline="", encoding="utf-8") as out:
+        if output_path.endswith(".csv"):
+            writer = csv.DictWriter(out, fieldnames=["name", "company", "role", "category", "message"])
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+        else:
+            for record in records:
+                out.write(json.dumps(record) + "\n")
+    return stats
+
+# LinkedIn account data export: the files that map onto profile_data, by lowercase file name
+LINKEDIN_EXPORT_FILES = {
+    "profile.csv": "profile",
+    "positions.csv": "positions",
+    "education.csv": "education",
+    "skills.csv": "skills",
+    "projects.csv": "projects"
+}
+SOFT_SKILLS = frozenset([
+    "communication", "leadership", "teamwork", "team leadership", "public speaking", "mentoring",
+    "problem solving", "critical thinking", "time management", "project management", "collaboration",
+    "presentation skills", "negotiation", "writing", "research"
+])
+_EXPORT_DATE_FORMATS = ("%b %Y", "%B %Y", "%m/%Y", "%Y-%m", "%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%d %b %Y", "%Y")
+_RESPONSIBILITY_SPLIT_PATTERN = re.compile(r"\n+\s*[-•*]?\s*|(?<=[.!?])\s+(?=[A-Z])")
+
+def normalize_export_date(value: str) -> str:
+    """Normalize an export date ("Jun 2023", "06/2023", "2023") to YYYY-MM, or YYYY when only a year is given"""
+    value = (value or "").strip()
+    for date_format in _EXPORT_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        return parsed.strftime("%Y" if date_format == "%Y" else "%Y-%m")
+    return value
+
+def _export_duration(started: str, finished: str) -> str:
+    start, end = normalize_export_date(started), normalize_export_date(finished)
+    if not start:
+        return end
+    return f"{start} to {end or 'present'}"
+
+def iter_export_files(source: str) -> Iterator[Tuple[str, Iterator[Dict[str, str]]]]:
+    """Stream (kind, rows) for each known CSV in an export zip or directory"""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for name in archive.namelist():
+                kind = LINKEDIN_EXPORT_FILES.get(os.path.basename(name).lower())
+                if kind:
+                    with archive.open(name) as raw:
+                        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+                        yield kind, csv.DictReader(_skip_export_notes(text))
+    else:
+        for name in sorted(os.listdir(source)):
+            kind = LINKEDIN_EXPORT_FILES.get(name.lower())
+            if kind:
+                with open(os.path.join(source, name), newline="", encoding="utf-8-sig") as f:
+                    yield kind, csv.DictReader(_skip_export_notes(f))
+
+def _export_field(row: Dict[str, str], *names: str) -> str:
+    for name in names:
+        value = row.get(name)
+        if value:
+            return value.strip()
+    return ""
+
+def validate_imported_profile(profile_data: Dict[str, any]) -> Dict[str, List[str]]:
+    """Essential PROFILE_SECTIONS fields an imported profile still lacks, by section"""
+    missing = {}
+    headline = [field for field in PROFILE_SECTIONS["headline"]["essential"] if not profile_data.get(field)]
+    if headline:
+        missing["headline"] = headline
+    education = profile_data.get("education")
+    if education:
+        fields = [field for field in PROFILE_SECTIONS["education"]["essential"] if not education.get(field)]
+        if fields:
+            missing["education"] = fields
     else:
-        return f"Hi {target_info.get('name', '')}, I'm a CS student interested in {user_context.get('interests', ['software development'])[0]}. I noticed you work with similar technologies at {target_info.get('company', 'your company')}. Would love to connect and learn from your experience!"
+        missing["education"] = list(PROFILE_SECTIONS["education"]["essential"])
+    for index, experience in enumerate(profile_data.get("experiences", [])):
+        fields = [field for field in PROFILE_SECTIONS["experience"]["essential"] if not experience.get(field)]
+        if fields:
+            missing[f"experience[{index}]"] = fields
+    return missing
+
+def import_linkedin_export(source: str, today: Optional[datetime] = None) -> Dict[str, any]:
+    """Build profile_data from a LinkedIn data export in one pass over its CSVs
+    
+    Returns {"source", "profile_data", "missing"}, where missing lists the essential
+    PROFILE_SECTIONS fields the export could not supply.
+    """
+    today = today or datetime.now()
+    profile_data = {"experiences": [], "projects": [], "skills": {"technical": [], "soft": [], "domain": []}}
+    schools = []
+    for kind, rows in iter_export_files(source):
+        for row in rows:
+            if kind == "profile":
+                name = " ".join(filter(None, [_export_field(row, "First Name"), _export_field(row, "Last Name")]))
+                headline = _export_field(row, "Headline")
+                summary = _export_field(row, "Summary")
+                profile_data.update({key: value for key, value in {
+                    "name": name, "headline_text": headline, "industry": _export_field(row, "Industry"),
+                    "technical_focus": summary
+                }.items() if value})
+                profile_data.update(extract_headline_fields(headline))
+            elif kind == "positions":
+                description = _export_field(row, "Description")
+                profile_data["experiences"].append({
+                    "company": _export_field(row, "Company Name", "Company"),
+                    "role": _export_field(row, "Title"),
+                    "duration": _export_duration(_export_field(row, "Started On"), _export_field(row, "Finished On")),
+                    "started": normalize_export_date(_export_field(row, "Started On")),
+                    "description": description,
+                    "responsibilities": [part.strip(" -•*") for part in _RESPONSIBILITY_SPLIT_PATTERN.split(description)
+                                         if part.strip(" -•*")],
+                    "tech_stack": extract_technologies(description)
+                })
+            elif kind == "education":
+                degree, _, field = _export_field(row, "Degree Name", "Degree").partition(",")
+                schools.append({
+                    "institution": _export_field(row, "School Name", "School"),
+                    "degree": degree.strip(),
+                    "field": field.strip() or _export_field(row, "Field Of Study"),
+                    "graduation_date": normalize_export_date(_export_field(row, "End Date", "Finished On")),
+                    "started": normalize_export_date(_export_field(row, "Start Date", "Started On")),
+                    "activities": _export_field(row, "Activities")
+                })
+            elif kind == "skills":
+                skill = _export_field(row, "Name", "Skill")
+                if not skill:
+                    continue
+                if skill.lower() in SOFT_SKILLS:
+                    category = "soft"
+                elif find_technologies(skill):
+                    category = "technical"
+                else:
+                    category = "domain"
+                profile_data["skills"][category].append(skill)
+            elif kind == "projects":
+                description = _export_field(row, "Description")
+                profile_data["projects"].append({
+                    "name": _export_field(row, "Title"),
+                    "description": description,
+                    "url": _export_field(row, "Url", "URL"),
+                    "duration": _export_duration(_export_field(row, "Started On"), _export_field(row, "Finished On")),
+                    "tech_stack": extract_technologies(description)
+                })
+    
+    profile_data["experiences"].sort(key=lambda experience: experience["started"], reverse=True)
+    if schools:
+        # The school finishing last is the one the profile's education section describes
+        education = max(schools, key=lambda school: school["graduation_date"])
+        profile_data["education"] = education
+        profile_data["institution"] = education["institution"]
+        graduation = education["graduation_date"]
+        if graduation:
+            # Compare at the export's precision, so a bare year counts as the whole year
+            now = today.strftime("%Y-%m")[:len(graduation)]
+            year_ago = f"{today.year - 1}{today.strftime('-%m')}"[:len(graduation)]
+            if graduation > now:
+                profile_data["status"] = "student"
+            elif graduation >= year_ago:
+                profile_data["status"] = "recent_grad"
+    if not profile_data.get("key_technology"):
+        stack = Counter(tech for entry in profile_data["experiences"] + profile_data["projects"] for tech in entry["tech_stack"])
+        stack.update(profile_data["skills"]["technical"])
+        if stack:
+            profile_data["key_technology"] = stack.most_common(1)[0][0]
+    return {"source": source, "profile_data": profile_data, "missing": validate_imported_profile(profile_data)}
+
+def iter_export_sources(root: str) -> Iterator[str]:
+    """Each export under root: zip files and directories that contain a known export CSV"""
+    for directory, subdirectories, files in os.walk(root):
+        lowercase = {name.lower() for name in files}
+        if lowercase & LINKEDIN_EXPORT_FILES.keys():
+            subdirectories[:] = []
+            yield directory
+        for name in sorted(files):
+            if name.lower().endswith(".zip"):
+                yield os.path.join(directory, name)
+
+def import_linkedin_exports(root: str, output_path: str, cohort: Optional[str] = None) -> Dict[str, int]:
+    """Bulk mode: import every export under root into JSONL profile_data, one line per export"""
+    stats = {"exports": 0, "complete": 0, "failed": 0}
+    with open(output_path, "w", encoding="utf-8") as out:
+        for source in iter_export_sources(root):
+            try:
+                imported = import_linkedin_export(source)
+            except (OSError, zipfile.BadZipFile, csv.Error, UnicodeDecodeError):
+                stats["failed"] += 1
+                continue
+            stats["exports"] += 1
+            stats["complete"] += not imported["missing"]
+            record = dict(imported["profile_data"], source=source, missing=imported["missing"])
+            if cohort:
+                record["cohort"] = cohort
+            out.write(json.dumps(record) + "\n")
+    return stats
+
+class ContactIndex:
+    """Inverted index over a contact export for ranking contacts against a user's stack
+    
+    Contacts with the same set of matched terms share a signature, so postings map
+    terms to signatures and a query scores each distinct signature once.
+    """
+    
+    TERM_GROUPS = ("tech", "role", "level", "specialization")
+    
+    def __init__(self):
+        self.contacts = []        # (name, role, company) per contact id
+        self.term_ids = {}        # (group, canonical term) -> term id
+        self.terms = []           # term id -> (group, canonical term)
+        self.postings = {}        # term id -> array of signature ids
+        self.signature_ids = {}   # frozenset of term ids -> signature id
+        self.signature_terms = [] # signature id -> term ids
+        self.members = []         # signature id -> array of contact ids
+        self._matchers = {
+            "tech": _TECH_MATCHER,
+            "role": compile_term_matcher(NETWORK_TARGETS["technical"]["roles"] + NETWORK_TARGETS["recruitment"]["roles"]),
+            "level": compile_term_matcher(NETWORK_TARGETS["technical"]["levels"]),
+            "specialization": compile_term_matcher(NETWORK_TARGETS["technical"]["specializations"])
+        }
+    
+    @classmethod
+    def from_export(cls, path: str) -> "ContactIndex":
+        """Build an index from a CSV or JSONL contact export"""
+        index = cls()
+        for contact in iter_contact_rows(path):
+            index.add_contact(contact)
+        return index
+    
+    def _term_id(self, group: str, term: str) -> int:
+        key = (group, term)
+        term_id = self.term_ids.get(key)
+        if term_id is None:
+            term_id = self.term_ids[key] = len(self.terms)
+            self.terms.append(key)
+            self.postings[term_id] = array("I")
+        return term_id
+    
+    def _match_terms(self, group: str, text: str) -> set:
+        if group == "tech":
+            return set(find_technologies(text))
+        pattern, canonical = self._matchers[group]
+        return {canonical[match.lower()] for match in pattern.findall(text)}
+    
+    def add_contact(self, contact: Dict[str, str]) -> int:
+        """Index one normalized contact and return its id"""
+        contact_id = len(self.contacts)
+        role = contact.get("role", "")
+        self.contacts.append((contact.get("name", ""), role, contact.get("company", "")))
+        
+        text = " ".join((role, contact.get("company", ""), contact.get("skills", "")))
+        term_ids = frozenset(
+            self._term_id(group, term)
+            for group in self.TERM_GROUPS
+            for term in self._match_terms(group, role if group == "level" else text)
+        )
+        signature_id = self.signature_ids.get(term_ids)
+        if signature_id is None:
+            signature_id = self.signature_ids[term_ids] = len(self.signature_terms)
+            self.signature_terms.append(tuple(sorted(term_ids)))
+            self.members.append(array("I"))
+            for term_id in term_ids:
+                self.postings[term_id].append(signature_id)
+        self.members[signature_id].append(contact_id)
+        return contact_id
+    
+    def __len__(self) -> int:
+        return len(self.contacts)
+    
+    def _canonical_term(self, group: str, value: str) -> str:
+        if group == "tech" and get_skill_taxonomy() is not None:
+            skill = get_skill_taxonomy().lookup(value)
+            if skill:
+                return skill[0]
+        return self._matchers[group][1].get(value.lower(), value)
+    
+    def _query_term_ids(self, group: str, values: Iterable[str]) -> List[int]:
+        term_ids = []
+        for value in values:
+            term_id = self.term_ids.get((group, self._canonical_term(group, value)))
+            if term_id is not None:
+                term_ids.append(term_id)
+        return term_ids
+    
+    def top_contacts(self, stack: Iterable[str], k: int = 10, roles: Iterable[str] = (),
+                     levels: Iterable[str] = (), specializations: Iterable[str] = ()) -> List[Dict]:
+        """Return the k contacts with the most overlap with the stack and target filters"""
+        query_ids = set(self._query_term_ids("tech", stack)
+                        + self._query_term_ids("role", roles)
+                        + self._query_term_ids("level", levels)
+                        + self._query_term_ids("specialization", specializations))
+        scores = Counter()
+        for term_id in query_ids:
+            scores.update(self.postings[term_id])
+        
+        # Pull signatures best-first from a heap until k contacts are collected
+        heap = [(-score, signature_id) for signature_id, score in scores.items()]
+        heapq.heapify(heap)
+        results = []
+        while heap and len(results) < k:
+            negative_score, signature_id = heapq.heappop(heap)
+            matched = [self.terms[term_id][1] for term_id in self.signature_terms[signature_id] if term_id in query_ids]
+            for contact_id in self.members[signature_id][:k - len(results)]:
+                name, role, company = self.contacts[contact_id]
+                results.append({
+                    "name": name,
+                    "role": role,
+                    "company": company,
+                    "score": -negative_score,
+                    "matched": matched
+                })
+        return results
+
+def load_contact_index(path: str) -> ContactIndex:
+    """Load and cache the contact index for an export path, rebuilding it when the file changes"""
+    stat = os.stat(path)
+    return _load_contact_index(path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4)
+def _load_contact_index(path: str, mtime_ns: int, size: int) -> ContactIndex:
+    return ContactIndex.from_export(path)
+
+def suggest_contacts_from_export(messages: List[Dict], k: int = 5) -> str:
+    """Describe the best-matching contacts from the user's export for Phase 1 suggestions"""
+    path = os.environ.get("LINKEDINBUILDR_CONTACTS")
+    if not path or not os.path.exists(path):
+        return ""
+    user_text = " ".join(m.get("content", "") for m in messages if m.get("role", "user") == "user")
+    stack = extract_technologies(user_text)
+    if not stack:
+        return ""
+    contacts = load_contact_index(path).top_contacts(stack, k=k)
+    if not contacts:
+        return ""
+    lines = [f"- {c['name']}, {c['role']} at {c['company']} (shared: {', '.join(c['matched'])})" for c in contacts]
+    return "Contacts from the user's own network that match their stack (suggest these in Phase 1):\n" + "\n".join(lines)
 
 def suggest_engagement_plan(technical_interests: List[str], career_goals: str) -> Dict:
     """Create weekly engagement strategy"""
@@ -911,6 +2562,27 @@ def validate_achievement(achievement: Dict) -> Dict:
     
     return validated
 
+# Metric names are matched separately from their values so a scan never backtracks
+# over the rest of the description (the old "metric.*?number" pattern was quadratic)
+_METRIC_NAME_PATTERNS = {}  # metric -> case-insensitive name pattern, set by install_derived_indexes
+_METRIC_VALUE_PATTERN = re.compile(r"[0-9]+(?:\.[0-9]+)?%?")
+
+def _first_metric_value(metric_pattern: re.Pattern, description: str) -> Optional[str]:
+    """Return the first number following a metric name on the same line, in linear time"""
+    position = 0
+    while True:
+        mention = metric_pattern.search(description, position)
+        if not mention:
+            return None
+        line_end = description.find("\n", mention.end())
+        if line_end == -1:
+            line_end = len(description)
+        value = _METRIC_VALUE_PATTERN.search(description, mention.end(), line_end)
+        if value:
+            return value.group()
+        # Later mentions on this line have even less text after them, so skip the line
+        position = line_end + 1
+
 def extract_metrics(achievement: Dict) -> List[Dict]:
     """Extract quantifiable metrics from achievement description"""
     metrics = []
@@ -919,13 +2591,11 @@ def extract_metrics(achievement: Dict) -> List[Dict]:
     # Look for numerical metrics
     for project_type in TECHNICAL_CONTEXT["project_types"]:
         for metric in TECHNICAL_CONTEXT["project_types"][project_type]["key_metrics"]:
-            # Use regex to find metrics in description
-            pattern = f"(?i){metric}.*?([0-9]+(?:\\.[0-9]+)?%?)"
-            matches = re.findall(pattern, description)
-            if matches:
+            value = _first_metric_value(_METRIC_NAME_PATTERNS[metric], description)
+            if value:
                 metrics.append({
                     "type": metric,
-                    "value": matches[0],
+                    "value": value,
                     "context": project_type
                 })
     
@@ -951,8 +2621,7 @@ def calculate_technical_depth(achievement: Dict) -> float:
     description = achievement.get("description", "").lower()
     
     # Check for technical terms
-    tech_term_count = sum(1 for tech in TECH_KEYWORDS["languages"] + TECH_KEYWORDS["frameworks"] 
-                         if tech.lower() in description)
+    tech_term_count = count_technical_terms(description)
     
     # Check for metrics
     metrics = extract_metrics(achievement)
@@ -974,7 +2643,7 @@ def suggest_technical_details(achievement: Dict) -> List[str]:
     suggestions = []
     description = achievement.get("description", "").lower()
     
-    if not any(tech.lower() in description for tech in TECH_KEYWORDS["languages"] + TECH_KEYWORDS["frameworks"]):
+    if not count_technical_terms(description):
         suggestions.append("Specify the technologies/frameworks used")
     
     if not extract_metrics(achievement):
@@ -1011,10 +2680,10 @@ def assess_skill_level(profile_data: Dict) -> Dict:
     
     for exp in experiences + projects:
         description = exp.get("description", "").lower()
-        for level, details in SKILL_PROGRESSION["levels"].items():
+        for level, indicator_keywords in _SKILL_INDICATOR_KEYWORDS.items():
             # Count matching indicators
-            indicators = sum(1 for ind in details["indicators"] 
-                          if any(keyword in description for keyword in ind.split("_")))
+            indicators = sum(1 for keywords in indicator_keywords
+                          if any(keyword in description for keyword in keywords))
             level_scores[level] += indicators
     
     # Determine overall level
@@ -1085,6 +2754,1056 @@ def suggest_skill_improvements(assessment: Dict) -> List[str]:
     
     return suggestions
 
+_TONE_REQUEST_PATTERNS = {
+    "formal": re.compile(r"\b(?:formal|professional)\b", re.IGNORECASE),
+    "narrative": re.compile(r"\b(?:narrative|story|storytelling)\b", re.IGNORECASE),
+    "balanced": re.compile(r"\b(?:balanced|casual|conversational)\b", re.IGNORECASE)
+}
+# An explicit reference to an earlier post, not "my last project" or "same as before but for my internship"
+_PREVIOUS_POST_PATTERN = re.compile(
+    r"\b(?:(?:previous|earlier|last|same|that)\s+post|post\s+(?:from\s+)?(?:before|earlier)|re-?render)\b",
+    re.IGNORECASE
+)
+
+def detect_tone_style(text: str) -> Optional[str]:
+    """Detect a requested TONE_STYLES key in user text"""
+    for tone_style, pattern in _TONE_REQUEST_PATTERNS.items():
+        if pattern.search(text):
+            return tone_style
+    return None
+
+class ArtifactStore:
+    """Content-addressed SQLite store for generated posts and profile sections
+    
+    Artifacts are keyed by a hash of their kind and structured inputs, so the same
+    post or profile is stored once however many users or threads produce it.
+    References record which thread and user asked for each artifact.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS artifacts (
+            hash TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            inputs TEXT NOT NULL,
+            output TEXT NOT NULL,
+            created REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS artifact_refs (
+            hash TEXT NOT NULL REFERENCES artifacts (hash),
+            thread_id TEXT NOT NULL DEFAULT '',
+            user_id TEXT NOT NULL DEFAULT '',
+            kind TEXT NOT NULL,
+            created REAL NOT NULL,
+            PRIMARY KEY (hash, thread_id, user_id)
+        );
+        CREATE INDEX IF NOT EXISTS artifact_refs_by_thread ON artifact_refs (thread_id, kind, created);
+        CREATE INDEX IF NOT EXISTS artifact_refs_by_user ON artifact_refs (user_id, kind, created);
+    """
+    
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(self.SCHEMA)
+        self.stats = {"hits": 0, "renders": 0}
+    
+    @staticmethod
+    def artifact_hash(kind: str, inputs: Dict[str, any]) -> str:
+        payload = json.dumps({"kind": kind, "inputs": inputs}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, artifact_hash: str) -> Optional[Dict[str, any]]:
+        with self._lock:
+            row = self._db.execute("SELECT kind, inputs, output FROM artifacts WHERE hash = ?", (artifact_hash,)).fetchone()
+        if row is None:
+            return None
+        return {"hash": artifact_hash, "kind": row[0], "inputs": json.loads(row[1]), "output": json.loads(row[2])}
+    
+    def _get_or_render(self, kind: str, inputs: Dict[str, any], render, thread_id: str, user_id: str) -> Tuple[str, any]:
+        artifact_hash = self.artifact_hash(kind, inputs)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT output FROM artifacts WHERE hash = ?", (artifact_hash,)).fetchone()
+            self.stats["renders" if row is None else "hits"] += 1
+        if row is not None:
+            output = json.loads(row[0])
+        else:
+            output = render()
+            with self._lock, self._db:
+                self._db.execute("INSERT OR IGNORE INTO artifacts VALUES (?, ?, ?, ?, ?)",
+                                 (artifact_hash, kind, json.dumps(inputs, sort_keys=True), json.dumps(output), now))
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO artifact_refs VALUES (?, ?, ?, ?, ?)",
+                             (artifact_hash, thread_id or "", user_id or "", kind, now))
+        return artifact_hash, output
+    
+    def render_post(self, post_data: Dict[str, any], activity_type: str, tone_style: str = "balanced",
+                    thread_id: str = "", user_id: str = "") -> Tuple[str, str]:
+        """Return (hash, text) for a post, rendering with format_post only on a miss"""
+        missing = check_missing_info(activity_type, post_data)
+        if missing["essential"]:
+            # Requests for missing information are not artifacts worth keeping
+            return "", generate_info_request(missing, activity_type)
+        inputs = {"post_data": post_data, "activity_type": activity_type, "tone_style": tone_style}
+        return self._get_or_render("post", inputs, lambda: format_post(post_data, activity_type, tone_style),
+                                   thread_id, user_id)
+    
+    def rerender_post(self, artifact_hash: str, tone_style: str, thread_id: str = "", user_id: str = "") -> Optional[Tuple[str, str]]:
+        """Render a stored post again in another tone"""
+        artifact = self.get(artifact_hash)
+        if artifact is None or artifact["kind"] != "post":
+            return None
+        inputs = artifact["inputs"]
+        return self.render_post(inputs["post_data"], inputs["activity_type"], tone_style, thread_id, user_id)
+    
+    def history(self, thread_id: str = "", user_id: str = "", kind: Optional[str] = None, limit: int = 10) -> List[Dict[str, any]]:
+        """List artifacts for a thread or user, newest first"""
+        column, value = ("thread_id", thread_id) if thread_id else ("user_id", user_id)
+        query = f"SELECT hash FROM artifact_refs WHERE {column} = ?"
+        params = [value]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY created DESC, rowid DESC LIMIT ?"  # refs are replaced on reuse, so rowid breaks ties
+        params.append(limit)
+        with self._lock:
+            hashes = [row[0] for row in self._db.execute(query, params)]
+        return [self.get(artifact_hash) for artifact_hash in hashes]
+    
+    def latest(self, thread_id: str = "", user_id: str = "", kind: Optional[str] = None) -> Optional[Dict[str, any]]:
+        found = self.history(thread_id, user_id, kind, limit=1)
+        return found[0] if found else None
+    
+    def save_profile(self, sections: Dict[str, any], thread_id: str, user_id: str = "") -> str:
+        """Store a full profile version (parse_profile_text sections) as the thread's latest"""
+        artifact_hash, _ = self._get_or_render("profile", {"sections": sections}, lambda: render_profile_text(sections),
+                                               thread_id, user_id)
+        return artifact_hash
+    
+    def latest_profile(self, thread_id: str) -> Optional[Dict[str, any]]:
+        """Sections of the thread's latest stored profile version"""
+        found = self.latest(thread_id=thread_id, kind="profile") if thread_id else None
+        return found["inputs"]["sections"] if found else None
+
+@lru_cache(maxsize=None)
+def get_artifact_store() -> Optional[ArtifactStore]:
+    """Return the store configured by LINKEDINBUILDR_ARTIFACTS (a SQLite path), if any"""
+    path = os.environ.get("LINKEDINBUILDR_ARTIFACTS")
+    return ArtifactStore(path) if path else None
+
+def _env_identity(env) -> Tuple[str, str]:
+    """Best-effort (thread id, user id) for an environment"""
+    thread_id = getattr(env, "thread_id", None) or getattr(env, "_thread_id", None) or ""
+    user_id = getattr(env, "signer_account_id", None) or ""
+    return str(thread_id), str(user_id)
+
+def rerender_previous_post(env, messages: List[Dict]) -> str:
+    """Serve "the post from before but formal" from the artifact store"""
+    store = get_artifact_store()
+    if store is None or not messages:
+        return ""
+    request = messages[-1].get("content", "")
+    tone_style = detect_tone_style(request)
+    if not tone_style or not _PREVIOUS_POST_PATTERN.search(request):
+        return ""
+    thread_id, user_id = _env_identity(env)
+    previous = store.latest(thread_id=thread_id, kind="post") if thread_id else None
+    if previous is None and user_id:
+        previous = store.latest(user_id=user_id, kind="post")
+    if previous is None:
+        return ""
+    _, text = store.rerender_post(previous["hash"], tone_style, thread_id, user_id)
+    return text or ""
+
+# Structured post mode: the model fills post_data as JSON and format_post renders locally
+STRUCTURED_POST_STATS = Counter()
+
+def _build_post_data_prototypes(activity_prototypes: Dict[str, Dict[str, any]]) -> Dict[str, Dict[str, any]]:
+    """Activity prototypes extended with any REQUIRED_INFO fields they lack"""
+    prototypes = {}
+    for activity_type, prototype in activity_prototypes.items():
+        fields = dict(prototype)
+        requirements = REQUIRED_INFO.get(activity_type, {"essential": [], "optional": []})
+        for field in requirements["essential"] + requirements["optional"]:
+            fields.setdefault(field, "")
+        prototypes[activity_type] = fields
+    return prototypes
+
+_POST_DATA_PROTOTYPES = {}  # set by install_derived_indexes
+
+def post_data_fields(activity_type: str) -> Dict[str, any]:
+    """Empty post_data for an activity: its template plus any REQUIRED_INFO fields the template lacks"""
+    return ActivityTemplate(_POST_DATA_PROTOTYPES.get(activity_type) or _POST_DATA_PROTOTYPES[None])
+
+def structured_post_prompt(activity_type: str) -> str:
+    """System instruction asking for compact post_data JSON instead of prose"""
+    fields = post_data_fields(activity_type)
+    essential = REQUIRED_INFO.get(activity_type, {}).get("essential", [])
+    return (f"Extract the user's {activity_type.replace('_', ' ')} details. Reply with ONLY one compact JSON object, "
+            f"no prose and no code fences, with exactly these keys: {json.dumps(fields, separators=(',', ':'))}. "
+            f"Lists hold short phrases. Use \"\" or [] for anything the user has not said; never invent details. "
+            f"Essential keys: {', '.join(essential) or 'none'}.")
+
+_JSON_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_JSON_TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+_JSON_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_JSON_LITERAL_PATTERN = re.compile(r"\b(True|False|None)\b")
+
+def repair_post_json(text: str) -> Optional[Dict[str, any]]:
+    """Parse a post_data reply, locally repairing fences, stray prose, quotes, trailing commas and truncation"""
+    text = _JSON_FENCE_PATTERN.sub("", (text or "").strip())
+    start = text.find("{")
+    if start < 0:
+        return None
+    end = text.rfind("}")
+    candidate = text[start:end + 1] if end > start else text[start:]
+    try:
+        parsed = json.loads(candidate)
+        return parsed if isinstance(parsed, dict) else None
+    except ValueError:
+        pass
+    
+    STRUCTURED_POST_STATS["repairs"] += 1
+    candidate = text[start:]
+    candidate = candidate.translate({0x201c: '"', 0x201d: '"', 0x2018: "'", 0x2019: "'"})
+    if '"' not in candidate:
+        candidate = candidate.replace("'", '"')
+    candidate = _JSON_LITERAL_PATTERN.sub(lambda m: _JSON_PYTHON_LITERALS[m.group(1)], candidate)
+    
+    # Close strings, lists and objects left open by a truncated reply, in nesting order
+    closers, in_string, escaped = [], False, False
+    for position, char in enumerate(candidate):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]" and closers:
+            closers.pop()
+            if not closers:
+                candidate = candidate[:position + 1]
+                break
+    if in_string and closers:
+        candidate += '"'
+    candidate = candidate.rstrip().rstrip(",:") + "".join(reversed(closers))
+    candidate = _JSON_TRAILING_COMMA_PATTERN.sub(r"\1", candidate)
+    try:
+        parsed = json.loads(candidate)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+def _post_field_text(value) -> str:
+    """A post_data string field from whatever JSON value the model sent: lists and objects are joined flat"""
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return ", ".join(text for text in map(_post_field_text, value) if text)
+    return "" if value is None else str(value).strip()
+
+def coerce_post_data(raw: Dict[str, any], activity_type: str) -> Dict[str, any]:
+    """Fit parsed JSON onto post_data_fields: drop unknown keys and coerce each value to its field's type"""
+    post_data = post_data_fields(activity_type)
+    for field, default in post_data.items():
+        value = raw.get(field)
+        if value is None or value == "":
+            continue
+        if isinstance(default, (list, tuple)):
+            if isinstance(value, str):
+                value = [part.strip() for part in re.split(r"[;\n]|,\s+(?=[A-Z])", value)]
+            elif not isinstance(value, (list, tuple)):
+                value = [value]
+            post_data[field] = [text for text in map(_post_field_text, value) if text]
+        else:
+            post_data[field] = _post_field_text(value)
+    # format_post opens hackathons with achievements[0] while REQUIRED_INFO asks for "achievement"
+    if "achievement" in post_data:
+        if not post_data["achievement"] and post_data["achievements"]:
+            post_data["achievement"] = post_data["achievements"][0]
+        elif post_data["achievement"] and not post_data["achievements"]:
+            post_data["achievements"] = [post_data["achievement"]]
+    post_data["hashtags"] = [tag.lstrip("#") for tag in post_data["hashtags"]]
+    return post_data
+
+def _user_text(messages: List[Dict]) -> str:
+    return "\n".join(m.get("content", "") for m in messages if m.get("role", "user") == "user")
+
+def structured_posts_enabled() -> bool:
+    return os.environ.get("LINKEDINBUILDR_STRUCTURED_POSTS") != "0"
+
+# Structured mode fills post_data, so it only runs when the user is giving post details, never for follow-ups
+_POST_REQUEST_PATTERN = re.compile(r"\b(?:write|draft|create|generate|compose)\b[^.?!\n]*\bpost\b|\bpost about\b", re.IGNORECASE)
+_POST_EDIT_PATTERN = re.compile(r"\b(?:make|rewrite|change|rephrase|tweak|redo|edit)\s+(?:it|this|that|the post)\b", re.IGNORECASE)
+_INFO_REQUEST_OPENING = "To create a comprehensive post, I'll need a few key details:"  # generate_info_request
+
+# The post opener templates ask for the post's topic and details without ending in a question
+_POST_TEMPLATE_MESSAGES = frozenset(template["message"].strip() for intent, template in CONVERSATION_TEMPLATES.items()
+                                    if intent.startswith("post_") and "message" in template)
+
+def _asked_for_details(reply: str) -> bool:
+    """Whether an assistant reply asks the user for post details, as generate_info_request and the post templates do"""
+    lines = [line.strip() for line in reply.splitlines() if line.strip()]
+    return (reply.startswith(_INFO_REQUEST_OPENING) or reply.strip() in _POST_TEMPLATE_MESSAGES
+            or bool(lines) and lines[-1].endswith("?"))
+
+def wants_structured_post(messages: List[Dict], activity_type: str) -> bool:
+    """Whether this turn is a post request with details, or the answer to a request for missing details
+    
+    Questions about a draft ("why these hashtags?") and edits ("make it more technical") stay free-form,
+    and so do activities without REQUIRED_INFO, which have nothing to fill in.
+    """
+    if not structured_posts_enabled() or activity_type not in REQUIRED_INFO or len(messages) <= 2:
+        return False
+    last = messages[-1]
+    if last.get("role", "user") != "user":
+        return False
+    text = last.get("content", "")
+    if "?" in text or detect_quick_edit(text) or _POST_EDIT_PATTERN.search(text):
+        return False
+    previous = next((m.get("content", "") for m in reversed(messages[:-1]) if m.get("role") == "assistant"), "")
+    return bool(_POST_REQUEST_PATTERN.search(text)) or _asked_for_details(previous)
+
+def structured_post_request(messages: List[Dict], activity_type: str) -> List[Dict]:
+    return [{"role": "system", "content": structured_post_prompt(activity_type)}] + list(messages)
+
+def _metric_sentences(text: str, metrics: List[Dict]) -> List[str]:
+    """The user's own sentences that state one of the extracted metrics"""
+    sentences = []
+    for line in text.splitlines():
+        for sentence in _SENTENCE_PATTERN.findall(line):
+            lowered = sentence.lower()
+            if any(metric["value"] in sentence and metric["type"].lower() in lowered for metric in metrics):
+                sentences.append(sentence.strip())
+    return list(dict.fromkeys(sentences))
+
+def prepare_post_analysis(messages: List[Dict], activity_type: Optional[str] = None) -> Dict[str, any]:
+    """Local analysis of the user's turns that post rendering and post-processing consume
+    
+    `local_fields` are the post_data fields the user's words already answer (technologies, links,
+    sentences stating a metric, hashtags) and `missing` is check_missing_info over them, so once
+    the model replies only the fields neither side filled are left to check.
+    """
+    user_text = _user_text(messages)
+    activity_type = activity_type or detect_activity_type(user_text)
+    prose = _URL_PATTERN.sub(" ", user_text)  # so github.com links don't read as Git and GitHub
+    technologies = find_technologies(prose)
+    metrics = extract_metrics({"description": prose})
+    hashtags = generate_smart_hashtags(prose, activity_type)
+    links = extract_user_links(messages)
+    local_fields = {**links, "hashtags": hashtags}
+    if technologies:
+        local_fields.update(tech_stack=technologies, technologies=technologies)
+    results = _metric_sentences(prose, metrics)
+    if results:
+        local_fields.update(achievement=results[0], achievements=results)
+    return {
+        "user_text": user_text,
+        "activity_type": activity_type,
+        "technologies": technologies,
+        "metrics": metrics,
+        "links": links,
+        "hashtags": hashtags,
+        "local_fields": local_fields,
+        "missing": check_missing_info(activity_type, local_fields),
+        "tone_style": (detect_tone_style(messages[-1].get("content", "")) if messages else None) or "balanced"
+    }
+
+def structured_post(env, messages: List[Dict]) -> str:
+    """Ask the model for post_data JSON and render it locally, or return "" to fall back to prose"""
+    prepared = prepare_post_analysis(messages)
+    if not wants_structured_post(messages, prepared["activity_type"]):
+        return ""
+    reply = coalesced_completion(env, structured_post_request(messages, prepared["activity_type"]))
+    return render_structured_post(env, messages, reply, prepared)
+
+def render_structured_post(env, messages: List[Dict], reply: str, prepared: Dict[str, any]) -> str:
+    """Render a post_data reply, filling gaps from the local analysis, or return "" if it can't be parsed
+    
+    Rendered posts get the same postprocess_post pass as free-form drafts; requests for missing details don't.
+    """
+    activity_type, tone_style = prepared["activity_type"], prepared["tone_style"]
+    raw = repair_post_json(reply)
+    if raw is None:
+        STRUCTURED_POST_STATS["fallbacks"] += 1
+        return ""
+    post_data = coerce_post_data(raw, activity_type)
+    for field, value in prepared["local_fields"].items():
+        if field in post_data and not post_data[field]:
+            post_data[field] = list(value) if isinstance(value, (list, tuple)) else value
+    
+    missing = {kind: [field for field in fields if not post_data.get(field)]
+               for kind, fields in prepared["missing"].items()}
+    store = get_artifact_store()
+    if missing["essential"]:
+        text = generate_info_request(missing, activity_type)
+    elif store is not None:
+        thread_id, user_id = _env_identity(env)
+        _, text = store.render_post(post_data, activity_type, tone_style, thread_id, user_id)
+    else:
+        text = format_post(post_data, activity_type, tone_style)
+    if not text.startswith(_INFO_REQUEST_OPENING):
+        text = postprocess_post(text, messages, prepared=prepared)
+    STRUCTURED_POST_STATS["structured"] += 1
+    STRUCTURED_POST_STATS["output_tokens"] += estimate_tokens(reply)
+    STRUCTURED_POST_STATS["rendered_tokens"] += estimate_tokens(text)
+    return text
+
+# Local clean-up of model replies for posts, so over-long or untidy drafts don't cost another turn
+POST_MAX_LENGTH = 3000  # LinkedIn's post limit
+POST_MAX_HASHTAGS = 5
+POSTPROCESS_STATS = Counter()
+
+_URL_PATTERN = re.compile(r"https?://[^\s)>\]]+")
+_HASHTAG_PATTERN = re.compile(r"#([A-Za-z][\w]*)")
+_HASHTAG_LINE_PATTERN = re.compile(r"^(?:\s*#[A-Za-z]\w*[.,]?)+\s*$")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?](?=\s)")
+
+def extract_user_links(messages: List[Dict]) -> Dict[str, str]:
+    """The github_link and demo_link the user shared, latest first"""
+    links = {}
+    for message in reversed(messages or []):
+        if message.get("role", "user") != "user":
+            continue
+        for url in _URL_PATTERN.findall(message.get("content", "")):
+            url = url.rstrip(".,;")
+            key = "github_link" if "github.com" in url.lower() else "demo_link"
+            links.setdefault(key, url)
+    return links
+
+def _cap_hashtags(tags: List[str], text: str, activity_type: str, smart_tags: Optional[List[str]] = None) -> List[str]:
+    """Deduplicate hashtags and keep at most POST_MAX_HASHTAGS, preferring generate_smart_hashtags picks"""
+    unique = []
+    for tag in tags:
+        if tag.lower() not in {kept.lower() for kept in unique}:
+            unique.append(tag)
+    if len(unique) <= POST_MAX_HASHTAGS:
+        return unique
+    smart = {tag.lower() for tag in (smart_tags if smart_tags is not None else generate_smart_hashtags(text, activity_type))}
+    ranked = sorted(unique, key=lambda tag: tag.lower() not in smart)  # stable, so draft order breaks ties
+    return ranked[:POST_MAX_HASHTAGS]
+
+def _trim_to_length(sections: List[str], budget: int) -> List[str]:
+    """Drop whole sections from the end, then cut the opening at a sentence, to fit the budget"""
+    kept, used = [], 0
+    for section in sections:
+        cost = len(section) + (2 if kept else 0)
+        if used + cost > budget:
+            break
+        kept.append(section)
+        used += cost
+    if not kept and sections:
+        opening = sections[0][:max(budget - 1, 0)]
+        ends = [m.end() for m in _SENTENCE_END_PATTERN.finditer(opening + " ")]
+        kept = [opening[:ends[-1]] if ends else opening.rstrip() + "…"]
+    return kept
+
+def postprocess_post(reply: str, messages: List[Dict], max_length: int = POST_MAX_LENGTH,
+                     prepared: Optional[Dict[str, any]] = None) -> str:
+    """Trim a post draft at section boundaries, cap its hashtags and restore the user's links in one pass
+    
+    `prepared` is prepare_post_analysis output computed while the model was generating; without it the
+    analysis runs here, so both paths pick the same hashtags and links.
+    """
+    POSTPROCESS_STATS["replies"] += 1
+    sections, current, tags, urls = [], [], [], set()
+    for line in reply.splitlines():
+        if _HASHTAG_LINE_PATTERN.match(line):
+            tags.extend(_HASHTAG_PATTERN.findall(line))
+            continue
+        urls.update(url.rstrip(".,;") for url in _URL_PATTERN.findall(line))
+        if line.strip():
+            current.append(line)
+        elif current:
+            sections.append("\n".join(current))
+            current = []
+    if current:
+        sections.append("\n".join(current))
+    
+    fixes = []
+    prepared = prepared or prepare_post_analysis(messages)
+    capped = _cap_hashtags(tags, "", prepared["activity_type"], prepared["hashtags"])
+    links = prepared["links"]
+    if len(capped) < len(tags):
+        fixes.append("hashtags")
+    
+    missing = [(label, links[key]) for key, label in (("github_link", "GitHub"), ("demo_link", "Demo"))
+               if key in links and links[key] not in urls]
+    tail = []
+    if missing:
+        fixes.append("links")
+        tail.append("Links: " + " | ".join(f"{label}: {url}" for label, url in missing))
+    if capped:
+        tail.append(" ".join(f"#{tag}" for tag in capped))
+    
+    budget = max_length - sum(len(part) + 2 for part in tail)
+    if sum(len(section) + 2 for section in sections) - 2 > budget:
+        fixes.append("length")
+        sections = _trim_to_length(sections, budget)
+    
+    for fix in fixes:
+        POSTPROCESS_STATS[fix] += 1
+    if fixes:
+        POSTPROCESS_STATS["round_trips_prevented"] += 1
+    return "\n\n".join(sections + tail) if fixes else reply
+
+# Paraphrase normalization for the semantic completion cache
+_CACHE_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+CACHE_STOPWORDS = frozenset([
+    "a", "an", "the", "my", "me", "i", "i'm", "im", "on", "about", "for", "to", "of", "and", "or", "in", "with",
+    "can", "you", "please", "some", "it", "is", "this", "that", "linkedin", "want", "would", "like", "could", "do"
+])
+CACHE_SYNONYMS = {
+    "help": "write", "create": "write", "draft": "write", "make": "write", "compose": "write", "craft": "write",
+    "app": "project", "application": "project", "tool": "project", "website": "project", "site": "project",
+    "posts": "post", "posting": "post", "projects": "project", "apps": "project",
+    "connect": "network", "connections": "network", "connection": "network", "networking": "network"
+}
+
+def cache_tokens(text: str) -> List[str]:
+    """Normalize a user turn into paraphrase-tolerant tokens"""
+    tokens = []
+    for token in _CACHE_TOKEN_PATTERN.findall(text.lower()):
+        token = token.rstrip(".")
+        if token and token not in CACHE_STOPWORDS:
+            tokens.append(CACHE_SYNONYMS.get(token, token))
+    return tokens
+
+class SemanticCompletionCache:
+    """Approximate completion cache using hashed TF-IDF vectors and cosine nearest neighbours
+    
+    Entries store the hashed term frequencies of the normalized last user turn plus
+    the intent. Lookups weight every stored row by the current IDF and score them
+    in one matrix product; a reply is reused only above `threshold` and only for an
+    entry with the same intent, the same extracted technologies and the same context
+    digest (the per-thread system messages sent with the turn).
+    """
+    
+    def __init__(self, threshold: float = 0.9, capacity: int = 512, dimensions: int = 2048):
+        if np is None:
+            raise RuntimeError("SemanticCompletionCache requires NumPy")
+        self.threshold = threshold
+        self.capacity = capacity
+        self.dimensions = dimensions
+        self._tf = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._tf_squared = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._document_frequency = np.zeros(dimensions, dtype=np.float32)
+        self._keys = np.full(capacity, -1, dtype=np.int64)      # (intent, stack) key code per row
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._replies = [None] * capacity
+        self._key_codes = {}    # (intent, stack, context) -> code, only for keys some row still uses
+        self._next_key_code = 0
+        self._size = 0
+        self._clock = 0
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+    
+    def _vectorize(self, text: str, intent: Optional[str]) -> "np.ndarray":
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in cache_tokens(text) + [f"__intent__{intent}"]:
+            vector[zlib.crc32(token.encode()) % self.dimensions] += 1.0
+        return vector
+    
+    @staticmethod
+    def _key(text: str, intent: Optional[str], context: str) -> Tuple:
+        return intent, frozenset(tech.lower() for tech in extract_technologies(text)), context
+    
+    def lookup(self, text: str, intent: Optional[str], context: str = "") -> Optional[str]:
+        """Return a cached reply for a near-identical request with the same context digest, or None"""
+        with self._lock:
+            return self._lookup(text, intent, context)
+    
+    def store(self, text: str, intent: Optional[str], reply: str, context: str = ""):
+        """Cache a reply, evicting the least recently used entry when full"""
+        with self._lock:
+            self._store(text, intent, reply, context)
+    
+    def _lookup(self, text: str, intent: Optional[str], context: str) -> Optional[str]:
+        self.stats["lookups"] += 1
+        self._clock += 1
+        key_code = self._key_codes.get(self._key(text, intent, context))
+        candidates = np.flatnonzero(self._keys[:self._size] == key_code) if key_code is not None else ()
+        if len(candidates):
+            # cos(tf_row * idf, q * idf) from two matrix-vector products over the stored rows
+            idf = np.log((1.0 + self._size) / (1.0 + self._document_frequency)) + 1.0
+            weights = idf * idf
+            query = self._vectorize(text, intent)
+            dots = (self._tf[:self._size] @ (query * weights))[candidates]
+            row_norms = np.sqrt((self._tf_squared[:self._size] @ weights)[candidates])
+            similarities = dots / np.maximum(row_norms * np.sqrt(query * query @ weights), 1e-12)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                row = candidates[best]
+                self._last_used[row] = self._clock
+                self.stats["hits"] += 1
+                return self._replies[row]
+        self.stats["misses"] += 1
+        return None
+    
+    def _store(self, text: str, intent: Optional[str], reply: str, context: str):
+        self._clock += 1
+        key = self._key(text, intent, context)
+        key_code = self._key_codes.get(key)
+        if key_code is None:
+            key_code = self._key_codes[key] = self._next_key_code
+            self._next_key_code += 1
+        evicted_code = None
+        if self._size < self.capacity:
+            row = self._size
+            self._size += 1
+        else:
+            row = int(np.argmin(self._last_used))
+            self._document_frequency -= self._tf[row] > 0
+            evicted_code = int(self._keys[row])
+            self.stats["evictions"] += 1
+        vector = self._vectorize(text, intent)
+        self._tf[row] = vector
+        self._tf_squared[row] = vector * vector
+        self._document_frequency += vector > 0
+        self._keys[row] = key_code
+        if evicted_code is not None and evicted_code != key_code and not (self._keys[:self._size] == evicted_code).any():
+            # Key codes go with the last row that uses them, so the table stays bounded by capacity
+            self._key_codes = {key: code for key, code in self._key_codes.items() if code != evicted_code}
+        self._last_used[row] = self._clock
+        self._replies[row] = reply
+        self.stats["stores"] += 1
+    
+    def hit_rate(self) -> float:
+        return self.stats["hits"] / self.stats["lookups"] if self.stats["lookups"] else 0.0
+    
+    def __len__(self) -> int:
+        return self._size
+
+@lru_cache(maxsize=None)
+def get_semantic_cache() -> Optional[SemanticCompletionCache]:
+    """Return the process-wide semantic cache, unless NumPy is missing or LINKEDINBUILDR_SEMANTIC_CACHE=0"""
+    if np is None or os.environ.get("LINKEDINBUILDR_SEMANTIC_CACHE") == "0":
+        return None
+    return SemanticCompletionCache(threshold=float(os.environ.get("LINKEDINBUILDR_CACHE_THRESHOLD", "0.9")))
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "abandoned", "waiters")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.abandoned = False  # the leader was cancelled or interrupted, so waiters retry
+        self.waiters = []  # (loop, future) for callers awaiting from an event loop
+
+def _settle_waiter(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    return None if timeout is None else time.monotonic() + timeout
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a deadline, so a waiter that retries keeps its original timeout"""
+    return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+class SingleFlight:
+    """Coalesce identical in-flight calls: the first caller runs, later ones wait for its result
+    
+    do() runs or waits on blocking calls and ado() on coroutines; both share one key space, so
+    a native async completion and an executor-thread completion for the same payload coalesce.
+    A call that raises an Exception re-raises it in the caller that ran it and in every
+    waiting caller. If the running caller is cancelled or interrupted instead, only it sees
+    that; the waiters start over and one of them runs the call. Waiters give up with
+    TimeoutError after their own timeout, while the call itself carries on for the others.
+    Keys are forgotten once a call finishes, so this deduplicates concurrency, not history.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.stats = {"calls": 0, "coalesced": 0, "errors": 0, "abandoned": 0, "timeouts": 0}
+    
+    def _join(self, key: str, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """(flight, leader, future): the caller leads a new flight or joins the one in progress"""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.stats["calls"] += 1
+                return flight, True, None
+            self.stats["coalesced"] += 1
+            future = loop.create_future() if loop is not None else None
+            if future is not None:
+                flight.waiters.append((loop, future))
+            return flight, False, future
+    
+    def _fail(self, flight: _Flight, error: Exception):
+        # Stored before done is set, so every waiter re-raises it
+        flight.error = error
+        with self._lock:
+            self.stats["errors"] += 1
+    
+    def _abandon(self, flight: _Flight):
+        # A cancelled or interrupted leader fails only itself; its waiters retry the call
+        flight.abandoned = True
+        with self._lock:
+            self.stats["abandoned"] += 1
+    
+    def _land(self, key: str, flight: _Flight):
+        with self._lock:
+            del self._flights[key]
+        flight.done.set()
+        for loop, future in flight.waiters:
+            try:
+                loop.call_soon_threadsafe(_settle_waiter, future)
+            except RuntimeError:
+                pass  # the waiter's loop has closed
+    
+    def _timed_out(self, key: str, timeout: Optional[float]) -> TimeoutError:
+        with self._lock:
+            self.stats["timeouts"] += 1
+        return TimeoutError(f"in-flight call {key[:12]} did not finish within {timeout}s")
+    
+    def do(self, key: str, call, timeout: Optional[float] = None):
+        deadline = _deadline(timeout)
+        flight = None
+        while flight is None or flight.abandoned:
+            flight, leader, _ = self._join(key)
+            if leader:
+                try:
+                    flight.result = call()
+                except Exception as error:
+                    self._fail(flight, error)
+                    raise
+                except BaseException:
+                    self._abandon(flight)
+                    raise
+                finally:
+                    self._land(key, flight)
+            elif not flight.done.wait(_remaining(deadline)):
+                raise self._timed_out(key, timeout)
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+    
+    async def ado(self, key: str, call, timeout: Optional[float] = None):
+        """do() for a coroutine function; waiting never blocks the event loop"""
+        deadline = _deadline(timeout)
+        flight = None
+        while flight is None or flight.abandoned:
+            flight, leader, future = self._join(key, asyncio.get_running_loop())
+            if leader:
+                try:
+                    flight.result = await call()
+                except Exception as error:
+                    self._fail(flight, error)
+                    raise
+                except BaseException:
+                    self._abandon(flight)
+                    raise
+                finally:
+                    self._land(key, flight)
+            elif not flight.done.is_set():
+                try:
+                    await asyncio.wait_for(future, _remaining(deadline))
+                except asyncio.TimeoutError:
+                    raise self._timed_out(key, timeout) from None
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+@lru_cache(maxsize=None)
+def get_single_flight() -> Optional[SingleFlight]:
+    """Return the process-wide completion coalescer, unless LINKEDINBUILDR_SINGLE_FLIGHT=0"""
+    if os.environ.get("LINKEDINBUILDR_SINGLE_FLIGHT") == "0":
+        return None
+    return SingleFlight()
+
+SINGLE_FLIGHT_TIMEOUT = float(os.environ.get("LINKEDINBUILDR_SINGLE_FLIGHT_TIMEOUT", "60"))
+
+def completion_key(payload: List[Dict]) -> str:
+    """Content hash of what the model sees: the role and content of each message"""
+    digest = hashlib.sha256()
+    for message in payload:
+        digest.update(message.get("role", "user").encode())
+        digest.update(b"\0")
+        digest.update(message.get("content", "").encode())
+        digest.update(b"\1")
+    return digest.hexdigest()
+
+# Seconds each thread has spent awaiting completions in acompletion, its own or shared ones
+completion_clock = threading.local()
+
+def coalesced_completion(env, payload: List[Dict]) -> str:
+    """env.completion, sharing the result with identical requests already in flight"""
+    flight = get_single_flight()
+    if flight is None:
+        return env.completion(payload)
+    try:
+        return flight.do(completion_key(payload), lambda: env.completion(payload), SINGLE_FLIGHT_TIMEOUT)
+    except TimeoutError:
+        return env.completion(payload)  # the shared call is stuck; make our own
+
+async def acoalesced_completion(native, payload: List[Dict]) -> str:
+    """env.acompletion under the same in-flight keys as coalesced_completion"""
+    flight = get_single_flight()
+    if flight is None:
+        return await native(payload)
+    try:
+        return await flight.ado(completion_key(payload), lambda: native(payload), SINGLE_FLIGHT_TIMEOUT)
+    except TimeoutError:
+        return await native(payload)
+
+# Only early turns depend mostly on the last user message, so only they are cached
+SEMANTIC_CACHE_MAX_USER_TURNS = 2
+
+def context_digest(context: List[Dict]) -> str:
+    """Hash of the messages sent ahead of a turn's user message: the system context (intent
+    prompt, profile context, contacts) and any earlier turns"""
+    payload = json.dumps([[message.get("role", ""), message.get("content", "")] for message in context],
+                         separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+def _cacheable_turn(messages: List[Dict], context: List[Dict]) -> Tuple[Optional[SemanticCompletionCache], str, str]:
+    """The semantic cache, the user turn and the digest to key it by, or (None, "", "") when the turn
+    isn't cacheable. Only the last user turn is matched approximately; earlier turns and replies
+    are part of the exact scope, so a second turn never reuses another conversation's reply."""
+    cache = get_semantic_cache()
+    user_indexes = [index for index, m in enumerate(messages) if m.get("role", "user") == "user"]
+    if cache is None or not user_indexes or len(user_indexes) > SEMANTIC_CACHE_MAX_USER_TURNS:
+        return None, "", ""
+    last = user_indexes[-1]
+    return cache, messages[last].get("content", ""), context_digest(context + messages[:last])
+
+def cached_completion(env, messages: List[Dict], intent: Optional[str], context: List[Dict]) -> str:
+    """Call env.completion through the semantic cache when the turn is cacheable"""
+    cache, turn, scope = _cacheable_turn(messages, context)
+    if cache is None:
+        return coalesced_completion(env, context + messages)
+    cached = cache.lookup(turn, intent, scope)
+    if cached is not None:
+        return cached
+    result = coalesced_completion(env, context + messages)
+    cache.store(turn, intent, result, scope)
+    return result
+
+@lru_cache(maxsize=None)
+def completion_executor():
+    """Shared threads for blocking env.completion calls that local work overlaps with"""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=int(os.environ.get("LINKEDINBUILDR_COMPLETION_THREADS", "256")),
+                              thread_name_prefix="completion")
+
+async def acompletion(env, payload: List[Dict]) -> str:
+    """Await env.acompletion when the environment has one; otherwise run env.completion on a shared
+    thread, so neither the model call nor a single-flight wait blocks the event loop"""
+    native = getattr(env, "acompletion", None)
+    start = time.perf_counter()
+    try:
+        if native is not None:
+            return await acoalesced_completion(native, payload)
+        return await asyncio.get_running_loop().run_in_executor(completion_executor(), coalesced_completion, env, payload)
+    finally:
+        # The only place model time is counted; executor waits are charged to the awaiting thread
+        completion_clock.seconds = getattr(completion_clock, "seconds", 0.0) + time.perf_counter() - start
+
+async def acached_completion(env, messages: List[Dict], intent: Optional[str], context: List[Dict]) -> str:
+    """cached_completion for the event loop"""
+    cache, turn, scope = _cacheable_turn(messages, context)
+    cached = cache.lookup(turn, intent, scope) if cache is not None else None
+    if cached is not None:
+        return cached
+    result = await acompletion(env, context + messages)
+    if cache is not None:
+        cache.store(turn, intent, result, scope)
+    return result
+
+class CohortAnalytics:
+    """Columnar, incrementally updated aggregates of skill signals across a cohort of profiles
+    
+    Each scored profile appends one row to the per-profile columns (cohort, overall
+    level, domain scores), one row per technology to a (profile, technology) column
+    pair, and one row per experience or project to a (profile, technical depth)
+    column pair. Group-bys are NumPy reductions over those columns.
+    """
+    
+    LEVELS = list(SKILL_PROGRESSION["levels"])
+    DOMAINS = list(SKILL_PROGRESSION["domains"])
+    
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise RuntimeError("CohortAnalytics requires NumPy")
+        self.cohorts, self.technologies = [], []
+        self._cohort_codes, self._technology_codes = {}, {}
+        self._columns = {
+            "cohort": np.zeros(capacity, dtype=np.int32),
+            "level": np.zeros(capacity, dtype=np.int8),
+            "domains": np.zeros((capacity, len(self.DOMAINS)), dtype=np.int32),
+            "tech_profile": np.zeros(capacity, dtype=np.int32),
+            "tech_code": np.zeros(capacity, dtype=np.int32),
+            "depth_profile": np.zeros(capacity, dtype=np.int32),
+            "depth": np.zeros(capacity, dtype=np.float32)
+        }
+        self._lengths = {"profiles": 0, "tech": 0, "depth": 0}
+    
+    def _reserve(self, group: str, columns: Tuple[str, ...], extra: int) -> int:
+        start = self._lengths[group]
+        needed = start + extra
+        for name in columns:
+            column = self._columns[name]
+            if needed > len(column):
+                grown = np.zeros((max(needed, 2 * len(column)),) + column.shape[1:], dtype=column.dtype)
+                grown[:start] = column[:start]
+                self._columns[name] = grown
+        self._lengths[group] = needed
+        return start
+    
+    @staticmethod
+    def _code(value: str, codes: Dict[str, int], names: List[str]) -> int:
+        if value not in codes:
+            codes[value] = len(names)
+            names.append(value)
+        return codes[value]
+    
+    def add_profile(self, profile_data: Dict[str, any], cohort: str = "all") -> int:
+        """Score one profile and append its signals to the columns"""
+        entries = profile_data.get("experiences", []) + profile_data.get("projects", [])
+        descriptions = [entry.get("description", "") for entry in entries]
+        skills = profile_data.get("skills", {})
+        skill_text = " ".join(skill for values in skills.values() for skill in values) if isinstance(skills, dict) else ""
+        technologies = extract_technologies(" ".join(descriptions + [skill_text]))
+        assessment = assess_skill_level(profile_data)
+        
+        row = self._reserve("profiles", ("cohort", "level", "domains"), 1)
+        self._columns["cohort"][row] = self._code(cohort, self._cohort_codes, self.cohorts)
+        self._columns["level"][row] = self.LEVELS.index(assessment["overall_level"])
+        self._columns["domains"][row] = [assessment["domain_levels"][domain] for domain in self.DOMAINS]
+        
+        start = self._reserve("tech", ("tech_profile", "tech_code"), len(technologies))
+        self._columns["tech_profile"][start:start + len(technologies)] = row
+        self._columns["tech_code"][start:start + len(technologies)] = [
+            self._code(tech, self._technology_codes, self.technologies) for tech in technologies
+        ]
+        
+        start = self._reserve("depth", ("depth_profile", "depth"), len(descriptions))
+        self._columns["depth_profile"][start:start + len(descriptions)] = row
+        self._columns["depth"][start:start + len(descriptions)] = [
+            calculate_technical_depth({"description": description}) for description in descriptions
+        ]
+        return row
+    
+    def __len__(self) -> int:
+        return self._lengths["profiles"]
+    
+    def _column(self, name: str) -> "np.ndarray":
+        group = {"cohort": "profiles", "level": "profiles", "domains": "profiles",
+                 "tech_profile": "tech", "tech_code": "tech", "depth_profile": "depth", "depth": "depth"}[name]
+        return self._columns[name][:self._lengths[group]]
+    
+    def _profile_mask(self, cohort: Optional[str]) -> Optional["np.ndarray"]:
+        if cohort is None:
+            return None
+        return self._column("cohort") == self._cohort_codes.get(cohort, -1)
+    
+    def technology_counts(self, cohort: Optional[str] = None, top_n: Optional[int] = None) -> Dict[str, int]:
+        """Number of profiles mentioning each technology, most common first"""
+        codes = self._column("tech_code")
+        mask = self._profile_mask(cohort)
+        if mask is not None:
+            codes = codes[mask[self._column("tech_profile")]]
+        counts = np.bincount(codes, minlength=len(self.technologies))
+        order = np.argsort(-counts, kind="stable")[:top_n]
+        return {self.technologies[code]: int(counts[code]) for code in order if counts[code]}
+    
+    def technology_by_cohort(self) -> Dict[str, Dict[str, int]]:
+        """Technology counts grouped by cohort"""
+        cohorts = self._column("cohort")[self._column("tech_profile")]
+        cells = np.bincount(cohorts * len(self.technologies) + self._column("tech_code"),
+                            minlength=len(self.cohorts) * len(self.technologies))
+        table = cells.reshape(len(self.cohorts), len(self.technologies))
+        return {cohort: {tech: int(count) for tech, count in zip(self.technologies, table[code]) if count}
+                for code, cohort in enumerate(self.cohorts)}
+    
+    def level_distribution(self, cohort: Optional[str] = None) -> Dict[str, int]:
+        """How many profiles assess at each overall level"""
+        levels = self._column("level")
+        mask = self._profile_mask(cohort)
+        if mask is not None:
+            levels = levels[mask]
+        counts = np.bincount(levels, minlength=len(self.LEVELS))
+        return dict(zip(self.LEVELS, counts.tolist()))
+    
+    def domain_scores(self, cohort: Optional[str] = None) -> Dict[str, float]:
+        """Mean domain score per SKILL_PROGRESSION domain"""
+        domains = self._column("domains")
+        mask = self._profile_mask(cohort)
+        if mask is not None:
+            domains = domains[mask]
+        means = domains.mean(axis=0) if len(domains) else np.zeros(len(self.DOMAINS))
+        return {domain: round(float(mean), 3) for domain, mean in zip(self.DOMAINS, means)}
+    
+    def domain_scores_by_cohort(self) -> Dict[str, Dict[str, float]]:
+        cohorts = self._column("cohort")
+        sizes = np.bincount(cohorts, minlength=len(self.cohorts))
+        totals = np.zeros((len(self.cohorts), len(self.DOMAINS)))
+        np.add.at(totals, cohorts, self._column("domains"))
+        means = totals / np.maximum(sizes, 1)[:, None]
+        return {cohort: {domain: round(float(mean), 3) for domain, mean in zip(self.DOMAINS, means[code])}
+                for code, cohort in enumerate(self.cohorts)}
+    
+    def depth_histogram(self, cohort: Optional[str] = None, bins: int = 10) -> Dict[str, List]:
+        """Distribution of validate_achievement technical-depth scores"""
+        depths = self._column("depth")
+        mask = self._profile_mask(cohort)
+        if mask is not None:
+            depths = depths[mask[self._column("depth_profile")]]
+        counts, edges = np.histogram(depths, bins=bins, range=(0.0, 1.0))
+        return {"counts": counts.tolist(), "edges": [round(float(edge), 3) for edge in edges]}
+    
+    def summary(self, cohort: Optional[str] = None, top_n: int = 10) -> Dict[str, any]:
+        mask = self._profile_mask(cohort)
+        return {
+            "profiles": int(mask.sum()) if mask is not None else len(self),
+            "technologies": self.technology_counts(cohort, top_n),
+            "levels": self.level_distribution(cohort),
+            "domain_scores": self.domain_scores(cohort),
+            "technical_depth": self.depth_histogram(cohort)
+        }
+    
+    def save(self, path: str):
+        """Write an uncompressed .npz snapshot atomically"""
+        arrays = {name: self._column(name) for name in self._columns}
+        arrays["cohorts"] = np.array(self.cohorts, dtype=str)
+        arrays["technologies"] = np.array(self.technologies, dtype=str)
+        # A private temp file per save, so concurrent writers never interleave in one
+        f = tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(os.path.abspath(path)),
+                                        prefix=os.path.basename(path) + ".", suffix=".tmp", delete=False)
+        try:
+            with f:
+                np.savez(f, **arrays)
+            os.replace(f.name, path)
+        finally:
+            if os.path.exists(f.name):
+                os.unlink(f.name)
+    
+    @classmethod
+    def load(cls, path: str) -> "CohortAnalytics":
+        """Read a snapshot written by save(); more profiles can be added afterwards"""
+        analytics = cls(capacity=1)
+        with np.load(path, allow_pickle=False) as snapshot:
+            for name in analytics._columns:
+                analytics._columns[name] = snapshot[name].copy()
+            analytics.cohorts = snapshot["cohorts"].tolist()
+            analytics.technologies = snapshot["technologies"].tolist()
+        analytics._cohort_codes = {name: code for code, name in enumerate(analytics.cohorts)}
+        analytics._technology_codes = {name: code for code, name in enumerate(analytics.technologies)}
+        analytics._lengths = {"profiles": len(analytics._columns["cohort"]),
+                              "tech": len(analytics._columns["tech_code"]),
+                              "depth": len(analytics._columns["depth"])}
+        return analytics
+
 def detect_initial_intent(message: str) -> str:
     """Detect if the first message indicates a specific functionality request"""
     message = message.lower()
@@ -1115,87 +3834,339 @@ def detect_initial_intent(message: str) -> str:
     
     return None
 
-def run(env: Environment):
-    system_prompt = """You are a LinkedIn profile strategist who specializes in helping computer science students transition into software engineering roles. You understand both the technical and career aspects of software development, and know how to present technical achievements to catch recruiters' attention.
+def detect_conversation_intent(messages: List[Dict]) -> Optional[str]:
+    """Detect the current intent from the most recent user message that states one"""
+    for message in reversed(messages or []):
+        if message.get("role", "user") != "user":
+            continue
+        intent = detect_initial_intent(message.get("content", ""))
+        if intent:
+            return intent
+    return None
 
-KEY OBJECTIVES:
-- Guide natural networking progression for CS students
-- Focus on individual's technical strengths and interests
-- Build meaningful professional relationships in their chosen domain
-- Maintain relevance to their specific tech stack and goals
+def serialize_catalog(name: str) -> str:
+    """Serialize a catalog compactly for inclusion in the system prompt"""
+    catalogs = {
+        "NETWORK_TARGETS": NETWORK_TARGETS,
+        "PROFILE_SECTIONS": PROFILE_SECTIONS,
+        "TONE_STYLES": TONE_STYLES
+    }
+    return f"{name}: " + json.dumps(catalogs[name], separators=(",", ":"))
 
-NETWORKING GUIDANCE:
-Guide users through networking phases naturally, focusing on one clear action at a time:
+def build_system_prompt(intent: Optional[str] = None) -> str:
+    """Assemble the system prompt from the modules relevant to the intent"""
+    if intent in _SYSTEM_PROMPTS:
+        return _SYSTEM_PROMPTS[intent]
+    return _assemble_system_prompt(intent)
 
-Phase 1 - Foundation
-- Understand student's specific technical focus (languages, frameworks, domains)
-- Use NETWORK_TARGETS to suggest relevant communities based on their interests
-- Craft personalized connections using generate_connection_message() with their tech context
-- Build on their unique technical experience and projects
+def _assemble_system_prompt(intent: Optional[str]) -> str:
+    spec = INTENT_PROMPT_MODULES.get(intent, INTENT_PROMPT_MODULES[None])
+    parts = [SYSTEM_PROMPT_MODULES[module] for module in spec["modules"]]
+    if spec["catalogs"]:
+        parts.append("REFERENCE DATA:\n" + "\n".join(serialize_catalog(name) for name in spec["catalogs"]))
+    return "\n\n".join(parts)
 
-Phase 2 - Engagement
-- Use suggest_engagement_plan() for focused growth in their domain
-- Keep technical context specific to their stack (e.g., backend scaling, ML models, frontend frameworks)
-- Build on their demonstrated interests and strengths
-- Guide meaningful interactions in their chosen field
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about 4 characters per token for English text)"""
+    return (len(text) + 3) // 4
 
-Phase 3 - Growth
-- Focus on value-add opportunities in their technical domain
-- Guide collaborative engagement based on their expertise
-- Expand network naturally through shared technical interests
-- Maintain relevance to their career goals
+MESSAGE_TAIL_SIZE = 20          # recent messages sent to the model each turn
+MESSAGE_CACHE_THREADS = 4096    # threads whose first message and tail stay cached per process
+_MESSAGE_WINDOW_CACHE = OrderedDict()
 
-RESPONSE PRINCIPLES:
-1. Focus
-- ONE clear next step based on their technical context
-- Build on their specific experiences and interests
-- Keep aligned with their tech stack
-- Show natural progression in their domain
+class MessageWindow:
+    """Lazy view of a thread: the first message, a message count and the last K messages
+    
+    Only the first message and a bounded tail are fetched, through the
+    environment's `limit`/`order` paging. Per-thread results are cached so a
+    resident worker only fetches what is new. Environments without paging fall
+    back to a single full listing.
+    """
+    
+    def __init__(self, env, tail_size: int = MESSAGE_TAIL_SIZE):
+        self.env = env
+        self.tail_size = tail_size
+        self.thread_id = _env_identity(env)[0]
+        self._first = None
+        self._tail = None
+        self._count = None       # exact count when known
+        self._full = None        # only used when the environment cannot page
+        self.fetched = 0         # messages pulled from the environment this turn
+    
+    def _list(self, limit: int, order: str) -> List[Dict]:
+        if self._full is None:
+            try:
+                page = self.env.list_messages(limit=limit, order=order)
+                self.fetched += len(page)
+                return page
+            except TypeError:
+                self._full = self.env.list_messages()
+                self.fetched += len(self._full)
+        return (self._full if order == "asc" else self._full[::-1])[:limit]
+    
+    def _load(self):
+        if self._tail is not None:
+            return
+        cached = _MESSAGE_WINDOW_CACHE.get(self.thread_id) if self.thread_id else None
+        tail = self._list(self.tail_size, "desc")[::-1]
+        if cached is not None:
+            self._first = cached["first"]
+            last_seen = cached["last_id"]
+            ids = [message.get("id") for message in tail]
+            if cached["count"] is not None and last_seen in ids:
+                self._count = cached["count"] + len(ids) - 1 - ids.index(last_seen)
+        elif len(tail) < self.tail_size:
+            self._first = tail[0] if tail else None
+            self._count = len(tail)
+        if self._first is None and tail:
+            self._first = self._list(1, "asc")[0]
+        self._tail = tail
+        if self.thread_id and tail:
+            _MESSAGE_WINDOW_CACHE[self.thread_id] = {"first": self._first, "last_id": tail[-1].get("id"),
+                                                     "count": self._count}
+            _MESSAGE_WINDOW_CACHE.move_to_end(self.thread_id)
+            if len(_MESSAGE_WINDOW_CACHE) > MESSAGE_CACHE_THREADS:
+                _MESSAGE_WINDOW_CACHE.popitem(last=False)
+    
+    def first(self) -> Optional[Dict]:
+        self._load()
+        return self._first
+    
+    def tail(self) -> List[Dict]:
+        self._load()
+        return list(self._tail)
+    
+    def count_at_least(self, n: int) -> bool:
+        self._load()
+        if self._count is not None:
+            return self._count >= n
+        return len(self._tail) >= n
+    
+    def count(self) -> int:
+        """Exact message count, asking the environment only if it is not already known"""
+        self._load()
+        if self._count is None:
+            if hasattr(self.env, "count_messages"):
+                self._count = self.env.count_messages()
+            else:
+                self._count = sum(1 for _ in self)
+        return self._count
+    
+    def __iter__(self) -> Iterator[Dict]:
+        """Iterate the whole thread page by page (only for tools that really need it)"""
+        if self._full is not None:
+            yield from self._full
+            return
+        try:
+            after = None
+            while True:
+                page = self.env.list_messages(limit=100, order="asc", after=after)
+                self.fetched += len(page)
+                yield from page
+                if len(page) < 100:
+                    return
+                after = page[-1].get("id")
+        except TypeError:
+            self._full = self.env.list_messages()
+            yield from self._full
+    
+    def context(self) -> List[Dict]:
+        """The first message plus the recent tail, as sent to the model"""
+        tail = self.tail()
+        if self._first is not None and (not tail or tail[0] != self._first):
+            return [self._first] + tail
+        return tail
 
-2. Value
-- Technical relevance to their chosen field
-- Clear benefits for their career path
-- Immediate actionability in their context
-- Professional growth in their area
+# Profile versions per thread live in the artifact store, so a regenerated profile is sent as the sections that changed
+PROFILE_SECTION_TITLES = {"headline": "Headline", "about": "About", "experience": "Experience",
+                          "education": "Education", "skills": "Skills"}
+_PROFILE_HEADER_PATTERN = re.compile(
+    r"^[ \t]*(?:#{1,6}[ \t]*)?(?:\*\*)?(headline|about(?: section| me)?|experience|education|skills)(?:\*\*)?"
+    r"(?:[ \t]*:(?:\*\*)?[ \t]*(.*)|[ \t]*)$",
+    re.IGNORECASE | re.MULTILINE
+)
+# Blocks opening with a bullet or a "Label:" line continue the previous experience entry
+_ENTRY_CONTINUATION_PATTERN = re.compile(r"^\s*(?:[-•*]|[^\w\n]*[\w /&]{1,30}:)")
+PROFILE_DIFF_STATS = Counter()
 
-3. Guidance
-- Natural conversation about their interests
-- Specific suggestions for their domain
-- Clear direction based on their goals
-- Simple choices aligned with their path
+def parse_profile_text(text: str) -> Tuple[str, Dict[str, any], str]:
+    """Split a profile reply into (intro, sections, closing question); experience is a list of entries"""
+    headers = list(_PROFILE_HEADER_PATTERN.finditer(text))
+    sections, outro = {}, ""
+    for index, header in enumerate(headers):
+        name = header.group(1).lower().split()[0]
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        body = ((header.group(2) or "") + text[header.end():end]).strip()
+        if index == len(headers) - 1:
+            # A closing question after the last section belongs to the reply, not the profile
+            paragraphs = re.split(r"\n\s*\n", body)
+            if len(paragraphs) > 1 and paragraphs[-1].rstrip().endswith("?"):
+                outro = paragraphs.pop().strip()
+                body = "\n\n".join(paragraphs)
+        if name == "experience":
+            entries = []
+            for block in re.split(r"\n\s*\n", body):
+                if not block.strip():
+                    continue
+                if entries and _ENTRY_CONTINUATION_PATTERN.match(block):
+                    entries[-1] += "\n\n" + block.strip("\n")
+                else:
+                    entries.append(block.strip("\n"))
+            sections[name] = entries
+        else:
+            sections[name] = body
+    return (text[:headers[0].start()].strip() if headers else text.strip()), sections, outro
 
-4. Data Usage
-- Use NETWORK_TARGETS for suggestions matching their interests
-- Generate personalized messages referencing their specific tech experience
-- Create structured plans relevant to their domain
-- Keep technical focus aligned with their goals
+def render_profile_text(sections: Dict[str, any]) -> str:
+    """Render generate_profile_sections-style output as one plain-text profile"""
+    parts = []
+    for name, title in PROFILE_SECTION_TITLES.items():
+        value = sections.get(name)
+        if value:
+            parts.append(f"{title}:\n" + ("\n\n".join(value) if isinstance(value, list) else value))
+    return "\n\n".join(parts)
 
-TECHNICAL DOMAINS:
-Consider various paths including:
-- Backend Development (distributed systems, APIs, databases)
-- Frontend Development (web frameworks, UX, performance)
-- Full Stack Development
-- Machine Learning/AI
-- Mobile Development
-- DevOps/Infrastructure
-- Security Engineering
-- Game Development
-- Embedded Systems
+def _entry_key(entry: str) -> str:
+    return entry.split("\n", 1)[0].strip().lower()
 
-AVOID:
-- Multiple actions at once
-- Generic networking advice
-- Losing sight of their specific technical context
-- Overwhelming options
-- Assuming one technology stack fits all
+def _line_changes(before: str, after: str) -> List[str]:
+    # The first two lines of a unified diff are its ---/+++ file headers; hunks follow
+    diff = difflib.unified_diff(before.splitlines(), after.splitlines(), lineterm="", n=0)
+    return [f"{line[0]} {line[1:]}" for line in list(diff)[2:] if line[:1] in "+-"]
 
-Remember: Guide each student through natural networking progression while maintaining focus on their specific technical interests and career goals. Use data structures to provide relevant suggestions while keeping conversation natural and focused on their chosen path."""
+def diff_profile_sections(old: Dict[str, any], new: Dict[str, any]) -> List[Dict[str, any]]:
+    """Changed sections and experience entries, each with its line-level changes"""
+    changes = []
+    for name in PROFILE_SECTION_TITLES:
+        before, after = old.get(name), new.get(name)
+        if before == after or after is None:
+            continue
+        if isinstance(after, list):
+            previous = {_entry_key(entry): entry for entry in before or []}
+            for entry in after:
+                old_entry = previous.pop(_entry_key(entry), None)
+                if old_entry is None:
+                    changes.append({"section": name, "entry": entry.split("\n", 1)[0], "kind": "added", "text": entry})
+                elif old_entry != entry:
+                    changes.append({"section": name, "entry": entry.split("\n", 1)[0], "kind": "changed",
+                                    "lines": _line_changes(old_entry, entry)})
+            for key, entry in previous.items():
+                changes.append({"section": name, "entry": entry.split("\n", 1)[0], "kind": "removed"})
+        elif not before:
+            changes.append({"section": name, "kind": "added", "text": after})
+        else:
+            changes.append({"section": name, "kind": "changed", "lines": _line_changes(before, after)})
+    return changes
 
-    prompt = {"role": "system", "content": system_prompt}
-    
-    # Get all messages
-    messages = env.list_messages()
+def format_profile_diff(changes: List[Dict[str, any]]) -> str:
+    """User-facing summary of profile changes: new text for additions, +/- lines for edits"""
+    if not changes:
+        return "No sections changed from the previous version."
+    parts = []
+    for change in changes:
+        title = PROFILE_SECTION_TITLES[change["section"]] + (f" - {change['entry']}" if change.get("entry") else "")
+        if change["kind"] == "added":
+            parts.append(f"New {title}:\n{change['text']}")
+        elif change["kind"] == "removed":
+            parts.append(f"Removed {title}")
+        else:
+            parts.append(f"Updated {title}:\n" + "\n".join(change["lines"]))
+    return "\n\n".join(parts)
+
+def update_profile_version(store: ArtifactStore, thread_id: str, sections: Dict[str, any],
+                           user_id: str = "") -> Tuple[Optional[Dict[str, any]], Dict[str, any]]:
+    """Merge sections into the thread's latest stored profile, store the result and return (previous, merged)"""
+    previous = store.latest_profile(thread_id)
+    merged = dict(previous or {}, **sections)
+    store.save_profile(merged, thread_id, user_id)
+    return previous, merged
+
+def compact_profile_reply(env, reply: str, store: Optional[ArtifactStore] = None) -> str:
+    """Replace a regenerated profile in a reply with only what changed since the thread's last version
     
+    Only versions in the artifact store count, so without a store, or before a thread's first
+    stored version, the full profile is sent and the thread history always holds one.
+    """
+    intro, sections, outro = parse_profile_text(reply)
+    store = store or get_artifact_store()
+    thread_id, user_id = _env_identity(env)
+    if not sections or store is None or not thread_id:
+        return reply
+    previous, _ = update_profile_version(store, thread_id, sections, user_id)
+    if previous is None:
+        return reply
+    changes = diff_profile_sections(previous, sections)
+    compact = "\n\n".join(filter(None, [intro, format_profile_diff(changes), outro]))
+    PROFILE_DIFF_STATS["replies"] += 1
+    PROFILE_DIFF_STATS["chars_saved"] += max(len(reply) - len(compact), 0)
+    return compact if len(compact) < len(reply) else reply
+
+def current_profile_context(env, store: Optional[ArtifactStore] = None) -> Optional[Dict]:
+    """The thread's latest full profile as one system message, since replies only carry changes"""
+    store = store or get_artifact_store()
+    thread_id, _ = _env_identity(env)
+    sections = store.latest_profile(thread_id) if store is not None else None
+    if not sections:
+        return None
+    return {"role": "system", "content": "CURRENT PROFILE (latest version; earlier replies show only changes):\n"
+                                         + render_profile_text(sections)}
+
+# Derived indexes: everything computed from the catalogs, built in-process at startup (a few
+# milliseconds, mostly regex compilation, which a snapshot on disk cannot skip)
+_SKILL_INDICATOR_KEYWORDS = {}  # level -> keyword tuple per SKILL_PROGRESSION indicator
+_SYSTEM_PROMPTS = {}            # intent -> assembled system prompt
+DERIVED_INDEX_STATS = {}
+
+def build_derived_indexes() -> Dict[str, any]:
+    """Compute every derived structure from the catalogs (regexes as sources, compiled on install)"""
+    activity_prototypes = _build_activity_prototypes()
+    jargon_table = _jargon_table()
+    return {
+        "tech_matcher": term_matcher_source(term for terms in TECH_KEYWORDS.values() for term in terms),
+        "specialization_matcher": term_matcher_source(HEADLINE_SPECIALIZATIONS),
+        "jargon_table": jargon_table,
+        "jargon_pattern": _jargon_pattern_source(jargon_table),
+        "metric_names": [re.escape(metric) for details in TECHNICAL_CONTEXT["project_types"].values()
+                         for metric in details["key_metrics"]],
+        "metric_keys": [metric for details in TECHNICAL_CONTEXT["project_types"].values()
+                        for metric in details["key_metrics"]],
+        "activity_prototypes": activity_prototypes,
+        "post_data_prototypes": _build_post_data_prototypes(activity_prototypes),
+        "skill_indicators": {level: [tuple(indicator.split("_")) for indicator in details["indicators"]]
+                             for level, details in SKILL_PROGRESSION["levels"].items()},
+        "system_prompts": {intent: _assemble_system_prompt(intent) for intent in INTENT_PROMPT_MODULES}
+    }
+
+def install_derived_indexes(indexes: Dict[str, any]):
+    """Compile the regex sources and publish the derived structures as module globals"""
+    global _TECH_MATCHER, _SPECIALIZATION_MATCHER, _JARGON_TABLE, _JARGON_PATTERN, _METRIC_NAME_PATTERNS
+    global _ACTIVITY_PROTOTYPES, ACTIVITY_TEMPLATE_PROTOTYPES, _POST_DATA_PROTOTYPES, _SKILL_INDICATOR_KEYWORDS, _SYSTEM_PROMPTS
+    source, canonical = indexes["tech_matcher"]
+    _TECH_MATCHER = (re.compile(source, re.IGNORECASE), canonical)
+    source, canonical = indexes["specialization_matcher"]
+    _SPECIALIZATION_MATCHER = (re.compile(source, re.IGNORECASE), canonical)
+    _JARGON_TABLE = indexes["jargon_table"]
+    _JARGON_PATTERN = re.compile(indexes["jargon_pattern"], re.IGNORECASE)
+    _METRIC_NAME_PATTERNS = {metric: re.compile(source, re.IGNORECASE)
+                             for metric, source in zip(indexes["metric_keys"], indexes["metric_names"])}
+    _ACTIVITY_PROTOTYPES = indexes["activity_prototypes"]
+    ACTIVITY_TEMPLATE_PROTOTYPES = MappingProxyType({
+        activity_type: MappingProxyType(prototype) for activity_type, prototype in _ACTIVITY_PROTOTYPES.items()
+    })
+    _POST_DATA_PROTOTYPES = indexes["post_data_prototypes"]
+    _SKILL_INDICATOR_KEYWORDS = indexes["skill_indicators"]
+    _SYSTEM_PROMPTS = indexes["system_prompts"]
+
+def load_derived_indexes():
+    """Build the derived indexes and publish them, recording how long that took"""
+    start = time.perf_counter()
+    install_derived_indexes(build_derived_indexes())
+    DERIVED_INDEX_STATS["seconds"] = time.perf_counter() - start
+
+load_derived_indexes()
+
+def local_reply(env, messages: List[Dict]) -> str:
+    """Replies that need no model call: openers, stored post re-renders, headline options and quick edits"""
     # If this is the first user message
     if not messages or len(messages) <= 1:
         if messages and len(messages) == 1:
@@ -1203,21 +4174,275 @@ Remember: Guide each student through natural networking progression while mainta
             initial_intent = detect_initial_intent(messages[0].get("content", ""))
             if initial_intent:
                 # Go directly to the requested functionality
-                response = CONVERSATION_TEMPLATES[initial_intent]["message"]
-                env.add_reply(response)
-                env.request_user_input()
-                return
+                return CONVERSATION_TEMPLATES[initial_intent]["message"]
         
         # If no specific intent detected, show welcome message
-        welcome_message = CONVERSATION_TEMPLATES["welcome"]["message"]
-        env.add_reply(welcome_message)
-        env.request_user_input()
-        return
+        return CONVERSATION_TEMPLATES["welcome"]["message"]
+    
+    # Earlier posts are re-rendered in a new tone from the artifact store
+    stored_post = rerender_previous_post(env, messages)
+    if stored_post:
+        return stored_post
+    
+    # Headline alternatives are rendered and ranked locally
+    headline_reply = suggest_headline_alternatives(messages)
+    if headline_reply:
+        return headline_reply
+    
+    # Shorter, longer and less technical edits of the last post are applied locally
+    return quick_edit_previous_post(messages)
 
-    # Process user input and generate response
-    result = env.completion([prompt] + messages)
-    env.add_reply(result)
+def completion_context(env, messages: List[Dict], intent: Optional[str]) -> List[Dict]:
+    """System messages for the model: the intent's prompt modules plus any local context"""
+    context = [{"role": "system", "content": build_system_prompt(intent)}]
+    if intent == "network_start":
+        contacts = suggest_contacts_from_export(messages)
+        if contacts:
+            context.append({"role": "system", "content": contacts})
+    if intent == "profile_start":
+        profile_context = current_profile_context(env)
+        if profile_context:
+            context.append(profile_context)
+    return context
+
+async def _started(coroutine) -> asyncio.Task:
+    """Schedule a coroutine and yield once, so its request is on the wire before local work starts"""
+    task = asyncio.ensure_future(coroutine)
+    await asyncio.sleep(0)
+    return task
+
+async def model_reply(env, messages: List[Dict], intent: Optional[str]) -> str:
+    """Get the model's reply, running local analysis for its post-processing while the model generates"""
+    context = completion_context(env, messages, intent)
+    if intent != "post_start":
+        result = await acached_completion(env, messages, intent, context)
+        return compact_profile_reply(env, result) if intent == "profile_start" else result
+    
+    # Posts are filled in as post_data by the model and rendered locally
+    activity_type = detect_activity_type(_user_text(messages))
+    structured = wants_structured_post(messages, activity_type)
+    if structured:
+        request = await _started(acompletion(env, structured_post_request(messages, activity_type)))
+    else:
+        request = await _started(acached_completion(env, messages, intent, context))
+    prepared = prepare_post_analysis(messages, activity_type)
+    result = await request
+    if structured:
+        post = render_structured_post(env, messages, result, prepared)
+        if post:
+            return post
+        result = await acached_completion(env, messages, intent, context)
+    return postprocess_post(result, messages, prepared=prepared)
+
+async def arun(env):
+    """Handle one turn on the event loop, overlapping local analysis with the model call"""
+    # Load the first message and recent tail instead of the whole thread
+    messages = MessageWindow(env).context()
+    reply = local_reply(env, messages)
+    if not reply:
+        reply = await model_reply(env, messages, detect_conversation_intent(messages))
+    env.add_reply(reply)
     env.request_user_input()
 
-run(env)
+_RUN_LOOPS = threading.local()
+
+def _reset_after_fork():
+    """Give a forked worker process its own completion threads and event loops
+    
+    The child inherits the executor without its threads, and the parent's loops with their
+    selector and wakeup socket, which sibling workers would otherwise share.
+    """
+    global _RUN_LOOPS
+    completion_executor.cache_clear()
+    _RUN_LOOPS = threading.local()
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+def _run_on_thread_loop(env):
+    # Reuse one loop per thread; asyncio.run builds and tears down a loop on every turn
+    loop = getattr(_RUN_LOOPS, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _RUN_LOOPS.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(arun(env))
+
+def run(env: Environment):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_on_thread_loop(env)
+    # Already inside an event loop (callers there should await arun): run on a shared completion thread's loop
+    return completion_executor().submit(_run_on_thread_loop, env).result()
+
+class ConsistentHashRing:
+    """Map thread ids to workers so a thread keeps landing on the same worker"""
+    
+    def __init__(self, nodes: Iterable[int], replicas: int = 64):
+        self.replicas = replicas
+        self._ring = []
+        for node in nodes:
+            self.add(node)
+    
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+    
+    def add(self, node: int):
+        for replica in range(self.replicas):
+            bisect.insort(self._ring, (self._hash(f"{node}:{replica}"), node))
+    
+    def remove(self, node: int):
+        self._ring = [point for point in self._ring if point[1] != node]
+    
+    def __bool__(self) -> bool:
+        return bool(self._ring)
+    
+    def node_for(self, key: str) -> int:
+        position = bisect.bisect(self._ring, (self._hash(key), -1)) % len(self._ring)
+        return self._ring[position][1]
+
+class _RecordingEnvironment:
+    """Wrap a worker's environment so the replies a turn adds can be reported back"""
+    
+    def __init__(self, env):
+        self._env = env
+        self.replies = []
+    
+    def add_reply(self, message: str):
+        self.replies.append(message)
+        return self._env.add_reply(message)
+    
+    def __getattr__(self, name: str):
+        return getattr(self._env, name)
+
+def _serve_jobs(worker_id: int, env_factory, jobs, results):
+    """Worker process loop: build each job's environment locally and serve it until told to drain
+    
+    Jobs are (job id, thread id, payload) and results carry only the replies, so neither
+    side pickles an environment. Caches keyed by thread id (message windows, profile
+    versions, semantic cache) stay warm in the worker that owns the thread.
+    """
+    thread_turns = {}
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, thread_id, payload = job
+        start = time.perf_counter()
+        env = error = None
+        try:
+            env = _RecordingEnvironment(env_factory(thread_id, payload))
+            run(env)
+        except Exception as e:
+            error = repr(e)
+        thread_turns[thread_id] = thread_turns.get(thread_id, 0) + 1
+        results.put((job_id, thread_id, worker_id, env.replies if env is not None else [], error,
+                     time.perf_counter() - start, thread_turns[thread_id]))
+
+class WorkerPool:
+    """Resident worker processes that load the agent once and serve many conversations
+    
+    env_factory(thread_id, payload) must be a picklable top-level callable; it runs in
+    the worker and returns the environment for one turn (for the hub, an Environment
+    opened for that thread). A worker that dies is dropped from the hash ring and its
+    unfinished jobs go to the threads' new owners, so a turn may run twice if the worker
+    died after replying.
+    """
+    
+    def __init__(self, num_workers: int, env_factory):
+        self.num_workers = num_workers
+        self.env_factory = env_factory
+        self.ring = ConsistentHashRing(range(num_workers))
+        self.results = multiprocessing.Queue()
+        self._queues = [multiprocessing.Queue() for _ in range(num_workers)]
+        self._processes = [None] * num_workers
+        self._pending = {}  # job id -> (worker id, thread id, payload)
+        self._next_job_id = 0
+    
+    def _start_worker(self, worker_id: int):
+        process = multiprocessing.Process(target=_serve_jobs, daemon=True,
+                                          args=(worker_id, self.env_factory, self._queues[worker_id], self.results))
+        process.start()
+        self._processes[worker_id] = process
+    
+    def start(self) -> "WorkerPool":
+        for worker_id in range(self.num_workers):
+            self._start_worker(worker_id)
+        return self
+    
+    def _dispatch(self, job_id: int, thread_id: str, payload):
+        worker_id = self.ring.node_for(thread_id)
+        self._pending[job_id] = (worker_id, thread_id, payload)
+        self._queues[worker_id].put((job_id, thread_id, payload))
+    
+    def submit(self, thread_id: str, payload=None) -> int:
+        """Queue one turn for a thread on the worker that owns the thread"""
+        job_id = self._next_job_id
+        self._next_job_id += 1
+        self._dispatch(job_id, thread_id, payload)
+        return job_id
+    
+    def reap(self) -> List[int]:
+        """Drop dead workers from the ring and reroute their unfinished jobs; return the dead worker ids"""
+        dead = [worker_id for worker_id, process in enumerate(self._processes)
+                if process is not None and not process.is_alive()]
+        for worker_id in dead:
+            self._processes[worker_id] = None
+            self.ring.remove(worker_id)
+        if dead:
+            if not self.ring:
+                raise RuntimeError("every worker in the pool has died")
+            for job_id, (worker_id, thread_id, payload) in list(self._pending.items()):
+                if worker_id in dead:
+                    self._dispatch(job_id, thread_id, payload)
+        return dead
+    
+    def result(self, timeout: Optional[float] = None) -> Dict[str, any]:
+        """Wait for the next finished turn, checking for dead workers while waiting"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = 0.5 if deadline is None else min(0.5, deadline - time.monotonic())
+            try:
+                job_id, thread_id, worker_id, replies, error, seconds, thread_turns = self.results.get(timeout=max(wait, 0))
+                break
+            except queue.Empty:
+                self.reap()
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+        self._pending.pop(job_id, None)
+        return {"job_id": job_id, "thread_id": thread_id, "worker_id": worker_id, "replies": replies,
+                "error": error, "seconds": seconds, "thread_turns_on_worker": thread_turns}
+    
+    def drain_worker(self, worker_id: int, timeout: Optional[float] = None):
+        """Let a worker finish the jobs already queued for it, then stop it"""
+        self._queues[worker_id].put(None)
+        self._processes[worker_id].join(timeout)
+    
+    def restart_worker(self, worker_id: int):
+        """Drain a worker (or replace a dead one) and start a fresh process for its threads"""
+        self.reap()
+        if self._processes[worker_id] is not None:
+            self.drain_worker(worker_id)
+        else:
+            # A worker killed inside jobs.get() dies holding the queue's read lock, and its
+            # unfinished jobs were already rerouted by reap(), so the new process gets a fresh queue
+            self._queues[worker_id] = multiprocessing.Queue()
+            self.ring.add(worker_id)
+        self._start_worker(worker_id)
+    
+    def drain(self, timeout: Optional[float] = None):
+        """Gracefully stop all workers once their queued jobs are done"""
+        live = [(worker_id, process) for worker_id, process in enumerate(self._processes) if process is not None]
+        for worker_id, _ in live:
+            self._queues[worker_id].put(None)
+        for _, process in live:
+            process.join(timeout)
+    
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.drain()
 
+# The NEAR AI runtime provides `env`; the offline tools are in tools.py
+if "env" in globals():
+    run(env)
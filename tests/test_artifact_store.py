@@ -0,0 +1,101 @@
+import os
+import threading
+
+import agent
+
+
+def _post(name):
+    return {"project_name": name, "tech_stack": ["React", "Flask"], "problem_statement": "students lose track of deadlines"}
+
+
+def test_post_is_stored_once_and_retrieved_by_hash(tmp_path):
+    store = agent.ArtifactStore(os.path.join(tmp_path, "artifacts.db"))
+    post_hash, text = store.render_post(_post("Planr"), "personal_project", thread_id="t1", user_id="u1")
+    assert text == agent.format_post(_post("Planr"), "personal_project", "balanced")
+    assert store.render_post(_post("Planr"), "personal_project", thread_id="t2", user_id="u2") == (post_hash, text)
+    assert store.stats == {"hits": 1, "renders": 1}
+    
+    artifact = store.get(post_hash)
+    assert artifact["kind"] == "post"
+    assert artifact["inputs"] == {"post_data": _post("Planr"), "activity_type": "personal_project", "tone_style": "balanced"}
+    assert artifact["output"] == text
+    assert store.get("0" * 64) is None
+    assert [found["hash"] for found in store.history(user_id="u2")] == [post_hash]
+
+
+def test_posts_missing_essentials_are_not_stored(tmp_path):
+    store = agent.ArtifactStore(os.path.join(tmp_path, "artifacts.db"))
+    post_hash, text = store.render_post({"project_name": "Planr"}, "personal_project", thread_id="t1")
+    assert post_hash == "" and text
+    assert store.history(thread_id="t1") == []
+
+
+def test_store_survives_reopening(tmp_path):
+    path = os.path.join(tmp_path, "artifacts.db")
+    post_hash, text = agent.ArtifactStore(path).render_post(_post("Planr"), "personal_project", thread_id="t1")
+    reopened = agent.ArtifactStore(path)
+    assert reopened.latest(thread_id="t1", kind="post")["output"] == text
+    assert reopened.render_post(_post("Planr"), "personal_project")[0] == post_hash
+    assert reopened.stats == {"hits": 1, "renders": 0}
+
+
+def test_rerender_and_profile_versions_are_newest_first(tmp_path):
+    store = agent.ArtifactStore(os.path.join(tmp_path, "artifacts.db"))
+    balanced, _ = store.render_post(_post("Planr"), "personal_project", thread_id="t1")
+    narrative, text = store.rerender_post(balanced, "narrative", thread_id="t1")
+    assert narrative != balanced and text == agent.format_post(_post("Planr"), "personal_project", "narrative")
+    assert [found["hash"] for found in store.history(thread_id="t1", kind="post")] == [narrative, balanced]
+    assert store.rerender_post("0" * 64, "formal") is None
+    
+    first = {"headline": "CS Student | Backend Developer"}
+    second = {"headline": "CS Student | ML Engineer"}
+    store.save_profile(first, "t1")
+    store.save_profile(second, "t1")
+    assert store.latest_profile("t1") == second
+    # Going back to an earlier version makes it the latest again
+    store.save_profile(first, "t1")
+    assert store.latest_profile("t1") == first
+    assert store.latest_profile("t2") is None
+
+
+def test_concurrent_writers_share_one_database(tmp_path):
+    path = os.path.join(tmp_path, "artifacts.db")
+    errors = []
+    
+    def write(worker):
+        store = agent.ArtifactStore(path)
+        try:
+            for index in range(25):
+                store.render_post(_post("Shared"), "personal_project", thread_id=f"t{worker}")
+                store.render_post(_post(f"Own {worker}-{index}"), "personal_project", thread_id=f"t{worker}")
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    
+    store = agent.ArtifactStore(path)
+    with store._lock:
+        artifacts = store._db.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        refs = store._db.execute("SELECT COUNT(*) FROM artifact_refs").fetchone()[0]
+    assert artifacts == 1 + 8 * 25
+    assert refs == 8 + 8 * 25
+    assert len(store.history(thread_id="t3", limit=100)) == 26
+
+
+def test_threads_sharing_one_store_instance(tmp_path):
+    store = agent.ArtifactStore(os.path.join(tmp_path, "artifacts.db"))
+    threads = [threading.Thread(target=lambda worker=worker: [
+        store.render_post(_post(f"Post {index % 5}"), "personal_project", thread_id=f"t{worker}") for index in range(20)])
+        for worker in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(store.stats.values()) == 6 * 20
+    assert {found["inputs"]["post_data"]["project_name"] for found in store.history(thread_id="t0")} == {
+        f"Post {index}" for index in range(5)}
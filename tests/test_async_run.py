@@ -0,0 +1,122 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+import agent
+import tools
+
+POST_REQUEST = [{"role": "user", "content": "Help me write a post"},
+                {"role": "assistant", "content": agent.CONVERSATION_TEMPLATES["post_start"]["message"]},
+                {"role": "user", "content": "We built LeetBot at a hackathon with Python and FastAPI, a team of 3. "
+                                            "Our caching cut latency by 40% in the demo."}]
+POST_DATA = json.dumps({"project_name": "LeetBot", "team_size": "3"})
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    for name in ("LINKEDINBUILDR_ARTIFACTS", "LINKEDINBUILDR_STRUCTURED_POSTS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("LINKEDINBUILDR_SEMANTIC_CACHE", "0")
+    agent.get_semantic_cache.cache_clear()
+    agent._MESSAGE_WINDOW_CACHE.clear()
+    yield
+    agent.get_semantic_cache.cache_clear()
+
+
+def _environment(environment, thread_id, latency=0.0):
+    return environment(thread_id, POST_REQUEST, completion_latency=latency, reply=POST_DATA)
+
+
+def test_blocking_completions_run_off_the_event_loop():
+    class Recording(tools.FakeEnvironment):
+        def completion(self, messages, **kwargs):
+            self.thread = threading.current_thread().name
+            return super().completion(messages, **kwargs)
+    
+    async def scenario():
+        env = Recording("off-loop", completion_latency=0.05)
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+        task = asyncio.ensure_future(ticker())
+        await agent.acompletion(env, [{"role": "user", "content": "hi"}])
+        task.cancel()
+        return env.thread, ticks
+    thread, ticks = asyncio.run(scenario())
+    assert thread.startswith("completion")
+    assert ticks > 3
+
+
+def test_local_post_analysis_runs_while_the_model_generates(monkeypatch):
+    prepared = threading.Event()
+    analysis = agent.prepare_post_analysis
+    def prepare(*args, **kwargs):
+        result = analysis(*args, **kwargs)
+        prepared.set()
+        return result
+    monkeypatch.setattr(agent, "prepare_post_analysis", prepare)
+    
+    class WaitsForAnalysis(tools.FakeAsyncEnvironment):
+        async def acompletion(self, messages, **kwargs):
+            # Only finishes if the analysis runs before the reply is awaited
+            for _ in range(200):
+                if prepared.is_set():
+                    return await super().acompletion(messages, **kwargs)
+                await asyncio.sleep(0.005)
+            raise AssertionError("local analysis did not overlap the model call")
+    
+    env = _environment(WaitsForAnalysis, "overlap")
+    asyncio.run(agent.arun(env))
+    assert env.messages[-1]["content"].startswith("Our caching cut latency by 40%")
+
+
+def test_prepared_analysis_covers_metrics_and_missing_fields():
+    prepared = agent.prepare_post_analysis(POST_REQUEST)
+    assert prepared["activity_type"] == "hackathon"
+    assert [metric["value"] for metric in prepared["metrics"]] == ["40%"]
+    assert prepared["local_fields"]["achievement"] == "Our caching cut latency by 40% in the demo."
+    assert prepared["missing"]["essential"] == ["project_name", "team_size"]
+
+
+def test_fields_the_user_answered_are_filled_when_the_model_leaves_them_empty():
+    prepared = agent.prepare_post_analysis(POST_REQUEST)
+    post = agent.render_structured_post(None, POST_REQUEST, POST_DATA, prepared)
+    assert not post.startswith(agent._INFO_REQUEST_OPENING)
+    assert "Our caching cut latency by 40% in the demo." in post
+    request = agent.render_structured_post(None, POST_REQUEST, json.dumps({"project_name": "LeetBot"}), prepared)
+    assert request.startswith(agent._INFO_REQUEST_OPENING)
+    assert "How many people were on your team?" in request and "technologies" not in request
+
+
+def test_sync_and_async_environments_give_the_same_reply():
+    replies = []
+    for environment in (tools.FakeEnvironment, tools.FakeAsyncEnvironment):
+        env = _environment(environment, f"same-{environment.__name__}")
+        agent.run(env)
+        replies.append(env.messages[-1]["content"])
+    assert replies[0] == replies[1]
+
+
+def test_run_inside_an_event_loop_reuses_a_completion_thread_and_its_loop():
+    class Recording(tools.FakeAsyncEnvironment):
+        async def acompletion(self, messages, **kwargs):
+            self.where = (threading.current_thread().name, id(asyncio.get_running_loop()))
+            return await super().acompletion(messages, **kwargs)
+    
+    async def scenario():
+        places = []
+        for turn in range(3):
+            env = _environment(Recording, f"nested-{turn}")
+            agent.run(env)
+            places.append(env.where)
+            assert env.messages[-1]["content"].startswith("Our caching cut latency by 40%")
+        return places
+    places = asyncio.run(scenario())
+    assert all(name.startswith("completion") for name, _ in places)
+    # Each completion thread keeps one loop across turns
+    assert len({loop for _, loop in places}) == len({name for name, _ in places})
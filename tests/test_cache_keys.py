@@ -0,0 +1,85 @@
+import pytest
+
+import agent
+
+np = pytest.importorskip("numpy")
+
+
+def test_context_digest_depends_on_system_message_contents():
+    context = [{"role": "system", "content": "prompt"}, {"role": "system", "content": "profile v1"}]
+    assert agent.context_digest(context) == agent.context_digest([dict(message) for message in context])
+    assert agent.context_digest(context) != agent.context_digest(context[:1] + [{"role": "system", "content": "profile v2"}])
+
+
+def test_semantic_cache_key_is_intent_stack_and_context():
+    cache = agent.SemanticCompletionCache(threshold=0.9, capacity=8)
+    text = "I want to improve my profile, I work with React and Python"
+    cache.store(text, "profile_start", "reply", "ctx-a")
+    assert cache.lookup(text, "profile_start", "ctx-a") == "reply"
+    assert cache.lookup(text, "post_start", "ctx-a") is None
+    assert cache.lookup(text, "profile_start", "ctx-b") is None
+    assert cache.lookup("I want to improve my profile, I work with React and Go", "profile_start", "ctx-a") is None
+
+
+def test_semantic_cache_lookups_do_not_grow_the_key_table():
+    cache = agent.SemanticCompletionCache(capacity=4)
+    for index in range(50):
+        cache.lookup(f"question {index}", "profile_start", f"ctx-{index}")
+    assert cache._key_codes == {}
+
+
+def test_semantic_cache_key_table_is_bounded_by_capacity():
+    cache = agent.SemanticCompletionCache(capacity=4)
+    for index in range(40):
+        cache.store(f"question {index}", "profile_start", f"reply {index}", f"ctx-{index}")
+    assert len(cache) == 4
+    assert len(cache._key_codes) <= 4
+    assert cache.lookup("question 39", "profile_start", "ctx-39") == "reply 39"
+
+
+class CountingEnv:
+    def __init__(self):
+        self.calls = 0
+    
+    def completion(self, messages, **kwargs):
+        self.calls += 1
+        return f"reply {self.calls} to {messages[-1]['content']}"
+
+
+def _conversation(first, reply, second):
+    return [{"role": "user", "content": first}, {"role": "assistant", "content": reply},
+            {"role": "user", "content": second}]
+
+
+def test_second_turns_are_scoped_by_the_earlier_turns(monkeypatch):
+    cache = agent.SemanticCompletionCache(threshold=0.9)
+    monkeypatch.setattr(agent, "get_semantic_cache", lambda: cache)
+    context = [{"role": "system", "content": "post prompt"}]
+    second = "A React and Flask app for students"
+    env = CountingEnv()
+    
+    first_reply = agent.cached_completion(env, _conversation("Help me write a post about my hackathon", "Tell me more!", second),
+                                          "post_start", context)
+    # Another conversation whose second turn reads the same but follows a different first turn
+    other = agent.cached_completion(env, _conversation("Help me write a post about my internship", "Tell me more!", second),
+                                    "post_start", context)
+    assert other != first_reply and env.calls == 2
+    # Same first turn, different assistant reply
+    agent.cached_completion(env, _conversation("Help me write a post about my hackathon", "Which hackathon?", second),
+                            "post_start", context)
+    assert env.calls == 3
+    # Same earlier turns: the reply is reused
+    again = agent.cached_completion(env, _conversation("Help me write a post about my hackathon", "Tell me more!", second),
+                                    "post_start", context)
+    assert again == first_reply and env.calls == 3
+
+
+def test_turns_past_the_limit_are_not_cached(monkeypatch):
+    cache = agent.SemanticCompletionCache(threshold=0.9)
+    monkeypatch.setattr(agent, "get_semantic_cache", lambda: cache)
+    messages = _conversation("hi", "hello", "more") + [{"role": "assistant", "content": "ok"},
+                                                      {"role": "user", "content": "React and Flask"}]
+    assert agent._cacheable_turn(messages, [])[0] is None
+    found, turn, scope = agent._cacheable_turn(messages[:3], [])
+    assert found is cache and turn == "more"
+    assert scope == agent.context_digest(messages[:2])
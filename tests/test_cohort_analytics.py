@@ -0,0 +1,87 @@
+import os
+import threading
+
+import pytest
+
+import agent
+
+np = pytest.importorskip("numpy")
+
+
+def _profile(index):
+    stacks = [["Python", "Django", "PostgreSQL"], ["React", "TypeScript"], ["Python", "TensorFlow"], ["Go", "Docker", "Kubernetes"]]
+    stack = stacks[index % len(stacks)]
+    return {
+        "experiences": [{"description": f"Built a service with {' and '.join(stack)}, cutting latency by {10 + index}%"}],
+        "projects": [{"description": f"Side project {index} using {stack[0]}"}] if index % 2 else [],
+        "skills": {"technical": stack, "soft": ["communication"]},
+    }
+
+
+def _summaries(analytics):
+    return {
+        "all": analytics.summary(),
+        "cohorts": {cohort: analytics.summary(cohort) for cohort in analytics.cohorts},
+        "technology_by_cohort": analytics.technology_by_cohort(),
+        "domain_scores_by_cohort": analytics.domain_scores_by_cohort(),
+    }
+
+
+def test_save_and_load_round_trip(tmp_path):
+    analytics = agent.CohortAnalytics(capacity=4)
+    for index in range(10):
+        analytics.add_profile(_profile(index), cohort="2025" if index < 6 else "2026")
+    path = os.path.join(tmp_path, "cohort.npz")
+    analytics.save(path)
+    assert os.listdir(tmp_path) == ["cohort.npz"]
+    
+    loaded = agent.CohortAnalytics.load(path)
+    assert len(loaded) == 10
+    assert loaded.cohorts == ["2025", "2026"]
+    assert _summaries(loaded) == _summaries(analytics)
+
+
+def test_profiles_added_after_loading_match_a_single_pass(tmp_path):
+    path = os.path.join(tmp_path, "cohort.npz")
+    first = agent.CohortAnalytics(capacity=2)
+    for index in range(5):
+        first.add_profile(_profile(index), cohort="2025")
+    first.save(path)
+    
+    resumed = agent.CohortAnalytics.load(path)
+    for index in range(5, 12):
+        resumed.add_profile(_profile(index), cohort="2026" if index % 3 else "2025")
+    
+    single_pass = agent.CohortAnalytics()
+    for index in range(12):
+        single_pass.add_profile(_profile(index), cohort="2025" if index < 5 or not index % 3 else "2026")
+    assert _summaries(resumed) == _summaries(single_pass)
+    assert resumed.technology_counts()["Python"] == sum("Python" in _profile(index)["skills"]["technical"] for index in range(12))
+
+
+def test_concurrent_saves_leave_one_complete_snapshot(tmp_path):
+    path = os.path.join(tmp_path, "cohort.npz")
+    snapshots = []
+    for size in (3, 6, 9, 12):
+        analytics = agent.CohortAnalytics()
+        for index in range(size):
+            analytics.add_profile(_profile(index))
+        snapshots.append(analytics)
+    errors = []
+    
+    def save(analytics):
+        try:
+            for _ in range(10):
+                analytics.save(path)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=save, args=(analytics,)) for analytics in snapshots]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert os.listdir(tmp_path) == ["cohort.npz"]
+    loaded = agent.CohortAnalytics.load(path)
+    assert any(_summaries(loaded) == _summaries(analytics) for analytics in snapshots)
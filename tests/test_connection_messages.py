@@ -0,0 +1,50 @@
+import pytest
+
+import agent
+
+
+@pytest.mark.parametrize("role, category", [
+    ("Technical Recruiter", "recruiter"),
+    ("Recruiting Coordinator", "recruiter"),
+    ("Talent Acquisition Partner", "recruiter"),
+    ("Senior Software Engineer", "senior"),
+    ("Tech Lead", "senior"),
+    ("Principal Engineer", "senior"),
+    ("Staff Engineer, Infrastructure", "senior"),
+    ("Software Engineer", "peer"),
+    ("", "peer"),
+    ("Mislead Detection Analyst", "peer"),
+    ("Leadership Coach", "peer"),
+    ("Team Lead Intern", "peer"),
+    ("Senior Student Ambassador", "peer"),
+    ("Staffing Specialist", "peer"),
+    ("Talented Generalist", "peer"),
+])
+def test_classify_contact_role(role, category):
+    assert agent.classify_contact_role(role) == category
+
+
+def test_connection_message_follows_the_role_category():
+    context = {"specialization": "backend development", "tech_stack": ["Go"], "interests": ["distributed systems"]}
+    senior = agent.generate_connection_message({"name": "Sam", "role": "Senior Engineer", "company": "Acme"}, context)
+    peer = agent.generate_connection_message({"name": "Sam", "role": "Leadership Coach", "company": "Acme"}, context)
+    assert senior == agent.CONNECTION_MESSAGE_TEMPLATES["senior"].format(
+        name="Sam", company="Acme", specialization="backend development", technology="Go", interest="distributed systems")
+    assert peer == agent.CONNECTION_MESSAGE_TEMPLATES["peer"].format(
+        name="Sam", company="Acme", specialization="backend development", technology="Go", interest="distributed systems")
+
+
+def test_bulk_messages_classify_skip_and_dedup():
+    targets = [
+        {"name": "Ada", "role": "Senior Engineer", "company": "Acme"},
+        {"name": "ada", "role": "Engineer", "company": "ACME"},
+        {"role": "Recruiter"},
+        {"name": "Lin", "role": "Team Lead Intern", "company": ""},
+        {"name": "Kim", "role": "Talent Partner", "company": "Beta"},
+    ]
+    stats = {}
+    records = list(agent.generate_bulk_connection_messages(targets, {}, stats, dedup_capacity=100))
+    assert [(record["name"], record["category"]) for record in records] == [
+        ("Ada", "senior"), ("Lin", "peer"), ("Kim", "recruiter")]
+    assert "your company" in records[1]["message"]
+    assert stats == {"read": 5, "written": 3, "duplicates": 1, "skipped": 1}
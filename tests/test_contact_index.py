@@ -0,0 +1,93 @@
+import csv
+import os
+import random
+
+import pytest
+
+import agent
+
+ROLES = ["Senior Software Engineer", "Tech Lead", "Technical Recruiter", "Junior Backend Developer",
+         "Principal ML Engineer", "Engineering Manager", "Frontend Engineer", "CTO", "Product Designer"]
+COMPANIES = ["Acme", "Beta Labs", "Gamma", "Delta Cloud"]
+SKILLS = ["Python", "React", "Docker", "Kubernetes", "PostgreSQL", "TypeScript", "Go", "TensorFlow", "Excel"]
+
+
+def _write_export(path, count, seed=0):
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["First Name", "Last Name", "Position", "Company", "Skills"])
+        for index in range(count):
+            writer.writerow([f"Person{index}", "Doe", rng.choice(ROLES), rng.choice(COMPANIES),
+                             ", ".join(rng.sample(SKILLS, rng.randint(0, 3)))])
+
+
+def _linear_top_scores(path, query, k):
+    """The ranking a scan of every contact gives: (score, name) for contacts matching any query term"""
+    matchers = {
+        "role": agent.compile_term_matcher(agent.NETWORK_TARGETS["technical"]["roles"]
+                                           + agent.NETWORK_TARGETS["recruitment"]["roles"]),
+        "level": agent.compile_term_matcher(agent.NETWORK_TARGETS["technical"]["levels"]),
+        "specialization": agent.compile_term_matcher(agent.NETWORK_TARGETS["technical"]["specializations"]),
+    }
+    scored = []
+    for contact in agent.iter_contact_rows(path):
+        role = contact.get("role", "")
+        text = " ".join((role, contact.get("company", ""), contact.get("skills", "")))
+        terms = {("tech", term) for term in agent.find_technologies(text)}
+        for group, (pattern, canonical) in matchers.items():
+            terms |= {(group, canonical[match.lower()]) for match in pattern.findall(role if group == "level" else text)}
+        score = len(terms & query)
+        if score:
+            scored.append((score, contact["name"]))
+    scored.sort(key=lambda item: -item[0])
+    return scored
+
+
+@pytest.mark.parametrize("stack, roles, levels, specializations", [
+    (["Python"], [], [], []),
+    (["Python", "Docker", "React"], [], [], []),
+    (["TypeScript"], ["Software Engineer"], ["Senior"], ["Frontend"]),
+    (["Go", "Kubernetes"], ["Tech Lead", "Technical Recruiter"], ["Lead"], ["Backend", "ML"]),
+    (["Rust"], [], [], []),
+])
+@pytest.mark.parametrize("k", [1, 5, 50])
+def test_index_ranking_matches_a_linear_scan(tmp_path, stack, roles, levels, specializations, k):
+    path = os.path.join(tmp_path, "contacts.csv")
+    _write_export(path, 120)
+    index = agent.ContactIndex.from_export(path)
+    query = ({("tech", term) for term in stack} | {("role", term) for term in roles}
+             | {("level", term) for term in levels} | {("specialization", term) for term in specializations})
+    expected = _linear_top_scores(path, query, k)
+    
+    results = index.top_contacts(stack, k=k, roles=roles, levels=levels, specializations=specializations)
+    assert [result["score"] for result in results] == [score for score, _ in expected[:k]]
+    linear_scores = dict((name, score) for score, name in expected)
+    assert all(linear_scores[result["name"]] == result["score"] for result in results)
+    if results and len(expected) > k:
+        # Every contact strictly above the cut-off score is returned; ties at the cut-off may be any of them
+        cutoff = expected[k - 1][0]
+        assert ({result["name"] for result in results if result["score"] > cutoff}
+                == {name for score, name in expected if score > cutoff})
+
+
+def test_index_reports_the_matched_terms(tmp_path):
+    path = os.path.join(tmp_path, "contacts.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Title", "Company", "Skills"])
+        writer.writerow(["Ada", "Senior Software Engineer", "Acme", "Python, Docker"])
+        writer.writerow(["Lin", "Product Designer", "Beta", "Figma"])
+    results = agent.ContactIndex.from_export(path).top_contacts(["Python", "React"], k=5, levels=["Senior"])
+    assert [(result["name"], result["role"], result["company"], result["score"]) for result in results] == [
+        ("Ada", "Senior Software Engineer", "Acme", 2)]
+    assert sorted(results[0]["matched"]) == ["Python", "Senior"]
+
+
+def test_cached_index_is_rebuilt_when_the_export_changes(tmp_path):
+    path = os.path.join(tmp_path, "contacts.csv")
+    _write_export(path, 10)
+    first = agent.load_contact_index(path)
+    assert agent.load_contact_index(path) is first
+    _write_export(path, 25, seed=1)
+    assert len(agent.load_contact_index(path)) == 25
@@ -0,0 +1,34 @@
+import csv
+import os
+from datetime import datetime
+
+import agent
+
+
+def _write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def test_import_linkedin_export(tmp_path):
+    _write_csv(os.path.join(tmp_path, "Profile.csv"), ["First Name", "Last Name", "Headline", "Summary"],
+               [["Ada", "Lovelace", "CS Student | Backend Developer", "APIs and data pipelines"]])
+    _write_csv(os.path.join(tmp_path, "Positions.csv"), ["Company Name", "Title", "Description", "Started On", "Finished On"],
+               [["Acme", "Intern", "Built a Python service. Deployed it with Docker.", "Jun 2023", "Aug 2023"],
+                ["Beta", "Assistant", "Graded Java labs", "Jan 2024", ""]])
+    _write_csv(os.path.join(tmp_path, "Education.csv"), ["School Name", "Degree Name", "Start Date", "End Date"],
+               [["State University", "BSc, Computer Science", "2021", "2025"]])
+    _write_csv(os.path.join(tmp_path, "Skills.csv"), ["Name"], [["Python"], ["Communication"], ["Finance"]])
+    
+    result = agent.import_linkedin_export(str(tmp_path), today=datetime(2024, 3, 1))
+    profile = result["profile_data"]
+    assert profile["name"] == "Ada Lovelace"
+    assert [experience["company"] for experience in profile["experiences"]] == ["Beta", "Acme"]
+    assert profile["experiences"][1]["duration"] == "2023-06 to 2023-08"
+    assert profile["experiences"][1]["responsibilities"] == ["Built a Python service.", "Deployed it with Docker."]
+    assert sorted(profile["experiences"][1]["tech_stack"]) == ["Docker", "Python"]
+    assert profile["education"]["field"] == "Computer Science"
+    assert profile["status"] == "student"
+    assert profile["skills"] == {"technical": ["Python"], "soft": ["Communication"], "domain": ["Finance"]}
@@ -0,0 +1,65 @@
+import pytest
+
+import agent
+import tools
+
+K = agent.MESSAGE_TAIL_SIZE
+
+
+class UnpagedEnvironment(tools.FakeEnvironment):
+    """An environment whose list_messages only returns the whole thread"""
+    
+    def list_messages(self, thread_id=None):
+        return [dict(m) for m in self.messages]
+
+
+def _thread(thread_id, n, environment=tools.FakeEnvironment):
+    return environment(thread_id, [{"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+                                   for i in range(n)])
+
+
+def _full_thread_context(env):
+    """The context built from the full thread: the first message plus the last K"""
+    messages = env.list_messages()
+    return messages if len(messages) <= K else [messages[0]] + messages[-K:]
+
+
+@pytest.fixture(autouse=True)
+def empty_window_cache():
+    agent._MESSAGE_WINDOW_CACHE.clear()
+    yield
+    agent._MESSAGE_WINDOW_CACHE.clear()
+
+
+@pytest.mark.parametrize("environment", [tools.FakeEnvironment, UnpagedEnvironment])
+@pytest.mark.parametrize("n", [0, 1, 2, K - 1, K, K + 1, K + 2, 3 * K])
+def test_window_context_matches_the_full_thread(environment, n):
+    env = _thread(f"thread-{environment.__name__}-{n}", n, environment)
+    window = agent.MessageWindow(env)
+    assert window.context() == _full_thread_context(env)
+    assert window.first() == (env.messages[0] if n else None)
+    assert window.count() == n
+    assert list(window) == env.list_messages()
+
+
+def test_long_threads_only_fetch_the_tail_and_first_message():
+    env = _thread("long", 10 * K)
+    window = agent.MessageWindow(env)
+    assert window.context()[0]["content"] == "message 0"
+    assert window.context()[1]["content"] == f"message {9 * K}"
+    assert window.fetched == K + 1
+
+
+def test_cached_window_follows_the_thread_across_turns():
+    env = _thread("turns", K - 2)
+    for _ in range(6):
+        window = agent.MessageWindow(env)
+        assert window.context() == _full_thread_context(env)
+        assert window.count() == len(env.messages)
+        assert window.count_at_least(K) == (len(env.messages) >= K)
+        env.add_reply("reply")
+        env.add_user_message("next")
+    # A cached window only refetches the tail, never the first message again
+    window = agent.MessageWindow(env)
+    assert window.context()[0]["content"] == "message 0"
+    assert window.fetched == K
@@ -0,0 +1,38 @@
+import pytest
+
+import agent
+
+
+@pytest.mark.parametrize("reply, expected", [
+    ('{"project_name": "Planr"}', {"project_name": "Planr"}),
+    ('```json\n{"project_name": "Planr"}\n```', {"project_name": "Planr"}),
+    ('Sure! {"tech_stack": ["React", "Flask",],} Hope that helps', {"tech_stack": ["React", "Flask"]}),
+    ("{'team_size': '4', 'won': True, 'link': None}", {"team_size": "4", "won": True, "link": None}),
+    ('{"project_name": "Planr", "tech_stack": ["React", "Fla', {"project_name": "Planr", "tech_stack": ["React", "Fla"]}),
+    ('{"a": {"b": 1}} trailing {"c": 2}', {"a": {"b": 1}}),
+])
+def test_repair_post_json(reply, expected):
+    assert agent.repair_post_json(reply) == expected
+
+
+@pytest.mark.parametrize("reply", ["", "no json here", "[1, 2, 3]", "{not: json: at all"])
+def test_repair_post_json_gives_up(reply):
+    assert agent.repair_post_json(reply) is None
+
+
+def test_coerce_post_data_follows_field_types():
+    post_data = agent.coerce_post_data({
+        "project_name": ["Planr", "v2"],
+        "tech_stack": [["React"], "Flask", {"db": "PostgreSQL"}],
+        "team_size": 4,
+        "achievement": ["First place", "Best UI"],
+        "hashtags": ["#hackathon"],
+        "unknown": "dropped",
+    }, "hackathon")
+    assert post_data["project_name"] == "Planr, v2"
+    assert post_data["tech_stack"] == ["React", "Flask", "PostgreSQL"]
+    assert post_data["team_size"] == "4"
+    assert post_data["achievement"] == "First place, Best UI"
+    assert post_data["achievements"] == ["First place, Best UI"]
+    assert post_data["hashtags"] == ["hackathon"]
+    assert "unknown" not in post_data
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+import agent
+
+USER = [{"role": "user", "content": "Write a post about StudyBuddy, a React and Flask app I built. "
+                                    "Code: https://github.com/ana/studybuddy and demo at https://studybuddy.app."}]
+DRAFT = "🚀 Excited to share StudyBuddy!\n\nIt helps students track group deadlines.\n\nThanks for reading."
+
+
+def _hashtags(post):
+    return re.findall(r"#(\w+)", post.split("\n\n")[-1])
+
+
+def test_clean_drafts_are_returned_unchanged():
+    draft = DRAFT + "\n\nhttps://github.com/ana/studybuddy https://studybuddy.app\n\n#React #Flask"
+    assert agent.postprocess_post(draft, USER) == draft
+
+
+def test_hashtags_are_capped_preferring_smart_hashtags():
+    tags = ["Coding", "Life", "Motivation", "Tech", "Students", "Hustle", "React", "Flask"]
+    post = agent.postprocess_post(DRAFT + "\n\n" + " ".join(f"#{tag}" for tag in tags), USER)
+    kept = _hashtags(post)
+    assert len(kept) == agent.POST_MAX_HASHTAGS
+    assert {"React", "Flask"} <= set(agent.prepare_post_analysis(USER)["hashtags"])
+    assert {"React", "Flask"} <= set(kept)
+    assert post.startswith(DRAFT)
+
+
+def test_hashtags_are_deduplicated_case_insensitively():
+    post = agent.postprocess_post(DRAFT + "\n\n#React #react #REACT #Flask\n#Flask #Python #Students #WebDev",
+                                  USER)
+    kept = _hashtags(post)
+    assert [tag.lower() for tag in kept] == list(dict.fromkeys(tag.lower() for tag in kept))
+    assert len(kept) <= agent.POST_MAX_HASHTAGS
+    assert kept[0] == "React"
+
+
+def test_missing_user_links_are_restored():
+    post = agent.postprocess_post(DRAFT + "\n\n#React", USER)
+    assert "Links: GitHub: https://github.com/ana/studybuddy | Demo: https://studybuddy.app" in post
+    assert post.endswith("#React")
+
+
+def test_links_already_in_the_draft_are_not_repeated():
+    post = agent.postprocess_post(DRAFT + "\n\nCode: https://github.com/ana/studybuddy\n\n#React", USER)
+    assert "Links: Demo: https://studybuddy.app" in post
+    assert post.count("https://github.com/ana/studybuddy") == 1
+
+
+def test_latest_user_links_win():
+    messages = USER + [{"role": "assistant", "content": "See https://github.com/bot/other"},
+                       {"role": "user", "content": "New repo: https://github.com/ana/studybuddy-v2."}]
+    assert agent.extract_user_links(messages) == {"github_link": "https://github.com/ana/studybuddy-v2",
+                                                  "demo_link": "https://studybuddy.app"}
+
+
+def test_prepared_analysis_gives_the_same_post():
+    draft = DRAFT + "\n\n#Coding #Life #Motivation #Tech #Students #Hustle #React #Flask"
+    prepared = agent.prepare_post_analysis(USER)
+    assert agent.postprocess_post(draft, USER, prepared=prepared) == agent.postprocess_post(draft, USER)
+
+
+@pytest.mark.parametrize("max_length", [160, 200, 300])
+def test_long_drafts_are_trimmed_at_section_boundaries_with_tags_and_links_kept(max_length):
+    post = agent.postprocess_post(DRAFT + "\n\n#React #Flask", USER, max_length=max_length)
+    assert len(post) <= max_length
+    assert post.startswith("🚀 Excited to share StudyBuddy!")
+    assert post.endswith("#React #Flask")
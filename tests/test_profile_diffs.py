@@ -0,0 +1,90 @@
+import agent
+
+
+class Env:
+    thread_id = "thread-1"
+
+
+def test_parse_profile_text_splits_sections_entries_and_outro():
+    reply = ("Here is your refreshed profile.\n\n"
+             "**Headline:** CS Student | Backend Developer\n\n"
+             "About:\nI build APIs in Python.\n\n"
+             "## Experience\n"
+             "Software Intern at Acme\n- Built a billing service\n\n"
+             "- Cut p95 latency by 30%\n\n"
+             "Research Assistant at State University\nStack: Python, NumPy\n\n"
+             "Education:\nBSc Computer Science\n\n"
+             "Want me to tailor it for frontend roles?")
+    intro, sections, outro = agent.parse_profile_text(reply)
+    assert intro == "Here is your refreshed profile."
+    assert sections["headline"] == "CS Student | Backend Developer"
+    assert sections["about"] == "I build APIs in Python."
+    assert sections["experience"] == [
+        "Software Intern at Acme\n- Built a billing service\n\n- Cut p95 latency by 30%",
+        "Research Assistant at State University\nStack: Python, NumPy",
+    ]
+    assert sections["education"] == "BSc Computer Science"
+    assert outro == "Want me to tailor it for frontend roles?"
+
+
+def test_parse_profile_text_without_sections_is_all_intro():
+    assert agent.parse_profile_text("  Just a question?  ") == ("Just a question?", {}, "")
+
+
+def test_line_changes_keeps_lines_that_look_like_headers():
+    before = "Built APIs\n--- legacy notes\nShipped v1"
+    after = "Built APIs\n+++ new notes\nShipped v2"
+    assert agent._line_changes(before, after) == ["- --- legacy notes", "- Shipped v1", "+ +++ new notes", "+ Shipped v2"]
+
+
+def test_line_changes_of_identical_text_is_empty():
+    assert agent._line_changes("same\ntext", "same\ntext") == []
+
+
+def test_diff_profile_sections_by_entry():
+    old = {"headline": "CS Student", "about": "",
+           "experience": ["Intern at Acme\n- Built X", "Tutor at State\n- Taught Y"]}
+    new = {"headline": "CS Student", "about": "I build APIs.",
+           "experience": ["Intern at Acme\n- Built X faster", "Assistant at Lab\n- Ran Z"]}
+    assert agent.diff_profile_sections(old, new) == [
+        {"section": "about", "kind": "added", "text": "I build APIs."},
+        {"section": "experience", "entry": "Intern at Acme", "kind": "changed", "lines": ["- - Built X", "+ - Built X faster"]},
+        {"section": "experience", "entry": "Assistant at Lab", "kind": "added", "text": "Assistant at Lab\n- Ran Z"},
+        {"section": "experience", "entry": "Tutor at State", "kind": "removed"},
+    ]
+
+
+def test_diff_profile_sections_ignores_sections_missing_from_the_new_version():
+    assert agent.diff_profile_sections({"headline": "A", "about": "B"}, {"headline": "A"}) == []
+
+
+def test_format_profile_diff():
+    changes = [{"section": "headline", "kind": "changed", "lines": ["- CS Student", "+ CS Student | Python"]},
+               {"section": "experience", "entry": "Tutor at State", "kind": "removed"}]
+    assert agent.format_profile_diff(changes) == ("Updated Headline:\n- CS Student\n+ CS Student | Python\n\n"
+                                                  "Removed Experience - Tutor at State")
+    assert agent.format_profile_diff([]) == "No sections changed from the previous version."
+
+
+def _profile_reply(headline: str) -> str:
+    about = "I build backend services in Python and care about latency. " * 10
+    return f"Headline: {headline}\n\nAbout:\n{about}\n\nEducation:\nBSc Computer Science"
+
+
+def test_compact_profile_reply_sends_changes_after_a_stored_version():
+    store = agent.ArtifactStore()
+    first = _profile_reply("CS Student")
+    assert agent.compact_profile_reply(Env(), first, store) == first
+    compact = agent.compact_profile_reply(Env(), _profile_reply("CS Student | Python"), store)
+    assert compact == "Updated Headline:\n- CS Student\n+ CS Student | Python"
+    assert store.latest_profile("thread-1")["headline"] == "CS Student | Python"
+    context = agent.current_profile_context(Env(), store)
+    assert "CS Student | Python" in context["content"] and "BSc Computer Science" in context["content"]
+
+
+def test_compact_profile_reply_without_a_store_sends_full_profiles(monkeypatch):
+    monkeypatch.setattr(agent, "get_artifact_store", lambda: None)
+    for headline in ("CS Student", "CS Student | Python"):
+        reply = _profile_reply(headline)
+        assert agent.compact_profile_reply(Env(), reply) == reply
+    assert agent.current_profile_context(Env()) is None
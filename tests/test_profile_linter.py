@@ -0,0 +1,129 @@
+import pytest
+
+import agent
+
+
+# suggest_profile_improvements and generate_improvement_suggestions as they were before ProfileLinter
+def baseline_profile_improvements(profile):
+    suggestions = []
+    if len(profile.get("headline", "")) < 50:
+        suggestions.append("Consider adding more detail to your headline to improve visibility")
+    about = profile.get("about", "")
+    if len(about) < 200:
+        suggestions.append("Your about section could benefit from more content - aim for 200-2000 characters")
+    if "achievements" not in about.lower():
+        suggestions.append("Consider adding specific achievements to your about section")
+    experiences = profile.get("experience", [])
+    if experiences:
+        if not any("achievement" in exp.lower() for exp in experiences):
+            suggestions.append("Add quantifiable achievements to your experience entries")
+        if not any("tech stack" in exp.lower() for exp in experiences):
+            suggestions.append("Include technical stack details in your experience descriptions")
+    skills = profile.get("skills", "")
+    if len(skills.split("\n")) < 10:
+        suggestions.append("Add more relevant skills to increase profile visibility")
+    return suggestions
+
+
+def baseline_improvement_suggestions(section, content):
+    suggestions = []
+    templates = agent.CONVERSATION_TEMPLATES["improvement_suggestions"]
+    tech = agent.TECH_KEYWORDS["languages"] + agent.TECH_KEYWORDS["frameworks"]
+    if section == "headline":
+        if len(content) < 50:
+            suggestions.append(templates["headline"]["too_short"])
+        if not any(term in content for term in tech):
+            suggestions.append(templates["headline"]["no_tech"])
+    elif section == "about":
+        if len(content) < 200:
+            suggestions.append(templates["about"]["too_short"])
+        if "achieve" not in content.lower():
+            suggestions.append(templates["about"]["no_achievements"])
+    elif section == "experience":
+        if not any(metric in content.lower() for metric in ["%", "increased", "improved", "reduced"]):
+            suggestions.append(templates["experience"]["no_metrics"])
+        if not any(term in content for term in tech):
+            suggestions.append(templates["experience"]["no_tech_stack"])
+    return suggestions
+
+
+def _rule_messages():
+    """Every message a registered rule can report, outside the baseline wording"""
+    return {message for section in agent.CONVERSATION_TEMPLATES["improvement_suggestions"].values()
+            for message in section.values()}
+
+
+PROFILES = {
+    "empty": {},
+    "empty_sections": {"headline": "", "about": "", "experience": [], "skills": ""},
+    "partial": {"headline": "CS Student", "experience": ["Intern at Acme, built internal dashboards"]},
+    "strong_headline": {"headline": "CS Student | Backend Developer | Python, Django and PostgreSQL", "about": "Hi"},
+}
+
+
+@pytest.mark.parametrize("name", sorted(PROFILES))
+def test_profile_suggestions_keep_the_baseline_messages(name):
+    profile = PROFILES[name]
+    messages = agent.suggest_profile_improvements(profile)
+    baseline = set(agent._PROFILE_IMPROVEMENT_MESSAGES.values())
+    assert [message for message in messages if message in baseline] == baseline_profile_improvements(profile)
+    assert all(message in baseline or message in _rule_messages() for message in messages)
+
+
+def test_empty_profile_reports_every_missing_section_first():
+    assert agent.suggest_profile_improvements({}) == [
+        "Consider adding more detail to your headline to improve visibility",
+        "Including a key technology could make your headline more discoverable.",
+        "Your about section could benefit from more content - aim for 200-2000 characters",
+        "Consider adding specific achievements to your about section",
+        "Including your career goals could make your profile more engaging.",
+        "Add more relevant skills to increase profile visibility",
+    ]
+
+
+@pytest.mark.parametrize("section, content", [
+    ("headline", ""),
+    ("headline", "CS Student"),
+    ("headline", "CS Student | Backend Developer | Python, Django and PostgreSQL"),
+    ("about", ""),
+    ("about", "I build things."),
+    ("experience", ""),
+    ("experience", "Built a React dashboard that reduced support tickets by 20%"),
+])
+def test_section_suggestions_match_the_baseline(section, content):
+    messages = agent.generate_improvement_suggestions(section, content)
+    goals = agent.CONVERSATION_TEMPLATES["improvement_suggestions"]["about"]["no_goals"]
+    assert [message for message in messages if message != goals] == baseline_improvement_suggestions(section, content)
+
+
+def test_about_reports_missing_goals():
+    goals = agent.CONVERSATION_TEMPLATES["improvement_suggestions"]["about"]["no_goals"]
+    assert goals in agent.generate_improvement_suggestions("about", "")
+    assert goals not in agent.generate_improvement_suggestions("about", "My goal is a backend role.")
+
+
+def test_findings_carry_rule_section_entry_and_span():
+    text = "• worked on stuff\n• Built a Python API using FastAPI that cut latency by 30%"
+    findings = agent.ProfileLinter().lint({"experience": [text]})
+    vague = [finding for finding in findings if finding["rule"] == "experience.vague_responsibilities"]
+    assert len(vague) == 1
+    assert vague[0]["section"] == "experience" and vague[0]["entry"] == 0
+    assert text[vague[0]["start"]:vague[0]["end"]] == "• worked on stuff"
+    assert not [finding for finding in findings if finding["rule"] in ("experience.no_metrics", "experience.no_tech_stack")]
+
+
+def test_registered_rules_run_once_per_section_and_report_costs(monkeypatch):
+    monkeypatch.setitem(agent.PROFILE_LINT_RULES, "about.mentions_rust", (("about",), lambda tokens: [
+        agent._finding("about.mentions_rust", tokens, "Rust!")] if "rust" in tokens.words else []))
+    linter = agent.ProfileLinter()
+    assert agent.lint_messages(linter.lint({"about": "I write Rust"})).count("Rust!") == 1
+    assert linter.rule_calls["about.mentions_rust"] == 1
+    assert linter.rule_calls["headline.too_short"] == 1
+    assert set(linter.rule_costs()) == set(linter.rule_calls)
+
+
+def test_a_rule_subset_only_runs_those_rules():
+    linter = agent.ProfileLinter(rules=["skills.too_few"])
+    assert [finding["rule"] for finding in linter.lint({})] == ["skills.too_few"]
+    with pytest.raises(KeyError):
+        agent.ProfileLinter(rules=["no.such_rule"])
@@ -0,0 +1,78 @@
+import pytest
+
+import agent
+
+POST = """🚀 Excited to share StudyBuddy! It keeps student groups on top of deadlines. We launched it last week.
+
+Key Technical Highlights:
+• Built a REST API with Flask and PostgreSQL
+• Deployed on Kubernetes with a CI/CD pipeline
+• Cut API latency by 40%
+
+It started as a weekend idea. Now 300 students use it. Next up is calendar sync.
+
+Links: GitHub: https://github.com/ana/studybuddy-api | Demo: https://studybuddy.app
+
+#Flask #API #SideProject"""
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Built an API and a REST API.", "Built an interface and a web interface."),
+    ("Designed a microservice and an endpoint.", "Designed a small independent service and a web address."),
+    ("API design matters.", "Interface design matters."),
+    ("We shipped. The API was scalable.", "We shipped. The interface was able to grow."),
+    ("• API latency down 40%", "• Interface response time down 40%"),
+    ("Improved throughput of the database.", "Improved amount of work handled of the data store."),
+    ("Set up the CI/CD pipeline and CI/CD.", "Set up the automated release process and automated testing and releases."),
+    ("Rapid prototyping", "Rapid prototyping"),
+])
+def test_simplify_replaces_jargon_and_fixes_articles(text, expected):
+    assert agent.simplify_technical_text(text) == expected
+
+
+def test_simplify_leaves_urls_and_hashtags_alone():
+    text = "See https://studybuddy.app/api/latency and https://github.com/ana/ci-cd #API #Kubernetes #MLOps"
+    assert agent.simplify_technical_text(text) == text
+
+
+def test_simplify_matches_whole_terms_only():
+    assert agent.simplify_technical_text("APIary rapid deployments") == "APIary rapid deployments"
+
+
+def test_less_technical_edit_simplifies_the_post():
+    edited = agent.apply_quick_edit(POST, "less_technical")
+    assert "Key Highlights:" in edited and "Technical" not in edited
+    assert "• Built a web interface with Flask and PostgreSQL" in edited
+    assert "• Launched on large-scale app hosting with an automated release process" in edited
+    assert edited.endswith("https://studybuddy.app\n\n#Flask #API #SideProject")
+
+
+def test_shorten_keeps_opening_two_bullets_links_and_hashtags():
+    assert agent.shorten_post(POST) == """🚀 Excited to share StudyBuddy! It keeps student groups on top of deadlines.
+
+Key Technical Highlights:
+• Built a REST API with Flask and PostgreSQL
+• Deployed on Kubernetes with a CI/CD pipeline
+
+It started as a weekend idea.
+
+Links: GitHub: https://github.com/ana/studybuddy-api | Demo: https://studybuddy.app
+
+#Flask #API #SideProject"""
+
+
+def test_shorten_leaves_short_posts_alone():
+    post = "Shipped StudyBuddy!\n\n#Flask"
+    assert agent.shorten_post(post) == post
+
+
+def test_lengthen_adds_a_stack_line_and_closing_question_before_the_trailer():
+    sections = agent.lengthen_post(POST).split("\n\n")
+    assert sections[1].startswith("Built with: ") and "Flask" in sections[1] and "PostgreSQL" in sections[1]
+    assert sections[-3] == agent.POST_CLOSING_QUESTIONS["personal_project"]
+    assert sections[-2:] == POST.split("\n\n")[-2:]
+
+
+def test_lengthen_does_not_repeat_a_stack_line_or_a_question():
+    post = "Built with Flask and React. What should I add next?\n\n#Flask"
+    assert agent.lengthen_post(post) == post
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+import agent
+import tools
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_profile_records_validate_like_dicts(seed):
+    rng = random.Random(seed)
+    for index in range(200):
+        data = tools._sample_profile_data(rng, index)
+        record = agent.ProfileRecord.from_dict(data)
+        assert agent.validate_profile_data(record) == agent.validate_profile_data(data)
+        assert record.to_dict() == data
+
+
+@pytest.mark.parametrize("activity_type", list(agent.REQUIRED_INFO))
+def test_post_records_check_like_dicts(activity_type):
+    rng = random.Random(activity_type)
+    for _ in range(100):
+        data = tools._sample_post_data(rng, activity_type)
+        record = agent.PostRecord.from_dict(data)
+        assert agent.check_missing_info(activity_type, record) == agent.check_missing_info(activity_type, data)
+
+
+@pytest.mark.parametrize("data", [
+    {"headline": {"role": ""}},
+    {"headline": {}},
+    {"headline": {"role": "CS Student", "specialization": None}},
+    {},
+])
+def test_empty_and_absent_profile_fields(data):
+    assert agent.validate_profile_data(agent.ProfileRecord.from_dict(data)) == agent.validate_profile_data(data)
+
+
+def test_empty_post_fields_count_as_missing():
+    data = {"project_name": "", "tech_stack": [], "team_size": "4"}
+    assert (agent.check_missing_info("hackathon", agent.PostRecord.from_dict(data))
+            == agent.check_missing_info("hackathon", data))
+
+
+@pytest.mark.parametrize("data", [{"headline": "Student at X"}, {"education": ["BSc"]}, {"experiences": ["Intern"]},
+                                  {"experiences": {"role": "Intern"}}])
+def test_nested_values_are_type_checked(data):
+    with pytest.raises(TypeError):
+        agent.ProfileRecord.from_dict(data)
+
+
+def test_records_are_read_only_mappings():
+    data = {"name": "Ada", "headline": {"role": "CS Student"}, "skills": {"technical": ["Python"]},
+            "experiences": [{"role": "Intern"}], "favorite_color": "green"}
+    record = agent.ProfileRecord.from_dict(data)
+    assert isinstance(record, agent.Mapping)
+    assert record["name"] == "Ada" and record["favorite_color"] == "green"
+    assert record["headline"]["role"] == "CS Student"
+    assert record["experiences"][0]["role"] == "Intern"
+    assert "name" in record and "about" not in record and "favorite_color" in record
+    assert list(record) == ["headline", "experiences", "skills", "name", "favorite_color"]
+    assert len(record) == 5 and dict(record).keys() == data.keys()
+    assert record.get("about", "none") == "none"
+    with pytest.raises(KeyError):
+        record["about"]
@@ -0,0 +1,178 @@
+"""User-controlled regex paths must stay linear on adversarial input
+
+Each case times its target on inputs that double in size. The growth exponent
+between the smallest and largest input (linear is ~1, quadratic ~2) must stay
+under MAX_EXPONENT, and the largest input must finish within BUDGET_SECONDS.
+Targets that finish the largest input in under a millisecond are timer noise.
+"""
+import math
+import random
+import re
+import time
+from collections import OrderedDict
+
+import pytest
+
+import agent
+
+BASE_SIZE = 8000
+DOUBLINGS = 3
+MAX_EXPONENT = 1.5
+BUDGET_SECONDS = 0.5
+NOISE_SECONDS = 1e-3
+
+
+def _adversarial_text(rng, size, vocabulary, separators=" "):
+    """Build roughly `size` characters of randomly shuffled near-miss input"""
+    parts, length = [], 0
+    while length < size:
+        part = rng.choice(vocabulary) + rng.choice(separators)
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def _regex_guard_cases():
+    """User-controlled regex paths, each with an adversarial input builder"""
+    metric_words = [metric for metric in agent._METRIC_NAME_PATTERNS] + ["latency", "Memory", "coverage", "x"]
+    tech_near_misses = ["Pytho", "Reac", "C+", "Next.", "Go_", "AWSX", "Machine", "Learnin", "CI/", "a.b.c"]
+    return {
+        "extract_metrics/metric_words_without_numbers": (
+            lambda text: agent.extract_metrics({"description": text}),
+            lambda rng, size: _adversarial_text(rng, size, metric_words)
+        ),
+        "extract_metrics/numbers_on_other_lines": (
+            lambda text: agent.extract_metrics({"description": text}),
+            lambda rng, size: _adversarial_text(rng, size, metric_words + ["\n42%"], " \n")
+        ),
+        "calculate_technical_depth/metric_words": (
+            lambda text: agent.calculate_technical_depth({"description": text}),
+            lambda rng, size: _adversarial_text(rng, size, metric_words + ["using", "solved"])
+        ),
+        "apply_quick_edit/less_technical_bullet_wall": (
+            lambda text: agent.apply_quick_edit(text, "less_technical"),
+            lambda rng, size: _adversarial_text(rng, size, ["•", "• API", "word", "••"], " •")
+        ),
+        "apply_quick_edit/less_technical_long_bullets": (
+            lambda text: agent.apply_quick_edit(text, "less_technical"),
+            lambda rng, size: "Technical Implementation:\n" + _adversarial_text(rng, size, ["• latency", "Kubernetes", "x"], " \n")
+        ),
+        "find_technologies/near_misses": (
+            agent.find_technologies,
+            lambda rng, size: _adversarial_text(rng, size, tech_near_misses, " .-/")
+        ),
+        "extract_headline_fields/role_and_specialization_near_misses": (
+            agent.extract_headline_fields,
+            lambda rng, size: _adversarial_text(rng, size, ["CS", "Computer", "Science", "Full", "Stack", "Back"], " -")
+        ),
+        "suggest_headline_alternatives/keyword_wall": (
+            lambda text: agent.suggest_headline_alternatives([{"role": "user", "content": text}]),
+            lambda rng, size: _adversarial_text(rng, size, ["headline", "other", "more", "options"])
+        ),
+        "profile_linter/bullet_wall": (
+            lambda text: agent.ProfileLinter().lint({"experience": [text], "about": text}),
+            lambda rng, size: _adversarial_text(rng, size, ["• worked on", "• latency", "30%", "a.b-c", "React"], " \n")
+        ),
+        "skill_tokenizer/dotted_chains": (
+            agent._SKILL_TOKEN_PATTERN.findall,
+            lambda rng, size: _adversarial_text(rng, size, ["a.b", "c/d", "e-f", "g+", "#"], ".")
+        ),
+        "postprocess_post/hashtag_and_link_wall": (
+            lambda text: agent.postprocess_post(text, [{"role": "user", "content": text}], max_length=len(text) + 1),
+            lambda rng, size: _adversarial_text(rng, size, ["#", "#a", "#React_", "https://", "http://x.y/(", "word."], " \n")
+        ),
+        "simplify_technical_text/jargon_near_misses": (
+            agent.simplify_technical_text,
+            lambda rng, size: _adversarial_text(rng, size, list(agent._JARGON_TABLE)[:20] + ["an", "a", "APIx", "#API"], " -/")
+        ),
+        "parse_profile_text/header_wall": (
+            agent.parse_profile_text,
+            lambda rng, size: _adversarial_text(rng, size, ["**Experience", "About:", "## Headline", "• x:", "Education"], " \n")
+        ),
+        "repair_post_json/unbalanced_wall": (
+            agent.repair_post_json,
+            lambda rng, size: "{" + _adversarial_text(rng, size, ['"a":', "[", "{", '"', "True,", ",]"], " ")
+        )
+    }
+
+
+def _module_patterns():
+    """Every compiled regex held at agent module level, including inside matcher tuples, tables and lists"""
+    found = {}
+    def collect(name: str, value, depth: int):
+        if isinstance(value, re.Pattern):
+            found[name] = value
+        elif depth and isinstance(value, (tuple, list)):
+            for index, item in enumerate(value):
+                collect(f"{name}[{index}]", item, depth - 1)
+        elif depth and isinstance(value, dict) and not isinstance(value, OrderedDict):
+            for key, item in value.items():
+                collect(f"{name}[{key!r}]", item, depth - 1)
+    for name, value in list(vars(agent).items()):
+        collect(name, value, 2)
+    return found
+
+
+def _pattern_near_misses(pattern):
+    """Words from a pattern's source, whole and truncated, plus punctuation regexes tend to backtrack on"""
+    words = sorted(set(re.findall(r"[A-Za-z]{2,}", pattern.pattern)))[:100]
+    return words + [word[:-1] for word in words] + ["#", "•", "-", ":", "http://", "1.5", "40%", "{", '"', "a.b", "\n"]
+
+
+def _pattern_guard_cases():
+    """One case per module-level regex, so patterns added later are guarded without registering them"""
+    return {
+        f"pattern/{name}": (
+            # Whole text for scanning patterns, line by line for anchored ones used per line
+            lambda text, pattern=pattern: (sum(1 for _ in pattern.finditer(text))
+                                           + sum(1 for line in text.split("\n") if pattern.search(line))),
+            lambda rng, size, vocabulary=_pattern_near_misses(pattern): _adversarial_text(rng, size, vocabulary, " \n.")
+        )
+        for name, pattern in _module_patterns().items()
+    }
+
+
+def _check_metric_equivalence(rng, trials):
+    """Property check: linear extract_metrics agrees with the original regex on random inputs"""
+    vocabulary = ["latency", "LATENCY", "memory", "error_rate", "load_time", "12", "3.5", "40%", "ms", "\n", "x.y"]
+    failures = []
+    for _ in range(trials):
+        text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30)))
+        expected = []
+        for project_type, details in agent.TECHNICAL_CONTEXT["project_types"].items():
+            for metric in details["key_metrics"]:
+                matches = re.findall(f"(?i){metric}.*?([0-9]+(?:\\.[0-9]+)?%?)", text)
+                if matches:
+                    expected.append({"type": metric, "value": matches[0], "context": project_type})
+        if agent.extract_metrics({"description": text}) != expected:
+            failures.append(text)
+    return failures
+
+
+GUARD_CASES = {**_regex_guard_cases(), **_pattern_guard_cases()}
+
+
+@pytest.mark.parametrize("name", sorted(GUARD_CASES))
+def test_regex_path_stays_linear(name):
+    target, build_input = GUARD_CASES[name]
+    rng = random.Random(name)
+    timings = []
+    for step in range(DOUBLINGS + 1):
+        text = build_input(rng, BASE_SIZE * 2 ** step)
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            target(text)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+    exponent = math.log(timings[-1] / max(timings[0], 1e-9)) / math.log(2 ** DOUBLINGS)
+    assert timings[-1] <= BUDGET_SECONDS, f"{name} took {timings[-1]:.3f}s on {BASE_SIZE * 2 ** DOUBLINGS} characters"
+    assert exponent <= MAX_EXPONENT or timings[-1] < NOISE_SECONDS, f"{name} grows like n^{exponent:.2f}: {timings}"
+
+
+def test_every_module_level_pattern_is_guarded():
+    assert len(_pattern_guard_cases()) == len(_module_patterns()) > 20
+
+
+def test_linear_extract_metrics_matches_the_original_regex():
+    assert _check_metric_equivalence(random.Random(0), trials=500) == []
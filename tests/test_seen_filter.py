@@ -0,0 +1,43 @@
+import math
+
+import agent
+
+
+def _keys(prefix, count):
+    return [f"{prefix}-{index}|company-{index % 97}".encode() for index in range(count)]
+
+
+def test_seen_filter_has_no_false_negatives():
+    seen = agent.SeenFilter(capacity=5000, error_rate=1e-3)
+    keys = _keys("contact", 5000)
+    for key in keys:
+        seen.add(key)
+    assert all(key in seen for key in keys)
+    assert all(seen.add(key) for key in keys)
+
+
+def test_seen_filter_remembers_early_keys_through_capacity():
+    seen = agent.SeenFilter(capacity=2000, error_rate=1e-3)
+    early = _keys("early", 50)
+    for key in early:
+        assert not seen.add(key)
+    for key in _keys("later", 1950):
+        seen.add(key)
+    assert all(seen.add(key) for key in early)
+
+
+def test_seen_filter_is_sized_by_capacity_and_error_rate():
+    seen = agent.SeenFilter(agent.BULK_DEDUP_CAPACITY, agent.BULK_DEDUP_ERROR_RATE)
+    assert seen.hashes == 13
+    assert 2.3e6 < len(seen._bits) < 2.5e6
+    small = agent.SeenFilter(capacity=1000, error_rate=0.01)
+    assert small.size == math.ceil(-1000 * math.log(0.01) / math.log(2) ** 2)
+    assert small.hashes == 7
+
+
+def test_seen_filter_false_positive_rate_stays_near_target():
+    seen = agent.SeenFilter(capacity=10000, error_rate=0.01)
+    for key in _keys("member", 10000):
+        seen.add(key)
+    false_positives = sum(key in seen for key in _keys("stranger", 20000))
+    assert false_positives / 20000 < 0.015
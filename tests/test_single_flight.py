@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import agent
+
+
+def test_completion_key_covers_role_content_and_order_only():
+    payload = [{"role": "system", "content": "prompt"}, {"role": "user", "content": "hi"}]
+    key = agent.completion_key(payload)
+    assert agent.completion_key([dict(message, id="msg_1") for message in payload]) == key
+    assert agent.completion_key([{"role": "user", "content": "prompt"}, payload[1]]) != key
+    assert agent.completion_key(list(reversed(payload))) != key
+    # Field boundaries are delimited, so content can't shift between messages
+    assert (agent.completion_key([{"role": "user", "content": "ab"}, {"role": "user", "content": "c"}])
+            != agent.completion_key([{"role": "user", "content": "a"}, {"role": "user", "content": "bc"}]))
+
+
+class Interrupted(BaseException):
+    """Stands in for KeyboardInterrupt or SystemExit in the leader's thread"""
+
+
+def _leader_and_waiter(flight, leader_call, waiter_call, timeout=5):
+    """Run a blocking leader, then a waiter on the same key once the leader is running; return both outcomes"""
+    started, outcomes = threading.Event(), {}
+    def run(name, call):
+        try:
+            outcomes[name] = ("result", flight.do("key", call, timeout=timeout))
+        except BaseException as error:
+            outcomes[name] = ("error", error)
+    def lead():
+        started.set()
+        return leader_call()
+    leader = threading.Thread(target=run, args=("leader", lead))
+    leader.start()
+    started.wait()
+    waiter = threading.Thread(target=run, args=("waiter", waiter_call))
+    waiter.start()
+    leader.join()
+    waiter.join()
+    return outcomes
+
+
+def _after_waiter_joins(flight, result=None, error=None):
+    """A leader call that returns (or raises) once a second caller is waiting on its flight"""
+    def call():
+        deadline = time.monotonic() + 5
+        while flight.stats["coalesced"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        if error is not None:
+            raise error
+        return result
+    return call
+
+
+def test_identical_calls_run_once():
+    flight = agent.SingleFlight()
+    outcomes = _leader_and_waiter(flight, _after_waiter_joins(flight, result="reply"), lambda: "second run")
+    assert outcomes == {"leader": ("result", "reply"), "waiter": ("result", "reply")}
+    assert flight.stats["calls"] == 1 and flight.stats["coalesced"] == 1
+
+
+def test_a_leader_error_reaches_every_waiter():
+    flight = agent.SingleFlight()
+    error = ValueError("model unavailable")
+    outcomes = _leader_and_waiter(flight, _after_waiter_joins(flight, error=error), lambda: "second run")
+    assert outcomes == {"leader": ("error", error), "waiter": ("error", error)}
+    assert flight.stats["errors"] == 1
+
+
+def test_an_interrupted_leader_fails_alone_and_a_waiter_retries():
+    flight = agent.SingleFlight()
+    outcomes = _leader_and_waiter(flight, _after_waiter_joins(flight, error=Interrupted()), lambda: "retried")
+    assert outcomes["leader"][0] == "error" and isinstance(outcomes["leader"][1], Interrupted)
+    assert outcomes["waiter"] == ("result", "retried")
+    assert flight.stats["abandoned"] == 1 and flight.stats["calls"] == 2
+    assert flight.do("key", lambda: "fresh") == "fresh"  # the key was released
+
+
+def test_waiters_time_out_while_the_call_finishes_for_the_leader():
+    flight = agent.SingleFlight()
+    release = threading.Event()
+    def slow():
+        release.wait(5)
+        return "late reply"
+    started = threading.Event()
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", lambda: (started.set(), slow())[1])))
+    leader.start()
+    started.wait()
+    with pytest.raises(TimeoutError):
+        flight.do("key", lambda: "second run", timeout=0.05)
+    release.set()
+    leader.join()
+    assert results == ["late reply"] and flight.stats["timeouts"] == 1
+
+
+def test_async_callers_coalesce_and_share_errors():
+    async def scenario():
+        flight, calls = agent.SingleFlight(), []
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "reply"
+        assert await asyncio.gather(*(flight.ado("key", call) for _ in range(5))) == ["reply"] * 5
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("model unavailable")
+        results = await asyncio.gather(*(flight.ado("bad", failing) for _ in range(3)), return_exceptions=True)
+        return calls, results
+    calls, results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results) and len({id(r) for r in results}) == 1
+
+
+def test_a_cancelled_async_leader_hands_the_call_to_a_waiter():
+    async def scenario():
+        flight, release = agent.SingleFlight(), asyncio.Event()
+        async def call():
+            await release.wait()
+            return "reply"
+        leader = asyncio.ensure_future(flight.ado("key", call))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(flight.ado("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        return leader, await asyncio.gather(*waiters), flight.stats
+    leader, results, stats = asyncio.run(scenario())
+    assert leader.cancelled()
+    assert results == ["reply"] * 3
+    assert stats["abandoned"] == 1 and stats["calls"] == 2
+
+
+def test_async_waiters_time_out_without_cancelling_the_call():
+    async def scenario():
+        flight = agent.SingleFlight()
+        async def call():
+            await asyncio.sleep(0.1)
+            return "reply"
+        leader = asyncio.ensure_future(flight.ado("key", call))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await flight.ado("key", call, timeout=0.01)
+        return await leader
+    assert asyncio.run(scenario()) == "reply"
@@ -0,0 +1,90 @@
+import csv
+import os
+
+import pytest
+
+import agent
+
+
+def _write_taxonomy(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["skill", "aliases", "category"])
+        writer.writerows(rows)
+
+
+ROWS = [
+    ["Kotlin", "kt", "languages"],
+    ["Terraform", "tf|hcl", "devops"],
+    ["Apache Spark", "spark|pyspark", "data"],
+    ["Google Cloud Platform", "gcp;google cloud", "cloud"],
+]
+
+
+@pytest.fixture
+def taxonomy_source(tmp_path):
+    path = os.path.join(tmp_path, "skills.csv")
+    _write_taxonomy(path, ROWS)
+    return path
+
+
+def test_built_index_is_memory_mapped_and_looks_up_aliases(taxonomy_source):
+    taxonomy = agent.load_skill_taxonomy(taxonomy_source)
+    assert os.path.exists(taxonomy_source + ".lbtx")
+    assert len(taxonomy) == 4
+    assert taxonomy.lookup("Kotlin") == ("Kotlin", "languages")
+    assert taxonomy.lookup("PySpark") == ("Apache Spark", "data")
+    assert taxonomy.lookup("google cloud") == ("Google Cloud Platform", "cloud")
+    assert taxonomy.lookup("Fortran") is None
+    reopened = agent.SkillTaxonomy(taxonomy_source + ".lbtx")
+    assert reopened.lookup("hcl") == ("Terraform", "devops")
+
+
+def test_match_prefers_the_longest_alias(taxonomy_source):
+    taxonomy = agent.load_skill_taxonomy(taxonomy_source)
+    text = "Deployed Apache Spark jobs on Google Cloud with Terraform, then rewrote them in Kotlin"
+    assert taxonomy.match(text) == [("Apache Spark", "data"), ("Google Cloud Platform", "cloud"),
+                                    ("Terraform", "devops"), ("Kotlin", "languages")]
+    skill, _, start, end = taxonomy.match_spans(text)[1]
+    assert (skill, text[start:end]) == ("Google Cloud Platform", "Google Cloud")
+
+
+def test_index_is_reused_until_the_source_changes(taxonomy_source):
+    agent.load_skill_taxonomy(taxonomy_source)
+    index_path = taxonomy_source + ".lbtx"
+    built = os.stat(index_path).st_mtime_ns
+    assert agent.load_skill_taxonomy(taxonomy_source).lookup("Svelte") is None
+    assert os.stat(index_path).st_mtime_ns == built
+    
+    _write_taxonomy(taxonomy_source, ROWS + [["Svelte", "sveltekit", "frontend"]])
+    stale = os.path.getmtime(index_path)
+    os.utime(taxonomy_source, (stale + 10, stale + 10))
+    assert agent.load_skill_taxonomy(taxonomy_source).lookup("SvelteKit") == ("Svelte", "frontend")
+
+
+def test_a_file_that_is_not_an_index_is_rejected(tmp_path):
+    path = os.path.join(tmp_path, "bogus.lbtx")
+    with open(path, "wb") as f:
+        f.write(b"\0" * 64)
+    with pytest.raises(ValueError):
+        agent.SkillTaxonomy(path)
+
+
+def test_failed_build_leaves_no_temp_file(taxonomy_source, monkeypatch):
+    def fail(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(agent.os, "replace", fail)
+    with pytest.raises(OSError):
+        agent.SkillTaxonomy.build(taxonomy_source, taxonomy_source + ".lbtx")
+    assert sorted(os.listdir(os.path.dirname(taxonomy_source))) == ["skills.csv"]
+
+
+def test_configured_taxonomy_extends_the_builtin_matcher(taxonomy_source, monkeypatch):
+    monkeypatch.setenv("LINKEDINBUILDR_TAXONOMY", taxonomy_source)
+    agent.get_skill_taxonomy.cache_clear()
+    try:
+        assert agent.find_technologies("Python and Kotlin services, provisioned with tf") == ["Python", "Kotlin", "Terraform"]
+    finally:
+        monkeypatch.delenv("LINKEDINBUILDR_TAXONOMY")
+        agent.get_skill_taxonomy.cache_clear()
+    assert agent.find_technologies("Python and Kotlin services, provisioned with tf") == ["Python"]
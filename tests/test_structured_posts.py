@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+import agent
+import tools
+
+
+class RecordingEnvironment(tools.FakeEnvironment):
+    """FakeEnvironment that keeps the messages of every completion request"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = []
+    
+    def completion(self, messages, **kwargs):
+        self.requests.append(messages)
+        return super().completion(messages, **kwargs)
+
+
+POST_DATA = {"project_name": "StudyBuddy", "tech_stack": ["React", "Flask"],
+             "problem_statement": "students lose track of group deadlines", "github_link": "", "demo_link": "",
+             "duration": "", "hashtags": []}
+DETAILS = "I built StudyBuddy, a React and Flask app that helps students keep track of group deadlines"
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    monkeypatch.delenv("LINKEDINBUILDR_ARTIFACTS", raising=False)
+    monkeypatch.delenv("LINKEDINBUILDR_STRUCTURED_POSTS", raising=False)
+    agent._MESSAGE_WINDOW_CACHE.clear()
+
+
+def test_post_template_counts_as_a_request_for_details():
+    assert agent._asked_for_details(agent.CONVERSATION_TEMPLATES["post_start"]["message"])
+    assert not agent._asked_for_details(agent.CONVERSATION_TEMPLATES["profile_start"]["message"])
+    assert not agent._asked_for_details("Here is your post!")
+
+
+def test_details_after_the_post_template_use_structured_mode():
+    env = RecordingEnvironment("structured-flow", reply=json.dumps(POST_DATA))
+    env.add_user_message("Help me write a post")
+    agent.run(env)
+    assert env.messages[-1]["content"] == agent.CONVERSATION_TEMPLATES["post_start"]["message"]
+    assert env.completion_calls == 0
+    
+    env.add_user_message(DETAILS)
+    messages = agent.MessageWindow(env).context()
+    assert agent.wants_structured_post(messages, agent.detect_activity_type(agent._user_text(messages)))
+    agent.run(env)
+    assert env.completion_calls == 1
+    assert env.requests[0][0]["content"] == agent.structured_post_prompt("personal_project")
+    reply = env.messages[-1]["content"]
+    assert "StudyBuddy" in reply and not reply.startswith("{")
+
+
+@pytest.mark.parametrize("follow_up", ["Why did you pick these hashtags?", "make it more technical"])
+def test_follow_ups_to_a_post_stay_free_form(follow_up):
+    messages = [{"role": "user", "content": "Help me write a post"},
+                {"role": "assistant", "content": agent.CONVERSATION_TEMPLATES["post_start"]["message"]},
+                {"role": "user", "content": DETAILS},
+                {"role": "assistant", "content": "🚀 Excited to share StudyBuddy!"},
+                {"role": "user", "content": follow_up}]
+    assert not agent.wants_structured_post(messages, "personal_project")
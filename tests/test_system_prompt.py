@@ -0,0 +1,33 @@
+import pytest
+
+import agent
+import tools
+
+
+@pytest.mark.parametrize("intent", list(agent.INTENT_PROMPT_MODULES))
+def test_intent_prompt_contains_its_modules_and_catalogs(intent):
+    prompt = agent.build_system_prompt(intent)
+    spec = agent.INTENT_PROMPT_MODULES[intent]
+    for module in spec["modules"]:
+        assert agent.SYSTEM_PROMPT_MODULES[module] in prompt
+    for catalog in spec["catalogs"]:
+        assert agent.serialize_catalog(catalog) in prompt
+
+
+def test_network_prompt_carries_the_target_catalog():
+    assert "NETWORK_TARGETS" in agent.INTENT_PROMPT_MODULES["network_start"]["catalogs"]
+    assert agent.serialize_catalog("NETWORK_TARGETS") in agent.build_system_prompt("network_start")
+
+
+def test_network_prompt_keeps_the_original_prompt_verbatim():
+    assert agent.build_system_prompt("network_start").startswith(tools.LEGACY_SYSTEM_PROMPT)
+
+
+def test_fallback_prompt_covers_every_original_paragraph():
+    prompt = agent.build_system_prompt(None)
+    for paragraph in tools.LEGACY_SYSTEM_PROMPT.split("\n\n"):
+        assert paragraph in prompt
+
+
+def test_unknown_intent_falls_back_to_the_full_prompt():
+    assert agent.build_system_prompt("no_such_intent") == agent.build_system_prompt(None)
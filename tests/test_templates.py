@@ -0,0 +1,24 @@
+import json
+
+import agent
+
+
+def test_activity_template_shares_prototype_until_written():
+    prototype = agent._ACTIVITY_PROTOTYPES["hackathon"]
+    template = agent.create_activity_template("hackathon")
+    assert template["achievements"] == [] and template.get("achievements") == []
+    assert dict.__getitem__(template, "achievements") is prototype["achievements"]
+    
+    template["achievements"] = ["First place"]
+    assert template["achievements"] == ["First place"]
+    assert prototype["achievements"] == ()
+    assert agent.create_activity_template("hackathon")["achievements"] == []
+
+
+def test_activity_template_never_exposes_tuples():
+    template = agent.create_activity_template("hackathon")
+    views = [dict(template), {**template}, dict(template.items()), dict(zip(template, template.values())),
+             (lambda **fields: fields)(**template), json.loads(json.dumps(template))]
+    for view in views:
+        assert not any(isinstance(value, tuple) for value in view.values())
+        assert view == template
@@ -0,0 +1,118 @@
+import queue
+
+import pytest
+
+import agent
+import tools
+
+
+def _thread_ids(count):
+    return [f"thread-{index}" for index in range(count)]
+
+
+def test_ring_keeps_a_thread_on_the_same_worker():
+    ring = agent.ConsistentHashRing(range(4))
+    owners = {thread_id: ring.node_for(thread_id) for thread_id in _thread_ids(500)}
+    rebuilt = agent.ConsistentHashRing(range(4))
+    assert all(rebuilt.node_for(thread_id) == owner for thread_id, owner in owners.items())
+    counts = [list(owners.values()).count(node) for node in range(4)]
+    assert min(counts) > 500 / 4 / 2
+
+
+def test_removing_a_worker_only_moves_its_threads():
+    ring = agent.ConsistentHashRing(range(4))
+    before = {thread_id: ring.node_for(thread_id) for thread_id in _thread_ids(1000)}
+    ring.remove(2)
+    after = {thread_id: ring.node_for(thread_id) for thread_id in before}
+    moved = {thread_id for thread_id in before if before[thread_id] != after[thread_id]}
+    assert moved == {thread_id for thread_id, owner in before.items() if owner == 2}
+    assert 2 not in after.values()
+
+
+def test_adding_a_worker_only_takes_threads_for_itself():
+    ring = agent.ConsistentHashRing(range(3))
+    before = {thread_id: ring.node_for(thread_id) for thread_id in _thread_ids(1000)}
+    ring.add(3)
+    after = {thread_id: ring.node_for(thread_id) for thread_id in before}
+    moved = [thread_id for thread_id in before if before[thread_id] != after[thread_id]]
+    assert moved and all(after[thread_id] == 3 for thread_id in moved)
+    assert len(moved) < 1000 / 4 * 1.5
+
+
+def _payload(text):
+    return {"messages": [{"role": "user", "content": "I want to improve my profile"}, {"role": "user", "content": text}]}
+
+
+def failing_environment_factory(thread_id, payload):
+    raise ValueError(f"no environment for {thread_id}")
+
+
+def _results(pool, count):
+    return sorted((pool.result(timeout=30) for _ in range(count)), key=lambda result: result["job_id"])
+
+
+def test_pool_serves_each_thread_from_one_worker():
+    with agent.WorkerPool(2, tools.fake_environment_factory) as pool:
+        for turn in range(3):
+            for thread_id in _thread_ids(4):
+                pool.submit(thread_id, _payload(f"I work with Python, turn {turn}"))
+        results = _results(pool, 12)
+    for thread_id in _thread_ids(4):
+        turns = [result for result in results if result["thread_id"] == thread_id]
+        assert {result["worker_id"] for result in turns} == {pool.ring.node_for(thread_id)}
+        assert [result["thread_turns_on_worker"] for result in turns] == [1, 2, 3]
+    assert all(result["error"] is None and result["replies"] for result in results)
+
+
+def test_a_failing_turn_reports_its_error_and_the_worker_keeps_serving():
+    with agent.WorkerPool(1, failing_environment_factory) as pool:
+        pool.submit("thread-0", _payload("hi"))
+        pool.submit("thread-1", _payload("hi"))
+        results = _results(pool, 2)
+    assert [result["error"] for result in results] == ["ValueError('no environment for thread-0')",
+                                                       "ValueError('no environment for thread-1')"]
+    assert all(result["replies"] == [] for result in results)
+
+
+def test_jobs_for_a_dead_worker_are_rerouted():
+    pool = agent.WorkerPool(2, tools.fake_environment_factory).start()
+    try:
+        thread_id = next(thread_id for thread_id in _thread_ids(100) if pool.ring.node_for(thread_id) == 0)
+        pool._processes[0].terminate()
+        pool._processes[0].join()
+        pool.submit(thread_id, _payload("I work with Go"))
+        result = pool.result(timeout=30)
+        assert (result["thread_id"], result["worker_id"], result["error"]) == (thread_id, 1, None)
+        assert pool.ring.node_for(thread_id) == 1
+        
+        pool.restart_worker(0)
+        assert pool.ring.node_for(thread_id) == 0
+        pool.submit(thread_id, _payload("I work with Go"))
+        assert pool.result(timeout=30)["worker_id"] == 0
+    finally:
+        pool.drain(timeout=10)
+
+
+def test_restarting_an_unreaped_dead_worker_replaces_it():
+    pool = agent.WorkerPool(2, tools.fake_environment_factory).start()
+    try:
+        thread_id = next(thread_id for thread_id in _thread_ids(100) if pool.ring.node_for(thread_id) == 0)
+        pool._processes[0].terminate()
+        pool._processes[0].join()
+        pool.restart_worker(0)
+        pool.submit(thread_id, _payload("I work with Go"))
+        result = pool.result(timeout=30)
+        assert (result["worker_id"], result["error"]) == (0, None)
+    finally:
+        pool.drain(timeout=10)
+
+
+def test_pool_raises_once_every_worker_is_dead():
+    pool = agent.WorkerPool(1, tools.fake_environment_factory).start()
+    pool._processes[0].terminate()
+    pool._processes[0].join()
+    pool.submit("thread-0", _payload("hi"))
+    with pytest.raises(RuntimeError, match="every worker"):
+        pool.result(timeout=5)
+    with pytest.raises(queue.Empty):
+        pool.results.get_nowait()
@@ -0,0 +1,818 @@
+"""Offline tools for LinkedInBuildr: batch jobs, benchmarks and load tests
+
+agent.py is what the NEAR AI runtime executes, with `env` in its globals; everything here
+only drives it locally. Run `python tools.py <command> --help` for the commands.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+import agent
+from agent import (ArtifactStore, CONVERSATION_TEMPLATES, CohortAnalytics, HEADLINE_SPECIALIZATIONS,
+    INTENT_PROMPT_MODULES, MessageWindow, PROFILE_SECTIONS, PostRecord, ProfileRecord, REQUIRED_INFO,
+    STUDENT_ACTIVITY_TYPES, SingleFlight, SkillTaxonomy, TECH_KEYWORDS, WorkerPool, build_system_prompt,
+    check_missing_info, check_missing_post_record, compact_profile_reply, completion_clock, create_activity_template,
+    estimate_tokens, generate_profile_sections, get_semantic_cache, get_single_flight, import_linkedin_exports,
+    post_data_fields, prepare_post_analysis, render_profile_text, run, validate_profile_data, validate_profile_record,
+    write_bulk_connection_messages, _MESSAGE_WINDOW_CACHE, _build_activity_templates)
+
+def benchmark_activity_templates(calls: int = 20000) -> Dict[str, Dict[str, float]]:
+    """Time and retained memory per call: rebuilding every template versus instantiating a prototype"""
+    import tracemalloc
+    activity_types = STUDENT_ACTIVITY_TYPES
+    strategies = {
+        "rebuild": lambda activity_type: _build_activity_templates().get(activity_type) or _build_activity_templates()[None],
+        "prototype": create_activity_template
+    }
+    results = {}
+    for name, create in strategies.items():
+        start = time.perf_counter()
+        for i in range(calls):
+            create(activity_types[i % len(activity_types)])
+        elapsed = time.perf_counter() - start
+        
+        tracemalloc.start()
+        kept = []
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(calls // 10):
+            kept.append(create(activity_types[i % len(activity_types)]))
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.reset_peak()
+        create(activity_types[0])
+        peak = tracemalloc.get_traced_memory()[1] - tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[name] = {
+            "us_per_call": round(elapsed / calls * 1e6, 3),
+            "retained_bytes_per_call": round(retained / len(kept), 1),
+            "peak_bytes_per_call": peak
+        }
+    return results
+
+def _sample_profile_data(rng: random.Random, index: int) -> Dict[str, any]:
+    """A synthetic profile_data with fields dropped, left empty and whole sections empty at random"""
+    def section(name: str) -> Dict[str, any]:
+        if rng.random() < 0.05:
+            return {}
+        fields = PROFILE_SECTIONS[name]["essential"] + PROFILE_SECTIONS[name]["optional"]
+        draws = [(field, rng.random()) for field in fields]
+        return {field: f"{field} {index}" if draw > 0.3 else "" for field, draw in draws if draw > 0.15}
+    technologies = [tech for techs in TECH_KEYWORDS.values() for tech in techs]
+    experiences = []
+    for _ in range(rng.randint(1, 3)):
+        experience = section("experience")
+        experience["responsibilities"] = [f"Built feature {n}" for n in range(3)]
+        experience["tech_stack"] = rng.sample(technologies, 3)
+        experiences.append(experience)
+    return {
+        "headline": section("headline"), "about": section("about"), "experience": experiences[0],
+        "education": section("education"), "experiences": experiences,
+        "skills": {"technical": rng.sample(technologies, 5), "soft": ["Communication"], "domain": []},
+        "name": f"Student {index}", "status": "student", "key_technology": rng.choice(technologies)
+    }
+
+def _sample_post_data(rng: random.Random, activity_type: str) -> Dict[str, any]:
+    post_data = post_data_fields(activity_type)
+    requirements = REQUIRED_INFO[activity_type]
+    for field in requirements["essential"] + requirements["optional"]:
+        draw = rng.random()
+        if draw > 0.3:
+            post_data[field] = ["Python", "React"] if isinstance(post_data[field], list) else f"{field} value"
+        elif draw < 0.1:
+            del post_data[field]
+    return dict(post_data)
+
+def benchmark_profile_records(profiles: int = 10000, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Retained memory and validation time: profile and post dicts versus slotted records"""
+    import gc
+    import tracemalloc
+    rng = random.Random(seed)
+    lines = [json.dumps(_sample_profile_data(rng, index)) for index in range(profiles)]
+    activity_types = list(REQUIRED_INFO)
+    post_lines = [(activity_types[index % len(activity_types)],
+                   json.dumps(_sample_post_data(rng, activity_types[index % len(activity_types)])))
+                  for index in range(profiles)]
+    
+    def retained(build):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        return kept, round(size / profiles, 1)
+    
+    def timed(check, items):
+        # Like timeit, keep collector passes over the retained objects out of the measurement
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            results = [check(item) for item in items]
+            return results, round((time.perf_counter() - start) / len(items) * 1e6, 3)
+        finally:
+            gc.enable()
+    
+    profile_dicts, profile_dict_bytes = retained(lambda: [json.loads(line) for line in lines])
+    profile_records, profile_record_bytes = retained(lambda: [ProfileRecord.from_dict(json.loads(line)) for line in lines])
+    post_dicts, post_dict_bytes = retained(lambda: [(activity, json.loads(line)) for activity, line in post_lines])
+    post_records, post_record_bytes = retained(
+        lambda: [(activity, PostRecord.from_dict(json.loads(line))) for activity, line in post_lines])
+    
+    dict_missing, dict_validate_us = timed(validate_profile_data, profile_dicts)
+    record_missing, record_validate_us = timed(validate_profile_record, profile_records)
+    dict_post_missing, dict_post_us = timed(lambda item: check_missing_info(*item), post_dicts)
+    record_post_missing, record_post_us = timed(lambda item: check_missing_post_record(*item), post_records)
+    if dict_missing != record_missing or dict_post_missing != record_post_missing:
+        raise AssertionError("record validation disagrees with the dict path")
+    _, convert_us = timed(ProfileRecord.from_dict, profile_dicts)
+    round_trip = all(ProfileRecord.from_dict(data).to_dict() == data for data in profile_dicts[:100])
+    
+    return {
+        "profile_data": {"dict_bytes": profile_dict_bytes, "record_bytes": profile_record_bytes,
+                         "dict_validate_us": dict_validate_us, "record_validate_us": record_validate_us,
+                         "from_dict_us": convert_us, "round_trip": round_trip},
+        "post_data": {"dict_bytes": post_dict_bytes, "record_bytes": post_record_bytes,
+                      "dict_check_us": dict_post_us, "record_check_us": record_post_us}
+    }
+
+# The single prompt every turn used to send, kept as the baseline for report_prompt_savings
+LEGACY_SYSTEM_PROMPT = """You are a LinkedIn profile strategist who specializes in helping computer science students transition into software engineering roles. You understand both the technical and career aspects of software development, and know how to present technical achievements to catch recruiters' attention.
+
+KEY OBJECTIVES:
+- Guide natural networking progression for CS students
+- Focus on individual's technical strengths and interests
+- Build meaningful professional relationships in their chosen domain
+- Maintain relevance to their specific tech stack and goals
+
+NETWORKING GUIDANCE:
+Guide users through networking phases naturally, focusing on one clear action at a time:
+
+Phase 1 - Foundation
+- Understand student's specific technical focus (languages, frameworks, domains)
+- Use NETWORK_TARGETS to suggest relevant communities based on their interests
+- Craft personalized connections using generate_connection_message() with their tech context
+- Build on their unique technical experience and projects
+
+Phase 2 - Engagement
+- Use suggest_engagement_plan() for focused growth in their domain
+- Keep technical context specific to their stack (e.g., backend scaling, ML models, frontend frameworks)
+- Build on their demonstrated interests and strengths
+- Guide meaningful interactions in their chosen field
+
+Phase 3 - Growth
+- Focus on value-add opportunities in their technical domain
+- Guide collaborative engagement based on their expertise
+- Expand network naturally through shared technical interests
+- Maintain relevance to their career goals
+
+RESPONSE PRINCIPLES:
+1. Focus
+- ONE clear next step based on their technical context
+- Build on their specific experiences and interests
+- Keep aligned with their tech stack
+- Show natural progression in their domain
+
+2. Value
+- Technical relevance to their chosen field
+- Clear benefits for their career path
+- Immediate actionability in their context
+- Professional growth in their area
+
+3. Guidance
+- Natural conversation about their interests
+- Specific suggestions for their domain
+- Clear direction based on their goals
+- Simple choices aligned with their path
+
+4. Data Usage
+- Use NETWORK_TARGETS for suggestions matching their interests
+- Generate personalized messages referencing their specific tech experience
+- Create structured plans relevant to their domain
+- Keep technical focus aligned with their goals
+
+TECHNICAL DOMAINS:
+Consider various paths including:
+- Backend Development (distributed systems, APIs, databases)
+- Frontend Development (web frameworks, UX, performance)
+- Full Stack Development
+- Machine Learning/AI
+- Mobile Development
+- DevOps/Infrastructure
+- Security Engineering
+- Game Development
+- Embedded Systems
+
+AVOID:
+- Multiple actions at once
+- Generic networking advice
+- Losing sight of their specific technical context
+- Overwhelming options
+- Assuming one technology stack fits all
+
+Remember: Guide each student through natural networking progression while maintaining focus on their specific technical interests and career goals. Use data structures to provide relevant suggestions while keeping conversation natural and focused on their chosen path."""
+
+def report_prompt_savings() -> Dict[str, Dict[str, int]]:
+    """Report estimated system prompt input tokens saved per intent against LEGACY_SYSTEM_PROMPT"""
+    full_tokens = estimate_tokens(LEGACY_SYSTEM_PROMPT)
+    report = {}
+    for intent in INTENT_PROMPT_MODULES:
+        tokens = estimate_tokens(build_system_prompt(intent))
+        report[intent or "unknown"] = {
+            "prompt_tokens": tokens,
+            "saved_tokens": full_tokens - tokens,
+            "saved_percent": round(100 * (full_tokens - tokens) / full_tokens)
+        }
+    return report
+
+def benchmark_message_window(thread_lengths: Iterable[int] = (100, 1000, 10000), turns: int = 20) -> Dict[int, Dict]:
+    """Compare full-thread listing with MessageWindow on long fake threads"""
+    import tracemalloc
+    report = {}
+    for length in thread_lengths:
+        env = FakeEnvironment(f"bench-{length}")
+        for i in range(length):
+            (env.add_user_message if i % 2 == 0 else env.add_reply)(f"message {i} about Python and React projects")
+        results = {}
+        for mode in ("full", "window"):
+            _MESSAGE_WINDOW_CACHE.pop(env.thread_id, None)
+            fetched = 0
+            tracemalloc.start()
+            start = time.perf_counter()
+            for _ in range(turns):
+                if mode == "full":
+                    messages = env.list_messages()
+                    fetched += len(messages)
+                else:
+                    window = MessageWindow(env)
+                    messages = window.context()
+                    fetched += window.fetched
+                env.add_user_message("one more question")
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[mode] = {
+                "ms_per_turn": round(elapsed * 1000 / turns, 3),
+                "messages_fetched_per_turn": round(fetched / turns, 1),
+                "messages_sent_to_model": len(messages),
+                "peak_kib": round(peak / 1024, 1)
+            }
+        report[length] = results
+    return report
+
+def benchmark_profile_diffs(edits: int = 20) -> Dict[str, Dict[str, int]]:
+    """Session growth over repeated one-section edits: full profile replies versus change-only replies"""
+    profile_data = {
+        "role": "CS Student", "specialization": "Backend", "key_technology": "Python", "institution": "State University",
+        "specialization_area": "distributed systems", "technical_focus": "APIs and data pipelines",
+        "experiences": [{"company": f"Company {i}", "role": "Software Engineering Intern", "duration": "3 months",
+                         "responsibilities": [f"Built service {i}.{j} with Python and PostgreSQL" for j in range(4)],
+                         "tech_stack": ["Python", "PostgreSQL", "Docker"]} for i in range(4)],
+        "education": {"institution": "State University", "degree": "BSc", "field": "Computer Science",
+                      "graduation_date": "2026", "relevant_coursework": ["Algorithms", "Databases", "Networks"]},
+        "skills": {"technical": ["Python", "PostgreSQL", "Docker", "React"], "soft": ["Communication"]}
+    }
+    store = ArtifactStore()
+    env = FakeEnvironment("profile-diff-bench")
+    totals = {"full": {"reply_chars": 0, "context_chars": 0}, "diff": {"reply_chars": 0, "context_chars": 0}}
+    for edit in range(edits + 1):
+        if edit:
+            experience = profile_data["experiences"][edit % len(profile_data["experiences"])]
+            experience["responsibilities"][edit % 4] = f"Cut p95 latency by {10 + edit}% on service {edit}"
+        full = render_profile_text(generate_profile_sections(profile_data))
+        compact = compact_profile_reply(env, full, store)
+        for mode, reply in (("full", full), ("diff", compact)):
+            totals[mode]["reply_chars"] += len(reply)
+            # Next turn's prompt carries every earlier reply, plus the current profile once in diff mode
+            totals[mode]["context_chars"] = totals[mode]["reply_chars"] + (len(full) if mode == "diff" else 0)
+    for mode in totals:
+        totals[mode]["context_tokens"] = estimate_tokens("x" * totals[mode]["context_chars"])
+    return totals
+
+def measure_cold_start(runs: int = 5) -> Dict[str, float]:
+    """Median fresh-process load time of this module and of building and compiling its derived indexes"""
+    import subprocess
+    probe = ("import runpy, sys, time; start = time.perf_counter(); "
+             "module = runpy.run_path(sys.argv[1], run_name='cold_start'); "
+             "print(time.perf_counter() - start, module['DERIVED_INDEX_STATS']['seconds'])")
+    totals, index_times = [], []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", probe, os.path.abspath(agent.__file__)],
+                                check=True, capture_output=True, text=True).stdout.split()
+        totals.append(float(output[0]))
+        index_times.append(float(output[1]))
+    return {"module_ms": round(sorted(totals)[runs // 2] * 1000, 2),
+            "indexes_ms": round(sorted(index_times)[runs // 2] * 1000, 3)}
+
+class FakeEnvironment:
+    """Local stand-in for the NEAR AI Environment used by the worker pool and benchmarks"""
+    
+    def __init__(self, thread_id: str, messages: Optional[List[Dict]] = None, completion_latency: float = 0.0,
+                 reply: str = "Thanks for sharing! Here's a suggestion tailored to your stack.", latency_sampler=None):
+        self.thread_id = thread_id
+        self.messages = []
+        for message in messages or []:
+            self._append(message["role"], message["content"])
+        self.completion_latency = completion_latency
+        self.reply = reply
+        self.latency_sampler = latency_sampler  # callable returning seconds, overrides completion_latency
+        self.completion_calls = 0
+        self.model_seconds = 0.0
+    
+    def list_messages(self, thread_id: Optional[str] = None, limit: Optional[int] = None, order: str = "asc",
+                      after: Optional[str] = None) -> List[Dict]:
+        start = int(after.rsplit("_", 1)[1]) + 1 if after is not None else 0
+        if order == "asc":
+            page = self.messages[start:] if limit is None else self.messages[start:start + limit]
+        else:
+            page = self.messages[start:][::-1] if limit is None else self.messages[max(start, len(self.messages) - limit):][::-1]
+        return [dict(m) for m in page]
+    
+    def count_messages(self) -> int:
+        return len(self.messages)
+    
+    def completion(self, messages: List[Dict], **kwargs) -> str:
+        self.completion_calls += 1
+        latency = self.latency_sampler() if self.latency_sampler else self.completion_latency
+        if latency:
+            time.sleep(latency)
+            self.model_seconds += latency
+        return self.reply
+    
+    def _append(self, role: str, content: str):
+        self.messages.append({"id": f"msg_{len(self.messages)}", "role": role, "content": content})
+    
+    def add_reply(self, message: str):
+        self._append("assistant", message)
+    
+    def add_user_message(self, message: str):
+        self._append("user", message)
+    
+    def request_user_input(self):
+        pass
+
+class FakeAsyncEnvironment(FakeEnvironment):
+    """FakeEnvironment whose completion can be awaited, so latency overlaps with work on the event loop"""
+    
+    async def acompletion(self, messages: List[Dict], **kwargs) -> str:
+        self.completion_calls += 1
+        latency = self.latency_sampler() if self.latency_sampler else self.completion_latency
+        if latency:
+            await asyncio.sleep(latency)
+            self.model_seconds += latency
+        return self.reply
+
+def fake_environment_factory(thread_id: str, payload: Dict[str, any]) -> "FakeEnvironment":
+    """WorkerPool env_factory for benchmarks: a FakeEnvironment rebuilt from the thread's messages"""
+    return FakeEnvironment(thread_id, payload["messages"], completion_latency=payload.get("completion_latency", 0.0))
+
+SYNTHETIC_CONVERSATIONS = {
+    "profile": ["I want to improve my profile", "I'm a CS Student into Backend, working with Python and Django",
+                "Can you give me other headline options?"],
+    "post": ["Help me write a post about my project", "I built a React app with a FastAPI backend",
+             "It cut page load time by 40%"],
+    "network": ["I want to grow my network", "I work with Python and Kubernetes",
+                "Who should I connect with first?"]
+}
+
+def benchmark_worker_pool(worker_counts: Iterable[int] = (1, 2, 4), threads: int = 24,
+                          completion_latency: float = 0.05) -> Dict[int, Dict[str, float]]:
+    """Drive synthetic conversations through pools of different sizes and report throughput"""
+    report = {}
+    flows = list(SYNTHETIC_CONVERSATIONS.values())
+    for workers in worker_counts:
+        with WorkerPool(workers, fake_environment_factory) as pool:
+            # Each thread submits its next turn only after the previous one comes back
+            scripts = {f"thread-{i}": flows[i % len(flows)] for i in range(threads)}
+            threads_messages = {thread_id: [] for thread_id in scripts}
+            affinity = {}
+            
+            def submit(thread_id: str, text: str):
+                messages = threads_messages[thread_id]
+                messages.append({"role": "user", "content": text})
+                pool.submit(thread_id, {"messages": messages, "completion_latency": completion_latency})
+            
+            start = time.perf_counter()
+            for thread_id, script in scripts.items():
+                submit(thread_id, script[0])
+            turns = errors = 0
+            pending = threads
+            while pending:
+                result = pool.result(timeout=60)
+                turns += 1
+                errors += bool(result["error"])
+                thread_id = result["thread_id"]
+                affinity.setdefault(thread_id, set()).add(result["worker_id"])
+                threads_messages[thread_id] += [{"role": "assistant", "content": reply} for reply in result["replies"]]
+                next_turn = sum(1 for m in threads_messages[thread_id] if m["role"] == "user")
+                script = scripts[thread_id]
+                if next_turn < len(script):
+                    submit(thread_id, script[next_turn])
+                else:
+                    pending -= 1
+            elapsed = time.perf_counter() - start
+        report[workers] = {
+            "turns": turns,
+            "errors": errors,
+            "seconds": round(elapsed, 3),
+            "turns_per_second": round(turns / elapsed, 1),
+            "threads_on_one_worker": sum(1 for owners in affinity.values() if len(owners) == 1)
+        }
+    return report
+
+def latency_sampler(distribution: str = "lognormal", median: float = 0.05, spread: float = 0.5,
+                    seed: int = 0):
+    """Build a completion latency sampler: fixed, uniform (median +/- spread) or lognormal (sigma=spread)"""
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    
+    def sample() -> float:
+        with lock:
+            if distribution == "fixed":
+                return median
+            if distribution == "uniform":
+                return max(0.0, rng.uniform(median * (1 - spread), median * (1 + spread)))
+            return rng.lognormvariate(math.log(median), spread)
+    return sample
+
+# Per-conversation variations of SYNTHETIC_CONVERSATIONS, so caches and coalescing only absorb real repeats
+LOAD_TEST_SCRIPTS = {
+    "profile": ["I want to improve my profile", "I'm a CS Student into {specialization}, working with {first} and {second}",
+                "Can you give me other headline options?"],
+    "post": ["Help me write a post about my project", "I built {project} with {first} and a {second} backend",
+             "It cut page load time by {percent}% for {users} users"],
+    "network": ["I want to grow my network", "I work with {first} and {second} on {project}",
+                "Who should I connect with first?"]
+}
+
+_LOAD_TEST_PROJECTS = ["a study planner", "a campus marketplace", "a bug tracker", "a budgeting app", "a chess engine",
+                       "a recipe finder", "a club scheduler", "a code review bot", "a weather dashboard", "a CLI todo tool"]
+
+def load_test_script(index: int, seed: int = 0) -> Tuple[str, List[str]]:
+    """(flow, user turns) for one load-test conversation, varied by index across flows, stacks and projects"""
+    rng = random.Random(seed * 1_000_003 + index)
+    flows = list(CONVERSATION_TEMPLATES["welcome"]["next_steps"])
+    flow = flows[index % len(flows)]
+    technologies = [tech for terms in TECH_KEYWORDS.values() for tech in terms]
+    first, second = rng.sample(technologies, 2)
+    fields = {"first": first, "second": second, "specialization": rng.choice(HEADLINE_SPECIALIZATIONS),
+              "project": rng.choice(_LOAD_TEST_PROJECTS), "percent": rng.randint(10, 90), "users": rng.randint(2, 500) * 10}
+    return flow, [turn.format(**fields) for turn in LOAD_TEST_SCRIPTS[flow]]
+
+def _current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, where /proc is available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class _RssSampler(threading.Thread):
+    """Sample RSS while a test runs, so the reported peak belongs to the test and not the process lifetime"""
+    
+    def __init__(self, interval: float = 0.01):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.start_bytes = self.peak_bytes = _current_rss()
+        self._done = threading.Event()
+    
+    def run(self):
+        while not self._done.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, _current_rss())
+    
+    def stop(self) -> Dict[str, Optional[float]]:
+        self._done.set()
+        self.join()
+        if self.start_bytes is None:
+            return {"start_mib": None, "peak_mib": None, "growth_mib": None}
+        self.peak_bytes = max(self.peak_bytes, _current_rss())
+        mib = lambda value: round(value / 2 ** 20, 1)
+        return {"start_mib": mib(self.start_bytes), "peak_mib": mib(self.peak_bytes),
+                "growth_mib": mib(self.peak_bytes - self.start_bytes)}
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {"p50": round(pick(0.50) * 1000, 3), "p95": round(pick(0.95) * 1000, 3), "p99": round(pick(0.99) * 1000, 3)}
+
+def _measure_allocations(seed: int, turns: int = 60) -> Dict[str, float]:
+    """Per-turn tracemalloc peak and retained bytes, measured sequentially without model latency"""
+    import tracemalloc
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for i in range(turns):
+            _, script = load_test_script(i, seed + 1)
+            env = FakeEnvironment(f"alloc-{i}")
+            for message in script[:1 + (i // 3) % len(script)]:
+                env.add_user_message(message)
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            run(env)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_kib_per_turn_avg": round(sum(peaks) / len(peaks) / 1024, 2),
+        "peak_kib_per_turn_max": round(max(peaks) / 1024, 2),
+        "retained_bytes_per_turn_avg": round(sum(retained) / len(retained), 1)
+    }
+
+def run_load_test(conversations: int = 500, concurrency: int = 500, distribution: str = "lognormal",
+                  median: float = 0.05, spread: float = 0.5, seed: int = 0) -> Dict[str, any]:
+    """Drive many synthetic conversations through run() concurrently and report latency and memory
+    
+    Every conversation gets its own stack, project and numbers (load_test_script), so the
+    semantic cache and single-flight only absorb genuine repeats; model_calls reports how
+    many turns still reached the model.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    sampler = latency_sampler(distribution, median, spread, seed)
+    turn_records = []
+    model_calls = [0]
+    records_lock = threading.Lock()
+    
+    def converse(index: int):
+        flow, script = load_test_script(index, seed)
+        env = FakeEnvironment(f"load-{index}", latency_sampler=sampler)
+        records = []
+        for message in script:
+            env.add_user_message(message)
+            model_before = getattr(completion_clock, "seconds", 0.0)
+            start = time.perf_counter()
+            run(env)
+            total = time.perf_counter() - start
+            model = getattr(completion_clock, "seconds", 0.0) - model_before
+            records.append((flow, total, model, total - model))
+        with records_lock:
+            turn_records.extend(records)
+            model_calls[0] += env.completion_calls
+    
+    rss = _RssSampler()
+    rss.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(converse, range(conversations)))
+    elapsed = time.perf_counter() - start
+    memory = rss.stop()
+    
+    report = {
+        "config": {"conversations": conversations, "concurrency": concurrency, "distribution": distribution,
+                   "median_s": median, "spread": spread, "seed": seed},
+        "turns": len(turn_records),
+        "seconds": round(elapsed, 3),
+        "turns_per_second": round(len(turn_records) / elapsed, 1),
+        "latency_ms": {
+            "total": _percentiles([record[1] for record in turn_records]),
+            "model": _percentiles([record[2] for record in turn_records]),
+            "local": _percentiles([record[3] for record in turn_records])
+        },
+        "flows": dict(Counter(record[0] for record in turn_records)),
+        "model_calls": model_calls[0],
+        "rss": memory
+    }
+    # Stats are taken before the allocation pass, whose turns also go through the cache and single-flight
+    cache = get_semantic_cache()
+    if cache is not None:
+        report["semantic_cache"] = dict(cache.stats, hit_rate=round(cache.hit_rate(), 3))
+    flight = get_single_flight()
+    if flight is not None:
+        report["single_flight"] = dict(flight.stats)
+    report["allocations"] = _measure_allocations(seed)
+    return report
+
+def compare_load_reports(baseline: Dict[str, any], current: Dict[str, any]) -> Dict[str, float]:
+    """Percent change of the headline load-test numbers between two reports"""
+    def change(before: float, after: float) -> float:
+        return round(100.0 * (after - before) / before, 1) if before else 0.0
+    
+    comparison = {"turns_per_second": change(baseline["turns_per_second"], current["turns_per_second"]),
+                  "rss_growth_mib": change(baseline["rss"]["growth_mib"] or 0.0, current["rss"]["growth_mib"] or 0.0)}
+    for part in ("total", "model", "local"):
+        for percentile in ("p50", "p95", "p99"):
+            comparison[f"{part}_{percentile}_ms"] = change(baseline["latency_ms"][part][percentile],
+                                                           current["latency_ms"][part][percentile])
+    comparison["peak_kib_per_turn_avg"] = change(baseline["allocations"]["peak_kib_per_turn_avg"],
+                                                 current["allocations"]["peak_kib_per_turn_avg"])
+    return comparison
+
+def demo_single_flight(callers: int = 40, latency: float = 0.2) -> Dict[str, any]:
+    """Concurrent stub checks: identical run() turns share a call, errors reach every waiter, waiters time out"""
+    flight = get_single_flight()
+    if flight is None:
+        return {"enabled": False}
+    before = dict(flight.stats)
+    script = SYNTHETIC_CONVERSATIONS["profile"][:2]
+    envs = [FakeEnvironment(f"burst-{i}", completion_latency=latency) for i in range(callers)]
+    for env in envs:
+        env.add_user_message(script[0])
+        env._append("assistant", CONVERSATION_TEMPLATES["profile_start"]["message"])
+        env.add_user_message(script[1])
+    barrier = threading.Barrier(callers)
+    
+    def turn(env):
+        barrier.wait()
+        run(env)
+    threads = [threading.Thread(target=turn, args=(env,)) for env in envs]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    # Errors and timeouts on a private instance, so the process-wide stats stay about real traffic
+    local = SingleFlight()
+    outcomes = Counter()
+    
+    def failing():
+        time.sleep(latency)
+        raise RuntimeError("model unavailable")
+    
+    outcomes_lock = threading.Lock()
+    
+    def call(timeout):
+        barrier.wait()
+        try:
+            local.do("same-request", failing, timeout)
+            outcome = "ok"
+        except RuntimeError:
+            outcome = "error"
+        except TimeoutError:
+            outcome = "timeout"
+        with outcomes_lock:
+            outcomes[outcome] += 1
+    barrier = threading.Barrier(8)
+    threads = [threading.Thread(target=call, args=(latency / 4 if i % 2 else None,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    return {
+        "callers": callers,
+        "completion_calls": sum(env.completion_calls for env in envs),
+        "coalesced": flight.stats["coalesced"] - before["coalesced"],
+        "seconds": round(elapsed, 3),
+        "replies_identical": len({env.messages[-1]["content"] for env in envs}) == 1,
+        "error_and_timeout_check": dict(outcomes, **{"stats": local.stats})
+    }
+
+def benchmark_async_overlap(turns: int = 20, latency: float = 0.05, description_words: int = 4000) -> Dict[str, float]:
+    """Post turns with a long description: local analysis time versus what it adds to wall-clock latency"""
+    words = ["Built", "a", "Python", "FastAPI", "service", "with", "Redis", "caching", "and", "React", "dashboards."]
+    description = " ".join(words[i % len(words)] for i in range(description_words))
+    reply = json.dumps({"project_name": "LeetBot", "problem_statement": "mock interviews", "hashtags": []})
+    local, wall = [], {"sync_env": [], "async_env": []}
+    for turn in range(turns):
+        script = ["help me write a post", f"Post {turn}: I built LeetBot. {description} https://github.com/me/leetbot"]
+        messages = [{"role": "user", "content": script[0]}, {"role": "assistant", "content": "What did you build?"},
+                    {"role": "user", "content": script[1]}]
+        start = time.perf_counter()
+        prepare_post_analysis(messages)
+        local.append(time.perf_counter() - start)
+        for name, environment in (("sync_env", FakeEnvironment), ("async_env", FakeAsyncEnvironment)):
+            env = environment(f"overlap-{name}-{turn}", completion_latency=latency, reply=reply)
+            for message in messages:
+                env._append(message["role"], message["content"])
+            start = time.perf_counter()
+            run(env)
+            wall[name].append(time.perf_counter() - start)
+    median = lambda values: sorted(values)[len(values) // 2] * 1000
+    return {
+        "model_ms": latency * 1000,
+        "local_analysis_ms": round(median(local), 3),
+        "sequential_estimate_ms": round(latency * 1000 + median(local), 3),
+        "sync_env_wall_ms": round(median(wall["sync_env"]), 3),
+        "async_env_wall_ms": round(median(wall["async_env"]), 3)
+    }
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for the offline batch tools"""
+    parser = argparse.ArgumentParser(description="LinkedInBuildr offline tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    bulk = subparsers.add_parser("bulk-messages", help="Draft connection messages for a CSV/JSONL contact export")
+    bulk.add_argument("input", help="Contacts export (.csv or .jsonl)")
+    bulk.add_argument("output", help="Where to write messages (.csv or .jsonl)")
+    bulk.add_argument("--specialization", default="")
+    bulk.add_argument("--tech-stack", default="", help="Comma-separated technologies, most important first")
+    bulk.add_argument("--interests", default="", help="Comma-separated interests, most important first")
+    
+    taxonomy = subparsers.add_parser("build-taxonomy", help="Compile a CSV/JSONL skill taxonomy into a binary index")
+    taxonomy.add_argument("source", help="Taxonomy with skill, aliases and category columns (.csv or .jsonl)")
+    taxonomy.add_argument("index", help="Where to write the memory-mappable index")
+    
+    workers = subparsers.add_parser("worker-bench", help="Measure worker pool throughput against a fake environment")
+    workers.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    workers.add_argument("--threads", type=int, default=24)
+    workers.add_argument("--latency", type=float, default=0.05, help="Simulated completion latency in seconds")
+    
+    cohort_ingest = subparsers.add_parser("cohort-ingest", help="Score profiles from JSONL into a cohort snapshot")
+    cohort_ingest.add_argument("input", help="JSONL with one profile_data object per line")
+    cohort_ingest.add_argument("snapshot", help="Snapshot (.npz) to create or extend")
+    cohort_ingest.add_argument("--cohort-field", default="cohort", help="Field holding each profile's cohort")
+    cohort_report = subparsers.add_parser("cohort-report", help="Print aggregates from a cohort snapshot")
+    cohort_report.add_argument("snapshot")
+    cohort_report.add_argument("--cohort", default=None)
+    
+    subparsers.add_parser("message-bench", help="Compare full-thread loading with the lazy message window")
+    
+    load = subparsers.add_parser("load-test", help="Drive concurrent synthetic conversations through run()")
+    load.add_argument("--conversations", type=int, default=500)
+    load.add_argument("--concurrency", type=int, default=500)
+    load.add_argument("--distribution", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    load.add_argument("--median", type=float, default=0.05, help="Median completion latency in seconds")
+    load.add_argument("--spread", type=float, default=0.5, help="Lognormal sigma, or relative uniform half-width")
+    load.add_argument("--report", help="Write the JSON report here")
+    load.add_argument("--compare", help="Baseline report to compare against")
+    
+    templates = subparsers.add_parser("template-bench", help="Compare activity template rebuilds with prototype copies")
+    templates.add_argument("--calls", type=int, default=20000)
+    
+    subparsers.add_parser("cold-start", help="Measure fresh-process startup and derived index build time")
+    
+    flight = subparsers.add_parser("single-flight-demo", help="Show identical concurrent completions being coalesced")
+    flight.add_argument("--callers", type=int, default=40)
+    flight.add_argument("--latency", type=float, default=0.2)
+    
+    exports = subparsers.add_parser("import-exports", help="Import LinkedIn data exports (zips or folders) as profile_data")
+    exports.add_argument("source", help="One export zip/folder, or a folder holding many")
+    exports.add_argument("output", help="JSONL to write, one profile_data per export (ready for cohort-ingest)")
+    exports.add_argument("--cohort", default=None, help="Cohort name to record on every profile")
+    
+    subparsers.add_parser("profile-diff-bench", help="Compare session growth with full versus change-only profile replies")
+    
+    overlap = subparsers.add_parser("async-bench", help="Show local analysis overlapping the model call in arun()")
+    overlap.add_argument("--turns", type=int, default=20)
+    overlap.add_argument("--latency", type=float, default=0.05)
+    
+    records = subparsers.add_parser("record-bench", help="Compare profile and post dicts with slotted bitmask records")
+    records.add_argument("--profiles", type=int, default=10000)
+    records.add_argument("--seed", type=int, default=0)
+    
+    args = parser.parse_args(argv)
+    if args.command == "bulk-messages":
+        user_context = {
+            "specialization": args.specialization,
+            "tech_stack": [tech.strip() for tech in args.tech_stack.split(",") if tech.strip()],
+            "interests": [interest.strip() for interest in args.interests.split(",") if interest.strip()]
+        }
+        stats = write_bulk_connection_messages(args.input, args.output, user_context)
+        print(json.dumps(stats))
+    elif args.command == "build-taxonomy":
+        index = SkillTaxonomy.build(args.source, args.index)
+        print(json.dumps({"skills": len(index), "index": args.index}))
+    elif args.command == "cohort-ingest":
+        analytics = CohortAnalytics.load(args.snapshot) if os.path.exists(args.snapshot) else CohortAnalytics()
+        with open(args.input, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    profile_data = json.loads(line)
+                    analytics.add_profile(profile_data, str(profile_data.get(args.cohort_field, "all")))
+        analytics.save(args.snapshot)
+        print(json.dumps({"profiles": len(analytics), "snapshot": args.snapshot}))
+    elif args.command == "cohort-report":
+        print(json.dumps(CohortAnalytics.load(args.snapshot).summary(args.cohort), indent=2))
+    elif args.command == "message-bench":
+        print(json.dumps(benchmark_message_window(), indent=2))
+    elif args.command == "load-test":
+        report = run_load_test(args.conversations, args.concurrency, args.distribution, args.median, args.spread)
+        if args.compare:
+            with open(args.compare, encoding="utf-8") as f:
+                report["comparison"] = compare_load_reports(json.load(f), report)
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        print(json.dumps(report, indent=2))
+    elif args.command == "template-bench":
+        print(json.dumps(benchmark_activity_templates(args.calls), indent=2))
+    elif args.command == "cold-start":
+        print(json.dumps(measure_cold_start(), indent=2))
+    elif args.command == "single-flight-demo":
+        print(json.dumps(demo_single_flight(args.callers, args.latency), indent=2))
+    elif args.command == "import-exports":
+        print(json.dumps(import_linkedin_exports(args.source, args.output, args.cohort)))
+    elif args.command == "profile-diff-bench":
+        print(json.dumps(benchmark_profile_diffs(), indent=2))
+    elif args.command == "async-bench":
+        print(json.dumps(benchmark_async_overlap(args.turns, args.latency), indent=2))
+    elif args.command == "record-bench":
+        print(json.dumps(benchmark_profile_records(args.profiles, args.seed), indent=2))
+    elif args.command == "worker-bench":
+        report = benchmark_worker_pool(args.workers, threads=args.threads, completion_latency=args.latency)
+        print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()